@@ -1,8 +1,33 @@
-from .schema import CoreConfig, LoggingConfig, NotifierConfig, PluginConfig
+from .schema import (
+    CommandConfig,
+    CoreConfig,
+    DiscoveryConfig,
+    IoPriorityClass,
+    LogFormat,
+    LoggingConfig,
+    MetricsConfig,
+    NotificationConfig,
+    NotifierConfig,
+    PluginConfig,
+    PluginSetupConfig,
+    ProfilingConfig,
+    StateConfig,
+    TracingConfig,
+)
 
 __all__ = [
+    "CommandConfig",
     "CoreConfig",
+    "DiscoveryConfig",
+    "IoPriorityClass",
+    "LogFormat",
     "LoggingConfig",
+    "MetricsConfig",
+    "NotificationConfig",
     "NotifierConfig",
     "PluginConfig",
+    "PluginSetupConfig",
+    "ProfilingConfig",
+    "StateConfig",
+    "TracingConfig",
 ]
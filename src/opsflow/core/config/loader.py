@@ -1,50 +1,466 @@
+import contextlib
+import glob
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from collections.abc import Mapping
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any
+
+import pydantic
 import yaml
 
+from ... import __version__
+from ..models.trace import Trace
 from ..notifier import NotifierRegistry
 from ..plugin import PluginRegistry
 from ..registry.entry import RegistryEntry
+from . import schema
 from .schema import CoreConfig
 
+# libyaml-based loader if PyYAML was built with it
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:  # pragma: no cover - optional dependency
+    _YamlLoader = yaml.SafeLoader
+
+# Top-level key listing the fragments merged into a configuration file
+INCLUDE_KEY = "include"
+# Prefix of environment variables overriding configuration values
+ENV_PREFIX = "OPSFLOW_"
+
 
 class ConfigLoader:
     """Load and validate the application configuration from YAML.
 
     Parses the YAML file, validates the CoreConfig, and creates configuration
     objects for plugins and notifiers using their registries.
+
+    A file may list further files or glob patterns (e.g. `conf.d/*.yaml`)
+    under `include`, relative to its own directory. Fragments are merged in
+    the listed order, glob matches sorted by path, on top of the including
+    file: mappings are merged recursively, lists are concatenated and other
+    values replaced. A file that is included several times, e.g. by two
+    fragments, is merged once, where it is first included. With an
+    environment prefix, variables such as
+    `OPSFLOW_PLUGINS__RCLONE__MAX_WORKERS=8` are applied last and replace
+    the value at the path given by their `__`-separated name.
+
+    With a cache directory, every fragment is kept parsed as long as its
+    mtime and size are unchanged, and the validated configuration is reused
+    as long as the merged content, the registered plugins and notifiers
+    (including their source files) and the OpsFlow version are unchanged.
+    The cache directory must only be writable by the user running OpsFlow,
+    since cached data is unpickled.
     """
 
     @staticmethod
-    def load(path: str) -> CoreConfig:
-        """Load and validate the CoreConfig from a YAML file.
+    def load(
+        path: str,
+        trace: Trace | None = None,
+        cache_dir: str | None = None,
+        env_prefix: str | None = None,
+    ) -> CoreConfig:
+        """Load and validate the CoreConfig from a YAML file and its fragments.
 
         Args:
             path (str): Path to the YAML configuration file.
+            trace (Optional[Trace]): Trace recording parsing and validation as
+                the phases "config_load:parse" and "config_load:validate", and
+                the cache lookup as "config_load:cache".
+            cache_dir (Optional[str]): Directory of the fragment and validated
+                configuration caches. Caching is disabled if None.
+            env_prefix (Optional[str]): Prefix of environment variables
+                overriding configuration values, e.g. `ENV_PREFIX`. Disabled
+                if None.
 
         Returns:
             CoreConfig: Validated CoreConfig including plugin and notifier
                 configuration objects.
 
         Raises:
-            OSError: If the configuration file cannot be read.
+            OSError: If a configuration file or included file cannot be read.
+            TypeError: If a file or an environment override does not fit the
+                structure of the configuration.
             ValidationError: If the YAML content is invalid.
+            ValueError: If an unknown plugin or notifier is referenced, a
+                fragment is malformed or files include each other.
+        """
+        raw = ConfigLoader.read(path, trace=trace, cache_dir=cache_dir, env_prefix=env_prefix)
+        return ConfigLoader.validate(raw, path, trace=trace, cache_dir=cache_dir)
+
+    @staticmethod
+    def read(
+        path: str,
+        trace: Trace | None = None,
+        cache_dir: str | None = None,
+        env_prefix: str | None = None,
+    ) -> dict:
+        """Read a YAML file merged with its fragments and environment overrides.
+
+        The result is not validated; see `validate`. Reading and validating
+        separately allows loading the modules providing the configured
+        plugins and notifiers in between.
+
+        Args:
+            path (str): Path to the YAML configuration file.
+            trace (Optional[Trace]): Trace recording the phase "config_load:parse".
+            cache_dir (Optional[str]): Directory of the fragment cache.
+                Caching is disabled if None.
+            env_prefix (Optional[str]): Prefix of environment variables
+                overriding configuration values. Disabled if None.
+
+        Returns:
+            dict: The merged raw configuration.
+
+        Raises:
+            OSError: If a configuration file or included file cannot be read.
+            TypeError: If a file or an environment override does not fit the
+                structure of the configuration.
+            ValueError: If a fragment is malformed or files include each other.
+        """
+        with _phase(trace, "parse"):
+            raw = ConfigLoader._read_layers(Path(path), cache_dir, (), set())
+            if env_prefix:
+                ConfigLoader._apply_env(raw, os.environ, env_prefix)
+        return raw
+
+    @staticmethod
+    def validate(
+        raw: dict,
+        path: str,
+        trace: Trace | None = None,
+        cache_dir: str | None = None,
+    ) -> CoreConfig:
+        """Validate a raw configuration read by `read`.
+
+        Plugin and notifier configurations are validated against the models
+        registered for them, so the components must be registered beforehand.
+
+        Args:
+            raw (dict): Merged raw configuration.
+            path (str): Path to the YAML configuration file, identifying the
+                cached configuration.
+            trace (Optional[Trace]): Trace recording the phases
+                "config_load:cache" and "config_load:validate".
+            cache_dir (Optional[str]): Directory of the validated configuration
+                cache. Caching is disabled if None.
+
+        Returns:
+            CoreConfig: Validated CoreConfig including plugin and notifier
+                configuration objects.
+
+        Raises:
+            ValidationError: If the configuration is invalid.
             ValueError: If an unknown plugin or notifier is referenced.
         """
-        with open(path, encoding="utf-8") as f:
-            raw = yaml.safe_load(f)
+        cache_file = key = None
+        if cache_dir:
+            with _phase(trace, "cache"):
+                cache_file = ConfigLoader._cache_file(cache_dir, path)
+                key = ConfigLoader._cache_key(raw)
+                cached = ConfigLoader._read_cache(cache_file, key)
+            if cached is not None:
+                return cached
 
-        # Validate top-level CoreConfig
-        core = CoreConfig.model_validate(raw)
+        with _phase(trace, "validate"):
+            # Validate top-level CoreConfig
+            core = CoreConfig.model_validate(raw)
 
-        # Load plugins and notifiers using the same helper method
-        core.plugins = ConfigLoader._load_entries(
-            raw.get("plugins"), PluginRegistry.entries
-        )
-        core.notifiers = ConfigLoader._load_entries(
-            raw.get("notifiers"), NotifierRegistry.entries
+            # Load plugins and notifiers using the same helper method
+            core.plugins = ConfigLoader._load_entries(
+                raw.get("plugins"), PluginRegistry.entries
+            )
+            core.notifiers = ConfigLoader._load_entries(
+                raw.get("notifiers"), NotifierRegistry.entries
+            )
+
+        if cache_file:
+            ConfigLoader._write_cache(cache_file, key, core)
+        return core
+
+    @staticmethod
+    def _read_layers(
+        path: Path, cache_dir: str | None, including: tuple[Path, ...], merged: set[Path]
+    ) -> dict:
+        """Read a configuration file merged with the fragments it includes.
+
+        Args:
+            path (Path): Path to the configuration file.
+            cache_dir (Optional[str]): Directory of the fragment cache.
+            including (tuple[Path, ...]): Files that include this file, used
+                to detect include cycles.
+            merged (set[Path]): Resolved paths of the files read so far; a file
+                read before contributes nothing.
+
+        Returns:
+            dict: The merged raw configuration.
+
+        Raises:
+            OSError: If a file cannot be read.
+            TypeError: If a fragment is not a mapping.
+            ValueError: If a fragment is malformed or files include each other.
+        """
+        path = path.resolve()
+        if path in including:
+            raise ValueError(f"Circular include of {path}")
+        if path in merged:
+            return {}
+        merged.add(path)
+
+        data = ConfigLoader._read_fragment(path, cache_dir)
+        includes = data.pop(INCLUDE_KEY, None) or []
+        if isinstance(includes, str):
+            includes = [includes]
+
+        for pattern in includes:
+            target = os.path.join(path.parent, os.path.expanduser(pattern))
+            if any(c in pattern for c in "*?["):
+                files = sorted(glob.glob(target))
+            else:
+                files = [target]
+            for file in files:
+                fragment = ConfigLoader._read_layers(
+                    Path(file), cache_dir, (*including, path), merged
+                )
+                _merge(data, fragment)
+        return data
+
+    @staticmethod
+    def _read_fragment(path: Path, cache_dir: str | None) -> dict:
+        """Parse a single configuration file.
+
+        With a cache directory, the parsed content is reused while the file's
+        mtime, size and inode are unchanged.
+
+        Args:
+            path (Path): Resolved path to the file.
+            cache_dir (Optional[str]): Directory of the fragment cache.
+
+        Returns:
+            dict: The raw content of the file, including its `include` key.
+
+        Raises:
+            OSError: If the file cannot be read.
+            TypeError: If the content is not a mapping.
+            ValueError: If the content contains unknown sections or a
+                malformed `include`.
+        """
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cache_file = None
+        if cache_dir:
+            name = hashlib.sha256(str(path).encode()).hexdigest()[:16]
+            cache_file = Path(cache_dir) / "fragments" / f"{name}.pickle"
+            cached = ConfigLoader._read_pickle(cache_file)
+            if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == stamp:
+                return cached[1]
+
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+        data = ConfigLoader._check_fragment(path, data)
+
+        if cache_file:
+            ConfigLoader._write_pickle(cache_file, (stamp, data))
+        return data
+
+    @staticmethod
+    def _check_fragment(path: Path, data: Any) -> dict:
+        """Validate the structure of a parsed configuration file on its own.
+
+        Fragments are partial configurations, so only their structure is
+        checked here; the values are validated after merging.
+
+        Args:
+            path (Path): Path to the file, used in error messages.
+            data (Any): Parsed content of the file.
+
+        Returns:
+            dict: The content; an empty file yields an empty mapping.
+
+        Raises:
+            TypeError: If the content is not a mapping.
+            ValueError: If the content contains unknown sections or a
+                malformed `include`.
+        """
+        if data is None:
+            return {}
+        if not isinstance(data, dict):
+            raise TypeError(f"{path}: configuration must be a mapping")
+
+        unknown = sorted(
+            str(k) for k in data if k != INCLUDE_KEY and k not in CoreConfig.model_fields
         )
+        if unknown:
+            raise ValueError(f"{path}: unknown configuration section(s): {', '.join(unknown)}")
+
+        includes = data.get(INCLUDE_KEY)
+        if includes is not None and not (
+            isinstance(includes, str)
+            or (isinstance(includes, list) and all(isinstance(i, str) for i in includes))
+        ):
+            raise ValueError(f"{path}: '{INCLUDE_KEY}' must be a path or a list of paths")
+        return data
+
+    @staticmethod
+    def _apply_env(raw: dict, environ: Mapping[str, str], prefix: str) -> None:
+        """Override configuration values with environment variables.
+
+        The variable name after the prefix is the lowercase, `__`-separated
+        path of the value (e.g. `OPSFLOW_LOGGING__DEBUG`). Values are parsed
+        as YAML, so `true`, `8` or `[a, b]` keep their types. Variables not
+        naming a configuration section are ignored.
+
+        Args:
+            raw (dict): Raw configuration, updated in place.
+            environ (Mapping[str, str]): Environment variables.
+            prefix (str): Prefix of the relevant variables.
+
+        Raises:
+            TypeError: If a variable descends into a value that is not a mapping.
+        """
+        for name in sorted(environ):
+            if not name.startswith(prefix):
+                continue
+            keys = name[len(prefix) :].lower().split("__")
+            if keys[0] not in CoreConfig.model_fields or not all(keys):
+                continue
+
+            try:
+                value = yaml.load(environ[name], Loader=_YamlLoader)
+            except yaml.YAMLError:
+                value = environ[name]
+
+            target = raw
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+                if not isinstance(target, dict):
+                    raise TypeError(f"{name}: '{key}' is not a configuration section")
+            target[keys[-1]] = value
+
+    @staticmethod
+    def _cache_file(cache_dir: str, path: str) -> Path:
+        """Determine the cache file of a configuration file.
+
+        Args:
+            cache_dir (str): Cache directory.
+            path (str): Path to the configuration file.
+
+        Returns:
+            Path: The cache file.
+        """
+        name = hashlib.sha256(str(Path(path).resolve()).encode()).hexdigest()[:16]
+        return Path(cache_dir) / f"config-{name}.pickle"
+
+    @staticmethod
+    def _cache_key(raw: dict) -> str:
+        """Compute the key under which a validated configuration is cached.
+
+        Args:
+            raw (dict): Merged raw configuration.
+
+        Returns:
+            str: Digest of the content, the registries and the schema versions.
+        """
+        digest = hashlib.sha256(json.dumps(raw, sort_keys=True, default=repr).encode())
+        schema_file = Path(schema.__file__)
+        stat = schema_file.stat()
+        for part in (
+            __version__,
+            pydantic.VERSION,
+            f"{schema_file}|{stat.st_mtime_ns}|{stat.st_size}",
+            PluginRegistry.fingerprint(),
+            NotifierRegistry.fingerprint(),
+        ):
+            digest.update(f"\0{part}".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read_cache(cache_file: Path, key: str) -> CoreConfig | None:
+        """Read a validated configuration from the cache.
 
+        Args:
+            cache_file (Path): Cache file.
+            key (str): Expected cache key.
+
+        Returns:
+            Optional[CoreConfig]: The cached configuration, or None if the cache
+                is missing, stale or unreadable.
+        """
+        cached = ConfigLoader._read_pickle(cache_file)
+        if not isinstance(cached, tuple) or len(cached) != 2:
+            return None
+        cached_key, core = cached
+        if cached_key != key or not isinstance(core, CoreConfig):
+            return None
         return core
 
+    @staticmethod
+    def _write_cache(cache_file: Path, key: str, core: CoreConfig) -> None:
+        """Write a validated configuration to the cache.
+
+        Args:
+            cache_file (Path): Cache file.
+            key (str): Cache key.
+            core (CoreConfig): Validated configuration.
+        """
+        ConfigLoader._write_pickle(cache_file, (key, core))
+
+    @staticmethod
+    def _read_pickle(cache_file: Path) -> Any:
+        """Read a pickled cache entry.
+
+        Args:
+            cache_file (Path): Cache file.
+
+        Returns:
+            Any: The cached object, or None if the file is missing or unreadable.
+        """
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            ImportError,
+            AttributeError,
+            TypeError,
+            ValueError,
+        ):
+            # Corrupt or incompatible cache; it is replaced by the caller
+            return None
+
+    @staticmethod
+    def _write_pickle(cache_file: Path, obj: Any) -> None:
+        """Atomically write a pickled cache entry.
+
+        Unwritable cache directories and objects that cannot be pickled are
+        ignored.
+
+        Args:
+            cache_file (Path): Cache file.
+            obj (Any): Object to cache.
+        """
+        try:
+            data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+            cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_file.parent, prefix=f".{cache_file.name}.")
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, cache_file)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+
     @staticmethod
     def _load_entries(
         entry_data: dict | None, entries: dict[str, RegistryEntry]
@@ -79,3 +495,36 @@ class ConfigLoader:
             result[name] = config_cls.model_validate(raw_cfg)
 
         return result
+
+
+def _phase(trace: Trace | None, name: str):
+    """Return a context manager recording a loading phase.
+
+    Args:
+        trace (Optional[Trace]): Trace recording the phase, or None.
+        name (str): Name of the phase below "config_load".
+
+    Returns:
+        ContextManager: The span of the phase, or a no-op if `trace` is None.
+    """
+    return trace.span(f"config_load:{name}", "phase") if trace else nullcontext()
+
+
+def _merge(base: dict, overlay: dict) -> None:
+    """Merge a configuration fragment into another one.
+
+    Mappings are merged recursively, lists are concatenated and all other
+    values of `overlay` replace those of `base`.
+
+    Args:
+        base (dict): Configuration updated in place.
+        overlay (dict): Fragment merged on top of `base`.
+    """
+    for key, value in overlay.items():
+        current = base.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _merge(current, value)
+        elif isinstance(current, list) and isinstance(value, list):
+            current.extend(value)
+        else:
+            base[key] = value
@@ -1,3 +1,5 @@
+from enum import Enum
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -6,11 +8,14 @@ class PluginConfig(BaseModel):
 
     Attributes:
         enabled (bool): Whether the plugin is active. Defaults to True.
+        depends_on (List[str]): Names of plugins that must finish successfully
+            before this plugin is started. Defaults to an empty list.
     """
 
     model_config = ConfigDict(validate_assignment=True)
 
     enabled: bool = True
+    depends_on: list[str] = Field(default_factory=list)
 
 
 class NotifierConfig(BaseModel):
@@ -18,11 +23,21 @@ class NotifierConfig(BaseModel):
 
     Attributes:
         enabled (bool): Whether the notifier is active. Defaults to False.
+        timeout (Optional[float]): Maximum time in seconds to wait for the
+            notifier to deliver a report. Unbounded if None.
     """
 
     model_config = ConfigDict(validate_assignment=True)
 
     enabled: bool = False
+    timeout: float | None = Field(default=None, gt=0)
+
+
+class LogFormat(str, Enum):
+    """Output format of the log file and console."""
+
+    TEXT = "text"
+    JSON = "json"
 
 
 class LoggingConfig(BaseModel):
@@ -31,10 +46,189 @@ class LoggingConfig(BaseModel):
     Attributes:
         file (str): Path to the log file. Defaults to "/var/log/workflow.log".
         debug (bool): Enable debug-level logging. Defaults to False.
+        memory_max_records (int): Maximum number of DEBUG/INFO records kept for
+            the report. WARNING and above are always kept. Defaults to 1000.
+        memory_max_bytes (int): Maximum approximate size of the DEBUG/INFO
+            messages kept for the report. Defaults to 1 MiB.
+        queue (bool): Hand records to a background thread for formatting and
+            I/O instead of writing them in the logging thread. Defaults to False.
+        format (LogFormat): Format of the log file and console output. The log
+            excerpt in the report is always text. Defaults to text.
     """
 
     file: str = "/var/log/workflow.log"
     debug: bool = False
+    memory_max_records: int = Field(default=1000, ge=0)
+    memory_max_bytes: int = Field(default=1024 * 1024, ge=0)
+    queue: bool = False
+    format: LogFormat = LogFormat.TEXT
+
+
+class IoPriorityClass(str, Enum):
+    """I/O scheduling class applied to commands via `ionice`."""
+
+    REALTIME = "realtime"
+    BEST_EFFORT = "best-effort"
+    IDLE = "idle"
+
+
+class CommandConfig(BaseModel):
+    """Configuration for command execution via the CommandRunner.
+
+    Attributes:
+        max_concurrency (int): Maximum number of commands executed concurrently
+            by the async command runner. Defaults to 8.
+        stream_output (bool): Forward command output line by line while the
+            command is running instead of logging it once it finished.
+            Defaults to False.
+        output_tail_bytes (int): Number of trailing output bytes per stream kept
+            for results when streaming. Defaults to 64 KiB.
+        timeout (Optional[float]): Default maximum runtime of a command in seconds.
+            Defaults to None (no timeout).
+        kill_grace_period (float): Seconds between SIGTERM and SIGKILL when a
+            timed out command is terminated. Defaults to 5.
+        nice (Optional[int]): Niceness adjustment applied to commands. Negative
+            values require OpsFlow itself to run as root, since the `nice`
+            prefix runs before `sudo`.
+        ionice_class (Optional[IoPriorityClass]): I/O scheduling class of commands.
+        ionice_level (Optional[int]): I/O priority within the class (0-7).
+        cpu_time_limit (Optional[int]): CPU time limit in seconds (RLIMIT_CPU).
+        memory_limit (Optional[int]): Address space limit in bytes (RLIMIT_AS).
+    """
+
+    max_concurrency: int = Field(default=8, ge=1)
+    stream_output: bool = False
+    output_tail_bytes: int = Field(default=64 * 1024, ge=0)
+    timeout: float | None = Field(default=None, gt=0)
+    kill_grace_period: float = Field(default=5.0, ge=0)
+    nice: int | None = Field(default=None, ge=-20, le=19)
+    ionice_class: IoPriorityClass | None = None
+    ionice_level: int | None = Field(default=None, ge=0, le=7)
+    cpu_time_limit: int | None = Field(default=None, gt=0)
+    memory_limit: int | None = Field(default=None, gt=0)
+
+
+class StateConfig(BaseModel):
+    """Configuration of the persistent run-state store.
+
+    Attributes:
+        enabled (bool): Record runs and steps in the state store. Defaults to False.
+        path (str): Path to the SQLite state database.
+            Defaults to "/var/lib/opsflow/state.db".
+        resume (bool): Skip steps that already completed in an interrupted
+            previous run. Defaults to True.
+        skip_unchanged (bool): Skip incremental plugins whose inputs have not
+            changed since their last successful run. Defaults to False.
+    """
+
+    enabled: bool = False
+    path: str = "/var/lib/opsflow/state.db"
+    resume: bool = True
+    skip_unchanged: bool = False
+
+
+class TracingConfig(BaseModel):
+    """Configuration of the span export of workflow runs.
+
+    Attributes:
+        otlp_file (Optional[str]): File to which the spans of every run are
+            appended as one OTLP/JSON line. Disabled if None.
+        service_name (str): Value of the `service.name` resource attribute.
+            Defaults to "opsflow".
+    """
+
+    otlp_file: str | None = None
+    service_name: str = "opsflow"
+
+
+class MetricsConfig(BaseModel):
+    """Configuration of the metrics export of workflow runs.
+
+    Attributes:
+        textfile (Optional[str]): File to which the metrics of every run are
+            written for the node exporter textfile collector. Disabled if None.
+    """
+
+    textfile: str | None = None
+
+
+class NotificationConfig(BaseModel):
+    """Configuration of the report delivery to all notifiers.
+
+    Attributes:
+        deadline (Optional[float]): Maximum time in seconds to wait for all
+            notifiers together. Unbounded if None.
+        spool_dir (Optional[str]): Outbox directory in which reports are kept
+            until every notifier delivered them. Disabled if None.
+        retry_backoff (float): Seconds before the first retry of a failed
+            delivery; doubled after every further failure. Defaults to 60.
+        max_retry_backoff (float): Upper bound of the retry delay in seconds.
+            Defaults to 6 hours.
+        max_attempts (int): Failed attempts after which a report is discarded.
+            Defaults to 10.
+        batch (bool): Deliver all pending reports of a notifier as one message.
+            Defaults to False.
+    """
+
+    deadline: float | None = Field(default=None, gt=0)
+    spool_dir: str | None = None
+    retry_backoff: float = Field(default=60.0, ge=0)
+    max_retry_backoff: float = Field(default=6 * 3600.0, ge=0)
+    max_attempts: int = Field(default=10, ge=1)
+    batch: bool = False
+
+
+class DiscoveryConfig(BaseModel):
+    """Configuration of how plugin and notifier modules are discovered.
+
+    Attributes:
+        lazy (bool): Only import the modules of plugin and notifier directories
+            that provide components enabled in the configuration. Defaults to False.
+        manifest_dir (Optional[str]): Directory for the manifest caches of the
+            plugin and notifier directories. Defaults to the directories themselves.
+        entry_points (bool): Load components published by installed packages in
+            the `opsflow.plugins` and `opsflow.notifiers` entry point groups.
+            Defaults to False.
+    """
+
+    lazy: bool = False
+    manifest_dir: str | None = None
+    entry_points: bool = False
+
+
+class PluginSetupConfig(BaseModel):
+    """Configuration of how plugins are constructed and set up.
+
+    Attributes:
+        concurrent (bool): Construct all enabled plugins concurrently and run
+            their `setup()` in a separate phase before any plugin runs, so slow
+            setups overlap. Async plugins are only set up in that phase in
+            async runs, where they share one event loop. Defaults to False.
+        max_workers (int): Maximum number of plugins constructed or set up at
+            the same time. Defaults to 4.
+    """
+
+    concurrent: bool = False
+    max_workers: int = Field(default=4, ge=1)
+
+
+class ProfilingConfig(BaseModel):
+    """Configuration of the startup profile of the workflow.
+
+    Attributes:
+        enabled (bool): Record the duration of every initialization phase and
+            module import. Imports made while the configuration is loaded are
+            only included when profiling is requested via the `Workflow`
+            argument or `--profile-startup`. Defaults to False.
+        report_file (Optional[str]): Path of a JSON file receiving the profile.
+        budgets (dict[str, float]): Maximum seconds for "total", a phase
+            (e.g. "config_load:parse") or a module import ("import:<module>").
+            Every exceeded budget is reported as a warning.
+    """
+
+    enabled: bool = False
+    report_file: str | None = None
+    budgets: dict[str, float] = Field(default_factory=dict)
 
 
 class CoreConfig(BaseModel):
@@ -43,6 +237,14 @@ class CoreConfig(BaseModel):
     Attributes:
         dry_run: If True, commands will not be executed.
         logging (LoggingConfig): Logging configuration.
+        commands (CommandConfig): Command execution configuration.
+        state (StateConfig): Run-state store configuration.
+        tracing (TracingConfig): Span export configuration.
+        metrics (MetricsConfig): Metrics export configuration.
+        notification (NotificationConfig): Report delivery configuration.
+        discovery (DiscoveryConfig): Plugin and notifier discovery configuration.
+        profiling (ProfilingConfig): Startup profiling configuration.
+        plugin_setup (PluginSetupConfig): Plugin construction and setup configuration.
         notifiers (Optional[Dict[str, NotifierConfig]]): Mapping of notifier names to configurations.
         plugins (Optional[Dict[str, PluginConfig]]): Mapping of plugin names to configurations.
     """
@@ -54,5 +256,13 @@ class CoreConfig(BaseModel):
 
     dry_run: bool = False
     logging: LoggingConfig = LoggingConfig()
+    commands: CommandConfig = CommandConfig()
+    state: StateConfig = StateConfig()
+    tracing: TracingConfig = TracingConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    notification: NotificationConfig = NotificationConfig()
+    discovery: DiscoveryConfig = DiscoveryConfig()
+    profiling: ProfilingConfig = ProfilingConfig()
+    plugin_setup: PluginSetupConfig = PluginSetupConfig()
     notifiers: dict[str, NotifierConfig] = Field(default_factory=dict)
     plugins: dict[str, PluginConfig] = Field(default_factory=dict)
@@ -1,5 +1,7 @@
+import contextvars
 import logging
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Generic, TypeVar
 
 from ..models.context import Context
@@ -32,13 +34,39 @@ class Factory(Generic[_C]):
         self._registry = registry
         self._ctx = ctx
 
-    def create_all(self) -> Generator[_C, None, None]:
+    def create_all(self, max_workers: int = 1) -> Generator[_C, None, None]:
         """
         Instantiate all registered components that are enabled.
 
+        Args:
+            max_workers (int): Maximum number of components constructed
+                concurrently. Components are yielded in registration order.
+
         Returns:
             Generator[_C]: Generator yielding component instances.
         """
+        enabled = list(self._enabled())
+        if max_workers <= 1 or len(enabled) <= 1:
+            for cls, name, cfg in enabled:
+                yield self._create(cls, name, cfg)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="factory") as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._create, cls, name, cfg)
+                for cls, name, cfg in enabled
+            ]
+            for future in futures:
+                yield future.result()
+
+    def _enabled(self) -> Generator[tuple[type, str, Any], None, None]:
+        """
+        Determine the registered components that are enabled.
+
+        Returns:
+            Generator[tuple[type, str, Any]]: Class, name and configuration of
+                every enabled component.
+        """
         for entry in self._registry.entries.values():
             cls = entry.component_cls
             name = getattr(cls, "name", cls.__name__)
@@ -46,9 +74,21 @@ class Factory(Generic[_C]):
 
             if not cfg or not getattr(cfg, "enabled", False):
                 continue
+            yield cls, name, cfg
+
+    def _create(self, cls: type, name: str, cfg: Any) -> _C:
+        """
+        Instantiate a single component.
 
-            child_logger = self._logger.getChild(name)
-            if self._ctx:
-                yield cls(cfg, child_logger, self._ctx)
-            else:
-                yield cls(cfg, child_logger)
+        Args:
+            cls (type): Component class.
+            name (str): Component name.
+            cfg (Any): Component configuration.
+
+        Returns:
+            _C: The component instance.
+        """
+        child_logger = self._logger.getChild(name)
+        if self._ctx:
+            return cls(cfg, child_logger, self._ctx)
+        return cls(cfg, child_logger)
@@ -1,6 +1,13 @@
-from .result import Result, Severity
+from .metrics import MetricSample, MetricsCollector
+from .result import Result, ResultCollector, Severity
+from .trace import Span, Trace
 
 __all__ = [
+    "MetricSample",
+    "MetricsCollector",
     "Result",
+    "ResultCollector",
     "Severity",
+    "Span",
+    "Trace",
 ]
@@ -1,5 +1,13 @@
+import threading
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from ..utils.command_runner import CommandRunner
+from .metrics import MetricsCollector
 from .result import Result, ResultCollector
+from .trace import Trace
 
 
 class Context:
@@ -8,34 +16,100 @@ class Context:
     Contains only lightweight, globally relevant services.
     """
 
-    def __init__(self, result_collector: ResultCollector, dry_run: bool):
+    def __init__(
+        self,
+        result_collector: ResultCollector,
+        dry_run: bool,
+        trace: Trace | None = None,
+        metrics: MetricsCollector | None = None,
+    ):
         self._result_collector = result_collector
         self.dry_run = dry_run
         self.cmd = CommandRunner
+        self.trace = trace or Trace()
+        self.metrics = metrics or MetricsCollector()
+        self._buffer: ContextVar[list[Result] | None] = ContextVar(
+            f"result_buffer_{id(self)}", default=None
+        )
+        self._open: deque[list[Result]] = deque()
+        self._closed: set[int] = set()
+        self._lock = threading.Lock()
 
     def add_result(self, result: Result | None) -> None:
         """
         Adds a result to the context's result collector.
 
+        Inside `buffered_results()`, the result is appended to the buffer of
+        the current component instead.
+
         Args:
             result (Optional[Result]): The result to add.
         """
-        self._result_collector.add(result)
+        buffer = self._buffer.get()
+        if buffer is None:
+            self._result_collector.add(result)
+        elif result:
+            buffer.append(result)
 
     def add_results(self, results: list[Result]) -> None:
         """
         Adds multiple results to the context's result collector.
 
+        Inside `buffered_results()`, the results are appended to the buffer of
+        the current component instead.
+
         Args:
             results (List[Result]): The list of results to add.
         """
-        self._result_collector.add_all(results)
+        buffer = self._buffer.get()
+        if buffer is None:
+            self._result_collector.add_all(results)
+        else:
+            buffer.extend(results)
 
     def all_results(self) -> list[Result]:
         """
         Retrieves all results from the context's result collector.
 
+        Includes the buffered results of the current component and of finished
+        components that are waiting to be merged.
+
         Returns:
             List[Result]: List of all collected results.
         """
-        return self._result_collector.all_results()
+        buffer = self._buffer.get()
+        with self._lock:
+            results = self._result_collector.all_results()
+            results += [r for b in self._open if id(b) in self._closed for r in b]
+        return results if buffer is None else results + list(buffer)
+
+    @contextmanager
+    def buffered_results(self) -> Iterator[None]:
+        """Buffers the results added within the block and merges them at its end.
+
+        The buffer belongs to the current thread or task (and the tasks it
+        spawns), so concurrently running components append without contending
+        on the collector lock. Each buffer is merged as one block in insertion
+        order. Blocks are merged in the order they were opened: a block that
+        ends early waits for the blocks opened before it, so the report lists
+        components in the order they were scheduled.
+
+        Yields:
+            None
+        """
+        buffer: list[Result] = []
+        with self._lock:
+            self._open.append(buffer)
+        token = self._buffer.set(buffer)
+        try:
+            yield
+        finally:
+            self._buffer.reset(token)
+            with self._lock:
+                self._closed.add(id(buffer))
+                ready: list[Result] = []
+                while self._open and id(self._open[0]) in self._closed:
+                    block = self._open.popleft()
+                    self._closed.discard(id(block))
+                    ready.extend(block)
+                self._result_collector.add_all(ready)
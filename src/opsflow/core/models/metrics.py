@@ -0,0 +1,74 @@
+import threading
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MetricSample:
+    """Current value of a single metric series.
+
+    Args:
+        name (str): Metric name (e.g. "opsflow_rclone_transferred_bytes").
+        labels (tuple[tuple[str, str], ...]): Sorted label names and values.
+        value (float): Current value of the series.
+        help (str): Description of the metric.
+    """
+
+    name: str
+    labels: tuple[tuple[str, str], ...]
+    value: float
+    help: str = ""
+
+
+class MetricsCollector:
+    """Collects numeric metrics reported by workflow components.
+
+    Metrics describe the current workflow run; a series is identified by its
+    name and labels. The collector is safe to use from multiple threads.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty MetricsCollector."""
+        self._samples: dict[tuple[str, tuple[tuple[str, str], ...]], MetricSample] = {}
+        self._lock = threading.Lock()
+
+    def set(self, name: str, value: float, help: str = "", **labels: str) -> None:
+        """Sets the value of a metric series.
+
+        Args:
+            name (str): Metric name.
+            value (float): New value.
+            help (str): Description of the metric.
+            **labels (str): Label names and values of the series.
+        """
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            self._samples[key] = MetricSample(key[0], key[1], float(value), help)
+
+    def add(self, name: str, value: float = 1.0, help: str = "", **labels: str) -> None:
+        """Adds a value to a metric series, starting from 0.
+
+        Args:
+            name (str): Metric name.
+            value (float): Value to add.
+            help (str): Description of the metric.
+            **labels (str): Label names and values of the series.
+        """
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            current = self._samples.get(key)
+            total = (current.value if current else 0.0) + float(value)
+            self._samples[key] = MetricSample(key[0], key[1], total, help)
+
+    def clear(self) -> None:
+        """Removes all metric series."""
+        with self._lock:
+            self._samples.clear()
+
+    def samples(self) -> list[MetricSample]:
+        """Retrieves all metric series ordered by name and labels.
+
+        Returns:
+            List[MetricSample]: The current value of every series.
+        """
+        with self._lock:
+            return [self._samples[key] for key in sorted(self._samples)]
@@ -1,6 +1,9 @@
+import sys
 import threading
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import FrozenInstanceError
 from enum import Enum
+from typing import Any
 
 
 class Severity(Enum):
@@ -11,19 +14,74 @@ class Severity(Enum):
     ERROR = 3
 
 
-@dataclass
 class Result:
     """Represents the result of a single workflow step.
 
+    Results are immutable and slotted to keep plugins that report many results
+    cheap. Step names are interned, and the message may be given as a callable
+    that renders it on first access, so large outputs kept in `details` are only
+    formatted when a report needs them.
+
     Args:
         step (str): Name or description of the step.
         severity (Severity): Severity level of the result.
-        message (str): Human-readable message for the result.
+        message (str | Callable[[], str]): Human-readable message for the
+            result, or a callable rendering it.
+        details (Optional[Mapping[str, Any]]): Structured data of the result,
+            e.g. command output.
     """
 
+    __slots__ = ("_message", "details", "severity", "step")
+
     step: str
     severity: Severity
-    message: str
+    details: Mapping[str, Any] | None
+
+    def __init__(
+        self,
+        step: str,
+        severity: Severity,
+        message: str | Callable[[], str],
+        details: Mapping[str, Any] | None = None,
+    ) -> None:
+        object.__setattr__(self, "step", sys.intern(step))
+        object.__setattr__(self, "severity", severity)
+        object.__setattr__(self, "details", details)
+        object.__setattr__(self, "_message", message)
+
+    @property
+    def message(self) -> str:
+        """Human-readable message, rendered on first access if lazy."""
+        message = self._message
+        if callable(message):
+            message = message()
+            object.__setattr__(self, "_message", message)
+        return message
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Result):
+            return NotImplemented
+        return (self.step, self.severity, self.message, self.details) == (
+            other.step,
+            other.severity,
+            other.message,
+            other.details,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.step, self.severity, self.message))
+
+    def __repr__(self) -> str:
+        return f"Result(step={self.step!r}, severity={self.severity}, message={self.message!r})"
+
+    def __reduce__(self) -> tuple:
+        return (Result, (self.step, self.severity, self.message, self.details))
 
 
 class ResultCollector:
@@ -31,11 +89,18 @@ class ResultCollector:
 
     Supports adding results, computing an aggregate severity,
     and producing summaries for notifications or logs.
+
+    Results are indexed by severity as they are added, so counts and the
+    overall severity are available in constant time. Results are never removed,
+    which allows iterating a consistent prefix of the collection without
+    holding the lock.
     """
 
     def __init__(self):
         """Initializes an empty ResultCollector."""
         self.results: list[Result] = []
+        self._by_severity: dict[Severity, list[Result]] = {s: [] for s in Severity}
+        self._max_severity = Severity.INFO
         self._lock = threading.Lock()
 
     def add(self, result: Result | None) -> None:
@@ -46,7 +111,7 @@ class ResultCollector:
         """
         if result:
             with self._lock:
-                self.results.append(result)
+                self._append(result)
 
     def add_all(self, results: list[Result]) -> None:
         """Adds multiple results to the collection.
@@ -55,7 +120,8 @@ class ResultCollector:
             results (List[Result]): List of Result objects to add.
         """
         with self._lock:
-            self.results.extend(results)
+            for result in results:
+                self._append(result)
 
     def all_results(self) -> list[Result]:
         """
@@ -67,12 +133,64 @@ class ResultCollector:
         with self._lock:
             return list(self.results)
 
+    def iter_results(self, severity: Severity | None = None) -> Iterator[Result]:
+        """Iterates over the results collected so far, in insertion order.
+
+        Results added during the iteration are not included.
+
+        Args:
+            severity (Optional[Severity]): Only yield results of this severity.
+
+        Yields:
+            Result: The collected results.
+        """
+        bucket = self.results if severity is None else self._by_severity[severity]
+        with self._lock:
+            size = len(bucket)
+        for index in range(size):
+            yield bucket[index]
+
+    def count(self, severity: Severity | None = None) -> int:
+        """Counts the collected results.
+
+        Args:
+            severity (Optional[Severity]): Only count results of this severity.
+
+        Returns:
+            int: The number of results.
+        """
+        with self._lock:
+            if severity is None:
+                return len(self.results)
+            return len(self._by_severity[severity])
+
+    def counts(self) -> dict[Severity, int]:
+        """Counts the collected results of every severity.
+
+        Returns:
+            Dict[Severity, int]: The number of results per severity.
+        """
+        with self._lock:
+            return {severity: len(bucket) for severity, bucket in self._by_severity.items()}
+
     def overall_severity(self) -> Severity:
         """Determines the highest severity among all results.
 
         Returns:
             Severity: The highest severity (INFO if no results exist).
         """
-        if not self.results:
-            return Severity.INFO
-        return max((r.severity for r in self.results), key=lambda s: s.value)
+        with self._lock:
+            return self._max_severity
+
+    def _append(self, result: Result) -> None:
+        """Adds a result to the collection and its severity index.
+
+        Must be called with the lock held.
+
+        Args:
+            result (Result): Result object to add.
+        """
+        self.results.append(result)
+        self._by_severity[result.severity].append(result)
+        if result.severity.value > self._max_severity.value:
+            self._max_severity = result.severity
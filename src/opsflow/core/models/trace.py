@@ -0,0 +1,163 @@
+import contextvars
+import itertools
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class Span:
+    """Timing record of a single workflow phase or operation.
+
+    Times are taken from the monotonic clock and are only meaningful relative
+    to other spans of the same trace.
+
+    Args:
+        span_id (int): Identifier of the span, unique within its trace.
+        name (str): Name of the phase or operation (e.g. "plugin:rclone").
+        category (str): Kind of span (e.g. "workflow", "phase", "plugin", "hook").
+        start (float): Monotonic start time in seconds.
+        end (Optional[float]): Monotonic end time, None while the span is open.
+        parent_id (Optional[int]): Identifier of the enclosing span.
+        error (Optional[str]): Error message if the operation failed.
+        attributes (dict[str, Any]): Additional structured information.
+    """
+
+    span_id: int
+    name: str
+    category: str
+    start: float
+    end: float | None = None
+    parent_id: int | None = None
+    error: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float | None:
+        """Duration of the span in seconds, or None while it is open."""
+        if self.end is None:
+            return None
+        return self.end - self.start
+
+
+class Trace:
+    """Thread-safe collection of timing spans for a workflow.
+
+    Spans opened with `span()` are nested automatically: the innermost open
+    span of the current context becomes the parent of a new span. Threads and
+    tasks started with a copy of the current context (see `contextvars`)
+    continue the nesting.
+
+    Attributes:
+        trace_id (str): Random 128-bit identifier of the trace as hex string.
+        origin (float): Offset between the monotonic clock and UNIX time, used
+            to convert span times into wall-clock timestamps.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty trace."""
+        self.trace_id = os.urandom(16).hex()
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._current: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+            f"opsflow_trace_{id(self)}", default=None
+        )
+        self.origin = time.time() - time.monotonic()
+
+    @contextmanager
+    def span(self, name: str, category: str, **attributes: Any) -> Iterator[Span]:
+        """Records the duration of the enclosed block as a span.
+
+        Exceptions propagating out of the block are recorded on the span and
+        re-raised.
+
+        Args:
+            name (str): Name of the phase or operation.
+            category (str): Kind of span.
+            **attributes (Any): Additional structured information.
+
+        Yields:
+            Span: The open span; attributes and `error` may be updated.
+        """
+        parent = self._current.get()
+        with self._lock:
+            span_id = next(self._ids)
+        span = Span(
+            span_id=span_id,
+            name=name,
+            category=category,
+            start=time.monotonic(),
+            parent_id=parent.span_id if parent else None,
+            attributes=dict(attributes),
+        )
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = span.error or str(e) or type(e).__name__
+            raise
+        finally:
+            span.end = time.monotonic()
+            self._current.reset(token)
+            with self._lock:
+                self._spans.append(span)
+
+    def reset(self) -> None:
+        """Discards all finished spans and starts a new trace id.
+
+        Spans that are still open are recorded in the new trace when they finish.
+        """
+        with self._lock:
+            self._spans.clear()
+            self.trace_id = os.urandom(16).hex()
+
+    def current(self) -> Span | None:
+        """Returns the innermost open span of the current context.
+
+        Returns:
+            Optional[Span]: The current span, or None outside of any span.
+        """
+        return self._current.get()
+
+    def spans(self, category: str | None = None) -> list[Span]:
+        """Returns all finished spans ordered by start time.
+
+        Args:
+            category (Optional[str]): Only return spans of this category.
+
+        Returns:
+            List[Span]: The matching spans.
+        """
+        with self._lock:
+            spans = list(self._spans)
+        if category is not None:
+            spans = [s for s in spans if s.category == category]
+        return sorted(spans, key=lambda s: s.start)
+
+    def find(self, name: str) -> Span | None:
+        """Returns the first finished span with the given name.
+
+        Args:
+            name (str): Name of the span.
+
+        Returns:
+            Optional[Span]: The span, or None if no such span was recorded.
+        """
+        return next((s for s in self.spans() if s.name == name), None)
+
+    def children(self, span: Span | None) -> list[Span]:
+        """Returns the finished direct children of a span.
+
+        Args:
+            span (Optional[Span]): The parent span, or None for top-level spans.
+
+        Returns:
+            List[Span]: Child spans ordered by start time.
+        """
+        parent_id = span.span_id if span else None
+        return [s for s in self.spans() if s.parent_id == parent_id]
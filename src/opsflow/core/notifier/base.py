@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
@@ -32,3 +33,23 @@ class Notifier(ABC, Generic[_C]):
             subject (str): Subject of the notification.
             message (str): Body/content of the notification.
         """
+
+    async def notify_async(self, subject: str, message: str) -> None:
+        """
+        Send a notification from an event loop.
+
+        Runs `notify()` in a worker thread by default; notifiers with a native
+        asyncio client override this method.
+
+        Args:
+            subject (str): Subject of the notification.
+            message (str): Body/content of the notification.
+        """
+        await asyncio.to_thread(self.notify, subject, message)
+
+    def close(self) -> None:
+        """
+        Release resources held between notifications, e.g. open connections.
+
+        Called once at the end of a workflow run; does nothing by default.
+        """
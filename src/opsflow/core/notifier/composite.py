@@ -1,27 +1,250 @@
+import asyncio
+import contextvars
+import hashlib
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+
+from pydantic import BaseModel
+
+from ..models.result import Result, Severity
 from .base import Notifier
+from .outbox import NotificationOutbox
 
 
 class CompositeNotifier:
-    """Notifier that sends notifications to multiple backends."""
+    """Notifier that sends notifications to multiple backends.
+
+    Backends are notified concurrently, so a slow backend does not delay the
+    others. Each backend is bounded by the `timeout` of its configuration and
+    all of them together by an overall deadline. Failures are isolated: they
+    are returned as results instead of aborting the remaining backends.
+
+    `notify()` runs every backend in a daemon thread, so a backend that hangs
+    past its timeout delays neither the caller nor the exit of the process.
+    `notify_async()` runs blocking backends in the event loop's default
+    executor, whose shutdown at the end of `asyncio.run()` still waits for them.
 
-    def __init__(self):
-        """Initializes an empty composite notifier."""
+    With an outbox, reports are spooled to disk first and every backend delivers
+    its pending reports from there, so reports that failed in earlier runs are
+    retried.
+    """
+
+    def __init__(self, deadline: float | None = None, outbox: NotificationOutbox | None = None):
+        """Initializes an empty composite notifier.
+
+        Args:
+            deadline (Optional[float]): Maximum time in seconds to wait for all
+                backends. Unbounded if None.
+            outbox (Optional[NotificationOutbox]): Spool for undelivered reports.
+        """
         self._notifiers: list[Notifier] = []
+        self.deadline = deadline
+        self.outbox = outbox
 
     def add_notifier(self, notifier: Notifier) -> None:
         """Registers a notifier backend.
 
+        A backend of the same type and configuration as an already registered
+        one is ignored, so a report is never delivered twice to the same target.
+
         Args:
             notifier (Notifier): The notifier to add.
         """
+        for existing in self._notifiers:
+            if type(existing) is type(notifier) and existing.config == notifier.config:
+                notifier.logger.debug("Ignoring duplicate notifier: %s", type(notifier).__name__)
+                return
         self._notifiers.append(notifier)
 
-    def notify(self, subject: str, message: str) -> None:
+    def notify(self, subject: str, message: str) -> list[Result]:
         """Sends a notification to all registered notifiers.
 
         Args:
             subject (str): Notification subject.
             message (str): Notification body.
+
+        Returns:
+            List[Result]: One ERROR result per backend that failed or timed out.
         """
+        if not self._notifiers:
+            return []
+
+        if self.outbox is not None:
+            queues = [self._queue(n) for n in self._notifiers]
+            for queue in queues:
+                self.outbox.enqueue(queue, subject, message)
+            tasks = [(self._deliver_spooled, (n, q)) for n, q in zip(self._notifiers, queues)]
+        else:
+            tasks = [(n.notify, (subject, message)) for n in self._notifiers]
+
+        start = time.monotonic()
+        futures: list[tuple[Notifier, Future]] = [
+            (notifier, self._spawn(notifier, task, args))
+            for notifier, (task, args) in zip(self._notifiers, tasks)
+        ]
+        results = []
+        for notifier, future in futures:
+            limit = self._limit(notifier)
+            remaining = None if limit is None else max(0.0, start + limit - time.monotonic())
+            try:
+                future.result(timeout=remaining)
+            except FutureTimeoutError:
+                results.append(self._failure(notifier, f"Notification timed out after {limit:g}s"))
+            except Exception as e:  # noqa: BLE001 - any backend error becomes a result
+                results.append(self._failure(notifier, f"Notification failed: {e}"))
+        return results
+
+    async def notify_async(self, subject: str, message: str) -> list[Result]:
+        """Sends a notification to all registered notifiers from an event loop.
+
+        Backends are awaited concurrently with the same timeouts as `notify()`.
+        With an outbox, the spooled delivery runs in a worker thread.
+
+        Args:
+            subject (str): Notification subject.
+            message (str): Notification body.
+
+        Returns:
+            List[Result]: One ERROR result per backend that failed or timed out.
+        """
+        if self.outbox is not None:
+            return await asyncio.to_thread(self.notify, subject, message)
+
+        async def deliver(notifier: Notifier) -> Result | None:
+            limit = self._limit(notifier)
+            try:
+                await asyncio.wait_for(notifier.notify_async(subject, message), limit)
+            except asyncio.TimeoutError:
+                return self._failure(notifier, f"Notification timed out after {limit:g}s")
+            except Exception as e:  # noqa: BLE001 - any backend error becomes a result
+                return self._failure(notifier, f"Notification failed: {e}")
+            return None
+
+        results = await asyncio.gather(*(deliver(n) for n in self._notifiers))
+        return [r for r in results if r is not None]
+
+    def close(self) -> None:
+        """Closes all registered notifiers."""
         for notifier in self._notifiers:
-            notifier.notify(subject, message)
+            try:
+                notifier.close()
+            except Exception:
+                notifier.logger.exception("Failed to close notifier %s", notifier.name)
+
+    @staticmethod
+    def _spawn(notifier: Notifier, task: Callable[..., Any], args: tuple) -> Future:
+        """Runs the delivery of a backend in a daemon thread.
+
+        Unlike pool threads, daemon threads are not joined at interpreter exit,
+        so a hung backend cannot keep the process alive.
+
+        Args:
+            notifier (Notifier): The backend.
+            task (Callable[..., Any]): The delivery function.
+            args (tuple): Arguments of the delivery function.
+
+        Returns:
+            Future: Completes with the outcome of the delivery.
+        """
+        future: Future = Future()
+        ctx = contextvars.copy_context()
+
+        def run() -> None:
+            future.set_running_or_notify_cancel()
+            try:
+                result = ctx.run(task, *args)
+            except BaseException as e:  # noqa: BLE001 - handed to the waiting caller
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        threading.Thread(target=run, name=f"notifier-{notifier.name}", daemon=True).start()
+        return future
+
+    def _deliver_spooled(self, notifier: Notifier, queue: str) -> None:
+        """Delivers the due reports of a backend from the outbox.
+
+        Reports are sent oldest first, or as one message if the outbox batches.
+        A failed report is rescheduled without holding back the newer ones. The
+        queue is locked, so overlapping runs do not deliver a report twice.
+
+        Args:
+            notifier (Notifier): The backend.
+            queue (str): Outbox queue of the backend.
+
+        Raises:
+            Exception: The error of the first failed delivery.
+        """
+        error: Exception | None = None
+        delivered = 0
+        with self.outbox.lock(queue):
+            entries = self.outbox.due(queue)
+            batches = [entries] if self.outbox.batch and entries else [[e] for e in entries]
+            for batch in batches:
+                subject, message = self.outbox.combine(batch)
+                try:
+                    notifier.notify(subject, message)
+                except Exception as e:  # noqa: BLE001 - rescheduled and re-raised below
+                    self.outbox.failed(queue, batch, str(e))
+                    error = error or e
+                    continue
+                self.outbox.delivered(queue, batch)
+                delivered += len(batch)
+        if delivered > 1:
+            notifier.logger.info("Notifier %s delivered %d reports", notifier.name, delivered)
+        if error is not None:
+            raise error
+
+    @staticmethod
+    def _queue(notifier: Notifier) -> str:
+        """Determines the outbox queue of a backend.
+
+        Queues are keyed by the type and configuration of the backend, so a
+        queue keeps its name across runs regardless of registration order.
+
+        Args:
+            notifier (Notifier): The backend.
+
+        Returns:
+            str: The queue name.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{type(notifier).__module__}.{type(notifier).__qualname__}".encode())
+        if isinstance(notifier.config, BaseModel):
+            digest.update(notifier.config.model_dump_json().encode())
+        return f"{notifier.name}-{digest.hexdigest()[:12]}"
+
+    def _limit(self, notifier: Notifier) -> float | None:
+        """Determines how long to wait for a backend, measured from the start.
+
+        Args:
+            notifier (Notifier): The backend.
+
+        Returns:
+            Optional[float]: The smaller of the backend timeout and the overall
+                deadline, or None if both are unbounded.
+        """
+        limits = [
+            limit
+            for limit in (getattr(notifier.config, "timeout", None), self.deadline)
+            if limit is not None
+        ]
+        return min(limits) if limits else None
+
+    @staticmethod
+    def _failure(notifier: Notifier, message: str) -> Result:
+        """Creates the result of a failed backend.
+
+        Args:
+            notifier (Notifier): The failed backend.
+            message (str): Description of the failure.
+
+        Returns:
+            Result: An ERROR result for the backend.
+        """
+        notifier.logger.error("Notifier %s: %s", notifier.name, message)
+        return Result(step=f"notifier:{notifier.name}", severity=Severity.ERROR, message=message)
@@ -0,0 +1,231 @@
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+@dataclass
+class OutboxEntry:
+    """A report waiting in the outbox for delivery by one notifier.
+
+    Attributes:
+        id (str): Identifier of the entry; entries sort by creation time.
+        subject (str): Report subject.
+        message (str): Report body.
+        created (float): UNIX time at which the report was created.
+        attempts (int): Number of failed delivery attempts.
+        next_attempt (float): UNIX time before which no new attempt is made.
+        last_error (Optional[str]): Error of the last failed attempt.
+    """
+
+    id: str
+    subject: str
+    message: str
+    created: float
+    attempts: int = 0
+    next_attempt: float = 0.0
+    last_error: str | None = None
+
+
+class NotificationOutbox:
+    """Durable on-disk spool of reports that have not been delivered yet.
+
+    Every report is written to one queue per notifier before it is sent and only
+    removed after the notifier delivered it. A failed delivery is retried by a
+    later run once its exponential backoff has elapsed, so a flaky relay can
+    neither lose reports nor make the run wait for retries.
+
+    Layout: `<spool_dir>/<queue>/<created_ns>-<random>.json`.
+    """
+
+    def __init__(
+        self,
+        spool_dir: str,
+        logger: logging.Logger,
+        backoff: float = 60.0,
+        max_backoff: float = 6 * 3600.0,
+        max_attempts: int = 10,
+        batch: bool = False,
+    ) -> None:
+        """Initializes the outbox.
+
+        Args:
+            spool_dir (str): Directory holding the queues.
+            logger (logging.Logger): Logger instance.
+            backoff (float): Delay in seconds after the first failed attempt;
+                doubled after every further failure.
+            max_backoff (float): Upper bound of the delay in seconds.
+            max_attempts (int): Failed attempts after which a report is discarded.
+            batch (bool): Deliver all pending reports of a notifier as one message.
+        """
+        self.path = Path(spool_dir)
+        self.logger = logger
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+        self.batch = batch
+
+    def enqueue(self, queue: str, subject: str, message: str) -> OutboxEntry:
+        """Spools a report for delivery by a notifier.
+
+        Args:
+            queue (str): Queue of the notifier.
+            subject (str): Report subject.
+            message (str): Report body.
+
+        Returns:
+            OutboxEntry: The spooled entry.
+        """
+        entry = OutboxEntry(
+            id=f"{time.time_ns():020d}-{os.urandom(4).hex()}",
+            subject=subject,
+            message=message,
+            created=time.time(),
+        )
+        self._write(queue, entry)
+        return entry
+
+    @contextlib.contextmanager
+    def lock(self, queue: str) -> Iterator[None]:
+        """Locks a queue against concurrent delivery by another process.
+
+        Args:
+            queue (str): Queue of the notifier.
+
+        Yields:
+            None: While the queue is locked.
+        """
+        if fcntl is None:  # pragma: no cover - not available on Windows
+            yield
+            return
+        directory = self.path / queue
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / ".lock", "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def pending(self, queue: str) -> list[OutboxEntry]:
+        """Retrieves all spooled reports of a notifier, oldest first.
+
+        Unreadable entries are skipped.
+
+        Args:
+            queue (str): Queue of the notifier.
+
+        Returns:
+            List[OutboxEntry]: The spooled entries.
+        """
+        entries = []
+        for file in sorted((self.path / queue).glob("*.json")):
+            try:
+                entries.append(OutboxEntry(**json.loads(file.read_text(encoding="utf-8"))))
+            except (OSError, ValueError, TypeError) as e:
+                self.logger.warning("Skipping unreadable outbox entry %s: %s", file, e)
+        return entries
+
+    def due(self, queue: str, now: float | None = None) -> list[OutboxEntry]:
+        """Retrieves the spooled reports of a notifier whose backoff has elapsed.
+
+        Args:
+            queue (str): Queue of the notifier.
+            now (Optional[float]): Current UNIX time. Defaults to `time.time()`.
+
+        Returns:
+            List[OutboxEntry]: The entries to deliver, oldest first.
+        """
+        now = time.time() if now is None else now
+        return [entry for entry in self.pending(queue) if entry.next_attempt <= now]
+
+    def delivered(self, queue: str, entries: list[OutboxEntry]) -> None:
+        """Removes delivered reports from the queue.
+
+        Args:
+            queue (str): Queue of the notifier.
+            entries (List[OutboxEntry]): The delivered entries.
+        """
+        for entry in entries:
+            with contextlib.suppress(FileNotFoundError):
+                (self.path / queue / f"{entry.id}.json").unlink()
+
+    def failed(self, queue: str, entries: list[OutboxEntry], error: str) -> None:
+        """Schedules the next attempt of reports that could not be delivered.
+
+        Reports that reached `max_attempts` are discarded.
+
+        Args:
+            queue (str): Queue of the notifier.
+            entries (List[OutboxEntry]): The entries of the failed attempt.
+            error (str): Description of the failure.
+        """
+        now = time.time()
+        for entry in entries:
+            entry.attempts += 1
+            entry.last_error = error
+            if entry.attempts >= self.max_attempts:
+                self.logger.error(
+                    "Discarding report '%s' of %s after %d failed attempts: %s",
+                    entry.subject,
+                    queue,
+                    entry.attempts,
+                    error,
+                )
+                self.delivered(queue, [entry])
+                continue
+            delay = min(self.backoff * 2 ** (entry.attempts - 1), self.max_backoff)
+            entry.next_attempt = now + delay
+            self._write(queue, entry)
+
+    @staticmethod
+    def combine(entries: list[OutboxEntry]) -> tuple[str, str]:
+        """Combines several reports into one message.
+
+        Args:
+            entries (List[OutboxEntry]): Entries to combine, oldest first.
+
+        Returns:
+            Tuple[str, str]: Subject and body of the combined message.
+        """
+        if len(entries) == 1:
+            return entries[0].subject, entries[0].message
+        newest = entries[-1]
+        subject = f"{newest.subject} (+{len(entries) - 1} pending)"
+        sections = []
+        for entry in reversed(entries):
+            created = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry.created))
+            header = f"{entry.subject} ({created})"
+            sections.append(f"{header}\n{'=' * len(header)}\n{entry.message}")
+        return subject, "\n\n".join(sections)
+
+    def _write(self, queue: str, entry: OutboxEntry) -> None:
+        """Atomically writes an entry to its queue.
+
+        Args:
+            queue (str): Queue of the notifier.
+            entry (OutboxEntry): Entry to write.
+        """
+        directory = self.path / queue
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(asdict(entry), f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, directory / f"{entry.id}.json")
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
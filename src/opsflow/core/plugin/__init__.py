@@ -1,7 +1,8 @@
-from .base import Plugin
+from .base import AsyncPlugin, Plugin
 from .registry import PluginRegistry
 
 __all__ = [
+    "AsyncPlugin",
     "Plugin",
     "PluginRegistry",
 ]
@@ -14,6 +14,10 @@ class Plugin(ABC, Generic[_C]):
     Every plugin implements `run()` and may optionally override `setup()`
     and `teardown()`.
 
+    Plugins may declare the names of other plugins they depend on via the
+    `depends_on` class attribute. These are combined with `depends_on` from
+    the plugin configuration and respected by the workflow scheduler.
+
     Args:
         config (C): Application configuration object passed to all components.
         logger (logging.Logger): Logger dedicated to this plugin.
@@ -21,6 +25,7 @@ class Plugin(ABC, Generic[_C]):
     """
 
     name: str = "unnamed"
+    depends_on: tuple[str, ...] = ()
 
     def __init__(self, config: _C, logger: logging.Logger, ctx: Context) -> None:
         self.config: _C = config
@@ -36,3 +41,34 @@ class Plugin(ABC, Generic[_C]):
 
     def teardown(self) -> None:
         """Optional cleanup executed after `run()`."""
+
+    def fingerprint(self) -> str | None:
+        """Optional fingerprint of the plugin's external inputs.
+
+        Plugins returning a fingerprint are incremental: if enabled via
+        `state.skip_unchanged`, the workflow skips them while the fingerprint
+        and the plugin configuration match their last successful run.
+
+        Returns:
+            Optional[str]: Fingerprint of the inputs, or None if unknown.
+        """
+        return None
+
+
+class AsyncPlugin(Plugin[_C]):
+    """Base class for plugins implemented with asyncio.
+
+    All lifecycle methods are coroutines. When the workflow is driven via
+    `Workflow.run_all_async()`, every async plugin runs on the same event loop;
+    in synchronous runs each plugin gets its own loop for its whole lifecycle.
+    """
+
+    async def setup(self) -> None:  # type: ignore[override]
+        """Optional initialization awaited before run()."""
+
+    @abstractmethod
+    async def run(self) -> None:  # type: ignore[override]
+        """Executes the plugin's main task."""
+
+    async def teardown(self) -> None:  # type: ignore[override]
+        """Optional cleanup awaited after `run()`."""
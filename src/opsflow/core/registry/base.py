@@ -1,7 +1,8 @@
+import hashlib
+import sys
 from collections.abc import Callable
 from pathlib import Path
-import sys
-from typing import Generic, TypeVar
+from typing import Generic, TypeVar, get_args
 
 from .entry import RegistryEntry
 
@@ -110,6 +111,54 @@ class Registry(Generic[_C, _CFG]):
             description=description,
         )
 
+    def declared_config(self, cls: type[_C]) -> type[_CFG]:
+        """
+        Return the configuration class declared by a component class.
+
+        The configuration class is the type argument of a generic base class,
+        e.g. ``BackupConfig`` for ``class Backup(Plugin[BackupConfig])``.
+
+        Args:
+            cls: Component class to inspect.
+
+        Returns:
+            The declared configuration class, or the registry's default
+            configuration class if the component does not declare one.
+        """
+        for klass in cls.__mro__:
+            for base in getattr(klass, "__orig_bases__", ()):
+                for arg in get_args(base):
+                    if isinstance(arg, type) and issubclass(arg, self._default_config):
+                        return arg
+        return self._default_config
+
+    def fingerprint(self) -> str:
+        """
+        Return a digest identifying the registered classes and their sources.
+
+        The digest changes when a component is registered or removed, or when
+        the source file of a component or configuration class is modified, so
+        it can serve as the version of the registry in caches.
+
+        Returns:
+            Hex digest of the registry content.
+        """
+        digest = hashlib.sha256()
+        for name in sorted(self.entries):
+            entry = self.entries[name]
+            for cls in (entry.component_cls, entry.config_cls):
+                origin = self._origin_file(cls)
+                stamp = None
+                if origin:
+                    try:
+                        stat = origin.stat()
+                        stamp = (stat.st_mtime_ns, stat.st_size)
+                    except OSError:
+                        pass
+                line = f"{name}|{cls.__module__}.{cls.__qualname__}|{origin}|{stamp}\n"
+                digest.update(line.encode())
+        return digest.hexdigest()
+
     @staticmethod
     def _origin_file(cls_type: type) -> Path | None:
         """Return the resolved source file path of a class.
@@ -0,0 +1,9 @@
+from .store import RunStateStore, StepRecord, StepStatus
+from .tracker import RunTracker
+
+__all__ = [
+    "RunStateStore",
+    "RunTracker",
+    "StepRecord",
+    "StepStatus",
+]
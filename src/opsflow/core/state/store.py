@@ -0,0 +1,246 @@
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+
+
+class StepStatus(str, Enum):
+    """Status of a single step in a workflow run."""
+
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass(frozen=True)
+class StepRecord:
+    """Persisted state of a single step in a workflow run.
+
+    Attributes:
+        run_id (int): Identifier of the run the step belongs to.
+        step (str): Step identifier (e.g. "system_update", "plugin:rclone").
+        status (StepStatus): Final or current status of the step.
+        started (float): Wall-clock start time as UNIX timestamp.
+        finished (Optional[float]): Wall-clock end time, None while running.
+        duration (Optional[float]): Monotonic duration in seconds.
+        fingerprint (Optional[str]): Fingerprint of the step inputs.
+    """
+
+    run_id: int
+    step: str
+    status: StepStatus
+    started: float
+    finished: float | None
+    duration: float | None
+    fingerprint: str | None
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started REAL NOT NULL,
+    finished REAL,
+    status TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    step TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started REAL NOT NULL,
+    finished REAL,
+    duration REAL,
+    fingerprint TEXT,
+    PRIMARY KEY (run_id, step)
+);
+CREATE INDEX IF NOT EXISTS steps_by_step ON steps (step, status, finished);
+"""
+
+
+class RunStateStore:
+    """SQLite-backed store for workflow runs and their steps.
+
+    Every write is committed immediately, so the recorded state survives a
+    crash of the workflow process. The store is safe to use from multiple
+    threads of the same process.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open (and if necessary create) the state database.
+
+        Args:
+            path (str): Path to the SQLite database file.
+        """
+        db_path = Path(path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def begin_run(self) -> int:
+        """Record the start of a new run.
+
+        Returns:
+            int: Identifier of the new run.
+        """
+        with self._lock:
+            cur = self._conn.execute(
+                "INSERT INTO runs (started, status) VALUES (?, ?)",
+                (time.time(), StepStatus.RUNNING.value),
+            )
+            self._conn.commit()
+            return int(cur.lastrowid or 0)
+
+    def finish_run(self, run_id: int, status: StepStatus) -> None:
+        """Record the end of a run.
+
+        Args:
+            run_id (int): Identifier of the run.
+            status (StepStatus): Final status of the run.
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET finished = ?, status = ? WHERE id = ?",
+                (time.time(), status.value, run_id),
+            )
+            self._conn.commit()
+
+    def interrupted_run(self, before: int) -> int | None:
+        """Return the most recent run before `before` if it never finished.
+
+        Args:
+            before (int): Identifier of the current run.
+
+        Returns:
+            Optional[int]: Identifier of the interrupted run, or None if the
+                previous run finished (or no previous run exists).
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, status FROM runs WHERE id < ? ORDER BY id DESC LIMIT 1",
+                (before,),
+            ).fetchone()
+        if row and row[1] == StepStatus.RUNNING.value:
+            return int(row[0])
+        return None
+
+    def start_step(self, run_id: int, step: str, fingerprint: str | None) -> None:
+        """Record that a step has started.
+
+        Args:
+            run_id (int): Identifier of the run.
+            step (str): Step identifier.
+            fingerprint (Optional[str]): Fingerprint of the step inputs.
+        """
+        self._write_step(
+            StepRecord(run_id, step, StepStatus.RUNNING, time.time(), None, None, fingerprint)
+        )
+
+    def finish_step(
+        self,
+        run_id: int,
+        step: str,
+        status: StepStatus,
+        started: float,
+        duration: float | None,
+        fingerprint: str | None,
+    ) -> None:
+        """Record the final status of a step.
+
+        Args:
+            run_id (int): Identifier of the run.
+            step (str): Step identifier.
+            status (StepStatus): Final status of the step.
+            started (float): Wall-clock start time as UNIX timestamp.
+            duration (Optional[float]): Monotonic duration in seconds.
+            fingerprint (Optional[str]): Fingerprint of the step inputs.
+        """
+        self._write_step(
+            StepRecord(run_id, step, status, started, time.time(), duration, fingerprint)
+        )
+
+    def steps(self, run_id: int) -> list[StepRecord]:
+        """Return all recorded steps of a run.
+
+        Args:
+            run_id (int): Identifier of the run.
+
+        Returns:
+            List[StepRecord]: Steps of the run in start order.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT run_id, step, status, started, finished, duration, fingerprint "
+                "FROM steps WHERE run_id = ? ORDER BY started",
+                (run_id,),
+            ).fetchall()
+        return [self._record(row) for row in rows]
+
+    def last_success(self, step: str) -> StepRecord | None:
+        """Return the most recent successful execution of a step.
+
+        Args:
+            step (str): Step identifier.
+
+        Returns:
+            Optional[StepRecord]: The latest successful record, or None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT run_id, step, status, started, finished, duration, fingerprint "
+                "FROM steps WHERE step = ? AND status = ? ORDER BY finished DESC LIMIT 1",
+                (step, StepStatus.SUCCESS.value),
+            ).fetchone()
+        return self._record(row) if row else None
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _write_step(self, record: StepRecord) -> None:
+        """Insert or replace a step record.
+
+        Args:
+            record (StepRecord): The record to persist.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO steps "
+                "(run_id, step, status, started, finished, duration, fingerprint) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record.run_id,
+                    record.step,
+                    record.status.value,
+                    record.started,
+                    record.finished,
+                    record.duration,
+                    record.fingerprint,
+                ),
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _record(row: tuple) -> StepRecord:
+        """Convert a database row into a StepRecord.
+
+        Args:
+            row (tuple): Row as returned by the steps queries.
+
+        Returns:
+            StepRecord: The converted record.
+        """
+        return StepRecord(
+            run_id=row[0],
+            step=row[1],
+            status=StepStatus(row[2]),
+            started=row[3],
+            finished=row[4],
+            duration=row[5],
+            fingerprint=row[6],
+        )
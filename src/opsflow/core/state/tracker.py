@@ -0,0 +1,151 @@
+import logging
+import threading
+import time
+
+from .store import RunStateStore, StepRecord, StepStatus
+
+
+class RunTracker:
+    """Records workflow steps in a RunStateStore and decides which steps can be skipped.
+
+    A step is skipped if:
+    - the previous run was interrupted, `resume` is enabled and the step already
+      completed in that run with the same fingerprint, or
+    - `skip_unchanged` is enabled, the step is incremental and its fingerprint
+      matches the one of its last successful execution.
+
+    Steps are only tracked between `begin()` and `end()`.
+    """
+
+    def __init__(
+        self,
+        store: RunStateStore,
+        logger: logging.Logger,
+        resume: bool = True,
+        skip_unchanged: bool = False,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            store (RunStateStore): Store used to persist runs and steps.
+            logger (logging.Logger): Logger for tracking diagnostics.
+            resume (bool): Skip steps that completed in an interrupted previous run.
+            skip_unchanged (bool): Skip incremental steps whose inputs are unchanged.
+        """
+        self._store = store
+        self._logger = logger
+        self._resume = resume
+        self._skip_unchanged = skip_unchanged
+        self._lock = threading.Lock()
+        self._run_id: int | None = None
+        self._carried: dict[str, StepRecord] = {}
+        self._started: dict[str, tuple[float, float]] = {}
+        self._failed = False
+
+    @property
+    def run_id(self) -> int | None:
+        """Identifier of the active run, or None outside of a run."""
+        return self._run_id
+
+    def begin(self) -> None:
+        """Start tracking a new run and load resumable steps of an interrupted run."""
+        self._run_id = self._store.begin_run()
+        self._carried = {}
+        self._started = {}
+        self._failed = False
+
+        previous = self._store.interrupted_run(before=self._run_id) if self._resume else None
+        if previous is not None:
+            self._carried = {
+                record.step: record
+                for record in self._store.steps(previous)
+                if record.status in (StepStatus.SUCCESS, StepStatus.SKIPPED)
+            }
+            self._logger.info(
+                "Resuming interrupted run %d (%d completed steps)", previous, len(self._carried)
+            )
+
+    def end(self) -> None:
+        """Finish the active run."""
+        if self._run_id is None:
+            return
+        status = StepStatus.FAILED if self._failed else StepStatus.SUCCESS
+        self._store.finish_run(self._run_id, status)
+        self._run_id = None
+
+    def skip_reason(
+        self, step: str, fingerprint: str | None, incremental: bool = False
+    ) -> str | None:
+        """Return why a step can be skipped in the active run.
+
+        Args:
+            step (str): Step identifier.
+            fingerprint (Optional[str]): Fingerprint of the step inputs.
+            incremental (bool): Whether the fingerprint fully describes the step
+                inputs, so an unchanged fingerprint means there is nothing to do.
+
+        Returns:
+            Optional[str]: Human-readable reason, or None if the step must run.
+        """
+        if self._run_id is None:
+            return None
+
+        carried = self._carried.get(step)
+        if carried is not None and carried.fingerprint == fingerprint:
+            return f"completed in interrupted run {carried.run_id}"
+
+        if self._skip_unchanged and incremental and fingerprint is not None:
+            last = self._store.last_success(step)
+            if last is not None and last.fingerprint == fingerprint:
+                return f"inputs unchanged since run {last.run_id}"
+
+        return None
+
+    def skip(self, step: str, fingerprint: str | None) -> None:
+        """Record a skipped step.
+
+        Args:
+            step (str): Step identifier.
+            fingerprint (Optional[str]): Fingerprint of the step inputs.
+        """
+        if self._run_id is None:
+            return
+        self._store.finish_step(
+            self._run_id, step, StepStatus.SKIPPED, time.time(), 0.0, fingerprint
+        )
+
+    def start(self, step: str, fingerprint: str | None) -> None:
+        """Record the start of a step.
+
+        Args:
+            step (str): Step identifier.
+            fingerprint (Optional[str]): Fingerprint of the step inputs.
+        """
+        if self._run_id is None:
+            return
+        with self._lock:
+            self._started[step] = (time.time(), time.monotonic())
+        self._store.start_step(self._run_id, step, fingerprint)
+
+    def finish(self, step: str, succeeded: bool, fingerprint: str | None) -> None:
+        """Record the end of a step.
+
+        Args:
+            step (str): Step identifier.
+            succeeded (bool): Whether the step succeeded.
+            fingerprint (Optional[str]): Fingerprint of the step inputs.
+        """
+        if self._run_id is None:
+            return
+        with self._lock:
+            started, started_monotonic = self._started.pop(step, (time.time(), time.monotonic()))
+            if not succeeded:
+                self._failed = True
+        self._store.finish_step(
+            self._run_id,
+            step,
+            StepStatus.SUCCESS if succeeded else StepStatus.FAILED,
+            started,
+            time.monotonic() - started_monotonic,
+            fingerprint,
+        )
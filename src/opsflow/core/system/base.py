@@ -69,6 +69,7 @@ class SystemManager(ABC):
         """Perform system update and upgrade with pre- and post-update hooks.
 
         Exceptions in hooks or package operations are caught and converted into `Result` objects.
+        Every hook and package operation is timed as a span of the context trace.
         """
         self.logger.info("Starting system update...")
 
@@ -76,7 +77,8 @@ class SystemManager(ABC):
         for func in self.pre_update:
             try:
                 self.logger.debug(f"Executing pre-update hook: {func.__name__}")
-                func()
+                with self.ctx.trace.span(f"hook:pre_update:{func.__name__}", "hook"):
+                    func()
             except Exception as e:
                 self.logger.exception(f"Pre-update hook {func.__name__} failed: {e}")
                 self.ctx.add_result(
@@ -88,7 +90,9 @@ class SystemManager(ABC):
                 )
         # PackageManager update
         try:
-            self.ctx.add_result(self.pkg_manager.update(dry_run=self.ctx.dry_run))
+            with self.ctx.trace.span("pkg:update", "package"):
+                result = self.pkg_manager.update(dry_run=self.ctx.dry_run)
+            self.ctx.add_result(result)
         except Exception as e:
             self.logger.exception(f"PackageManager.update() failed: {e}")
             self.ctx.add_result(
@@ -97,7 +101,9 @@ class SystemManager(ABC):
 
         # PackageManager upgrade
         try:
-            self.ctx.add_result(self.pkg_manager.upgrade(dry_run=self.ctx.dry_run))
+            with self.ctx.trace.span("pkg:upgrade", "package"):
+                result = self.pkg_manager.upgrade(dry_run=self.ctx.dry_run)
+            self.ctx.add_result(result)
         except Exception as e:
             self.logger.exception(f"PackageManager.upgrade() failed: {e}")
             self.ctx.add_result(
@@ -110,7 +116,8 @@ class SystemManager(ABC):
         for func in self.post_update:
             try:
                 self.logger.debug(f"Executing post-update hook: {func.__name__}")
-                func()
+                with self.ctx.trace.span(f"hook:post_update:{func.__name__}", "hook"):
+                    func()
             except Exception as e:
                 self.logger.exception(f"Post-update hook {func.__name__} failed: {e}")
                 self.ctx.add_result(
@@ -123,7 +130,14 @@ class SystemManager(ABC):
 
     def check_reboot_required(self) -> None:
         """Check if the system requires a reboot and convert to a Result object."""
-        if self._is_reboot_required():
+        with self.ctx.trace.span("check:reboot_required", "check"):
+            reboot_required = self._is_reboot_required()
+        self.ctx.metrics.set(
+            "opsflow_reboot_required",
+            1 if reboot_required else 0,
+            help="Whether the system requires a reboot.",
+        )
+        if reboot_required:
             message = "System requires a reboot"
             self.logger.warning(message)
             self.ctx.add_result(
@@ -132,7 +146,9 @@ class SystemManager(ABC):
 
     def check_new_stable_available(self) -> None:
         """Check if a new stable OS release is available and convert to a Result object."""
-        if self._is_new_stable_os_available():
+        with self.ctx.trace.span("check:new_stable_release", "check"):
+            available = self._is_new_stable_os_available()
+        if available:
             message = "A new stable OS release is available"
             self.logger.warning(message)
             self.ctx.add_result(
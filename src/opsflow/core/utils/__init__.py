@@ -1,3 +1,14 @@
 from .command_runner import CommandRunner
+from .metrics_exporter import PrometheusTextfileExporter
+from .span_exporter import OtlpJsonEncoder, OtlpJsonFileExporter, SpanExporter
+from .startup_profiler import ImportTiming, StartupProfiler
 
-__all__ = ["CommandRunner"]
+__all__ = [
+    "CommandRunner",
+    "ImportTiming",
+    "OtlpJsonEncoder",
+    "OtlpJsonFileExporter",
+    "PrometheusTextfileExporter",
+    "SpanExporter",
+    "StartupProfiler",
+]
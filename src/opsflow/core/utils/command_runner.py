@@ -1,29 +1,105 @@
+import asyncio
 import logging
+import os
+import re
+import signal
 import subprocess
+import threading
+import weakref
+from collections import deque
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext, suppress
 from pathlib import Path
+from typing import IO, Any
 
+from ..config.schema import CommandConfig, IoPriorityClass
 from ..models.result import Result, Severity
+from ..models.trace import Span, Trace
+
+LineCallback = Callable[[str, str], None]
+
+# Default of the per-call `timeout`: use the configured timeout. Pass None to
+# run a single command without timeout.
+CONFIGURED_TIMEOUT: Any = object()
+
+# Seconds to wait for a process to exit after SIGKILL
+_KILL_TIMEOUT = 5.0
+
+# Bytes read from an output pipe at a time when streaming
+_CHUNK_SIZE = 64 * 1024
+
+# Longest streamed line forwarded in full; only the end of a longer line is kept
+_MAX_LINE_BYTES = 1024 * 1024
+
+# Line breaks of streamed output; progress bars redraw with a bare \r
+_LINE_BREAK = re.compile(rb"\r\n|\r|\n")
+
+_IONICE_CLASSES = {
+    IoPriorityClass.REALTIME: "1",
+    IoPriorityClass.BEST_EFFORT: "2",
+    IoPriorityClass.IDLE: "3",
+}
 
 
 class CommandRunner:
-    """Utility class for executing shell commands with logging support."""
+    """Utility class for executing shell commands with logging support.
+
+    Output is either captured completely and logged after the command finished,
+    or streamed line by line while the command is running. Streamed lines are
+    passed to a callback (``stream``, ``line``), where ``stream`` is ``"stdout"``
+    or ``"stderr"``; only a bounded tail of each stream is retained.
+
+    On POSIX systems every command runs in its own process group. When a command
+    exceeds its timeout, the whole group receives SIGTERM and, after the
+    configured grace period, SIGKILL. A process that cannot be signalled (e.g.
+    a `sudo` command of a non-root user) is left running and reported instead
+    of being waited for. Configured niceness, I/O priority and resource limits
+    are applied to every command via `nice`, `ionice` and `prlimit` prefixes.
+
+    If a trace is configured, every command is recorded as a span carrying its
+    argv and exit code, nested in the span that is open when it is started.
+    """
 
     _logger: logging.Logger | None = None
     _dry_run: bool = False
+    _config: CommandConfig = CommandConfig()
+    _trace: Trace | None = None
+    _semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+        weakref.WeakKeyDictionary()
+    )
 
     @classmethod
-    def configure(cls, dry_run: bool, logger: logging.Logger) -> None:
+    def configure(
+        cls,
+        dry_run: bool,
+        logger: logging.Logger,
+        config: CommandConfig | None = None,
+        trace: Trace | None = None,
+    ) -> None:
         """Configures the command runner.
 
         Args:
             dry_run (bool): If True, commands will not be executed.
             logger (logging.Logger): Logger used for command tracing.
+            config (Optional[CommandConfig]): Command execution settings.
+                Defaults to `CommandConfig()`.
+            trace (Optional[Trace]): Trace in which commands are recorded as spans.
         """
         cls._dry_run = dry_run
         cls._logger = logger
+        cls._config = config or CommandConfig()
+        cls._trace = trace
+        cls._semaphores = weakref.WeakKeyDictionary()
 
         if logger:
-            logger.debug("CommandRunner configured (dry_run=%s)", dry_run)
+            logger.debug(
+                "CommandRunner configured (dry_run=%s, max_concurrency=%d, "
+                "stream_output=%s, timeout=%s)",
+                dry_run,
+                cls._config.max_concurrency,
+                cls._config.stream_output,
+                cls._config.timeout,
+            )
 
     @classmethod
     def run(
@@ -33,6 +109,9 @@ class CommandRunner:
         working_directory: Path | None = None,
         check: bool = False,
         use_sudo: bool = True,
+        stream: bool | None = None,
+        on_line: LineCallback | None = None,
+        timeout: float | None = CONFIGURED_TIMEOUT,
     ) -> subprocess.CompletedProcess:
         """Executes a shell command.
 
@@ -42,50 +121,153 @@ class CommandRunner:
             working_directory (Optional[Path]): Directory in which to run the command.
             check (bool): If True, raises CalledProcessError on non-zero exit code.
             use_sudo (bool): Whether to prepend 'sudo' to the command.
+            stream (Optional[bool]): Stream output line by line. Defaults to the
+                configured `stream_output`; implied if `on_line` is given.
+            on_line (Optional[LineCallback]): Receives each output line while
+                streaming. Lines are logged at debug level if omitted. May be
+                called from a helper thread.
+            timeout (Optional[float]): Maximum runtime in seconds. Defaults to the
+                configured `timeout`; None disables the timeout for this call.
 
         Returns:
-            subprocess.CompletedProcess: The process result.
+            subprocess.CompletedProcess: The process result. When streaming,
+                stdout and stderr contain only the retained output tail.
 
         Raises:
             RuntimeError: If the runner is not configured.
+            subprocess.TimeoutExpired: If the command exceeds its timeout.
             subprocess.CalledProcessError: If check=True and the command fails.
         """
-        if cls._logger is None:
-            raise RuntimeError("CommandRunner not configured. Call configure() first.")
+        logger, cmd = cls._prepare(command, use_sudo)
+        with cls._span(command, cmd) as span:
+            if cls._dry_run:
+                logger.info("Dry-run: skipping execution")
+                return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
 
-        logger = cls._logger
+            timeout = cls._timeout(timeout)
+            streaming = cls._streaming(stream, on_line)
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                errors="replace",
+                cwd=str(working_directory) if working_directory else None,
+                env=env,
+                **cls._popen_options(),
+            )
+            stopped = True
+            try:
+                if streaming:
+                    stdout, stderr, timed_out, stopped = cls._communicate_streaming(
+                        proc, on_line or cls._log_line(logger), timeout
+                    )
+                else:
+                    try:
+                        stdout, stderr = proc.communicate(timeout=timeout)
+                        timed_out = False
+                    except subprocess.TimeoutExpired:
+                        timed_out = True
+                        stopped = cls._terminate(proc)
+                        stdout, stderr = proc.communicate() if stopped else ("", "")
+            finally:
+                # Readers of a detached streaming command close its pipes at EOF
+                if stopped or not streaming:
+                    cls._release(proc, wait=stopped)
 
-        cmd = command.copy()
-        if use_sudo:
-            cmd.insert(0, "sudo")
+            if timed_out:
+                logger.error("Command timed out after %ss: %s", timeout, " ".join(cmd))
+                raise subprocess.TimeoutExpired(cmd, timeout or 0, output=stdout, stderr=stderr)
 
-        logger.debug("RUN: %s", " ".join(cmd))
+            result = subprocess.CompletedProcess(cmd, proc.returncode, stdout=stdout, stderr=stderr)
+            cls._record_exit(span, result.returncode)
+            return cls._finish(logger, result, check, log_output=not streaming)
 
-        if cls._dry_run:
-            logger.info("Dry-run: skipping execution")
-            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+    @classmethod
+    async def run_async(
+        cls,
+        command: list[str],
+        env: dict[str, str] | None = None,
+        working_directory: Path | None = None,
+        check: bool = False,
+        use_sudo: bool = True,
+        timeout: float | None = CONFIGURED_TIMEOUT,
+        stream: bool | None = None,
+        on_line: LineCallback | None = None,
+    ) -> subprocess.CompletedProcess:
+        """Executes a shell command without blocking the running event loop.
 
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False,
-            cwd=str(working_directory) if working_directory else None,
-            env=env,
-        )
+        The number of concurrently running commands per event loop is bounded
+        by `max_concurrency`. If the command times out or the awaiting task is
+        cancelled, the process group is terminated before the exception propagates.
 
-        if result.stdout:
-            logger.debug("STDOUT: %s", result.stdout.strip())
-        if result.stderr:
-            logger.debug("STDERR: %s", result.stderr.strip())
+        Args:
+            command (list[str]): Command to execute.
+            env (Optional[dict[str, str]]): Environment variables for the command.
+            working_directory (Optional[Path]): Directory in which to run the command.
+            check (bool): If True, raises CalledProcessError on non-zero exit code.
+            use_sudo (bool): Whether to prepend 'sudo' to the command.
+            timeout (Optional[float]): Maximum runtime in seconds. Defaults to the
+                configured `timeout`; None disables the timeout for this call.
+            stream (Optional[bool]): Stream output line by line. Defaults to the
+                configured `stream_output`; implied if `on_line` is given.
+            on_line (Optional[LineCallback]): Receives each output line while
+                streaming. Lines are logged at debug level if omitted.
 
-        if check and result.returncode != 0:
-            raise subprocess.CalledProcessError(
-                result.returncode, cmd, output=result.stdout, stderr=result.stderr
-            )
+        Returns:
+            subprocess.CompletedProcess: The process result. When streaming,
+                stdout and stderr contain only the retained output tail.
 
-        return result
+        Raises:
+            RuntimeError: If the runner is not configured.
+            subprocess.TimeoutExpired: If the command exceeds its timeout.
+            subprocess.CalledProcessError: If check=True and the command fails.
+        """
+        logger, cmd = cls._prepare(command, use_sudo)
+        with cls._span(command, cmd) as span:
+            if cls._dry_run:
+                logger.info("Dry-run: skipping execution")
+                return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+            timeout = cls._timeout(timeout)
+            streaming = cls._streaming(stream, on_line)
+            async with cls._semaphore():
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=str(working_directory) if working_directory else None,
+                    env=env,
+                    **cls._popen_options(),
+                )
+                try:
+                    if streaming:
+                        stdout, stderr = await asyncio.wait_for(
+                            cls._communicate_streaming_async(
+                                proc, on_line or cls._log_line(logger)
+                            ),
+                            timeout,
+                        )
+                    else:
+                        out, err = await asyncio.wait_for(proc.communicate(), timeout)
+                        stdout, stderr = out.decode(errors="replace"), err.decode(errors="replace")
+                except asyncio.TimeoutError:
+                    await cls._terminate_async(proc)
+                    logger.error("Command timed out after %ss: %s", timeout, " ".join(cmd))
+                    raise subprocess.TimeoutExpired(cmd, timeout or 0) from None
+                except asyncio.CancelledError:
+                    await cls._terminate_async(proc)
+                    logger.warning("Command cancelled: %s", " ".join(cmd))
+                    raise
+
+            result = subprocess.CompletedProcess(
+                cmd,
+                proc.returncode if proc.returncode is not None else -1,
+                stdout=stdout,
+                stderr=stderr,
+            )
+            cls._record_exit(span, result.returncode)
+            return cls._finish(logger, result, check, log_output=not streaming)
 
     @classmethod
     def run_as_result(
@@ -95,27 +277,216 @@ class CommandRunner:
         env: dict[str, str] | None = None,
         working_directory: Path | None = None,
         use_sudo: bool = True,
+        stream: bool | None = None,
+        on_line: LineCallback | None = None,
+        timeout: float | None = CONFIGURED_TIMEOUT,
     ) -> Result | None:
         """Executes a command and returns a Result object on failure.
 
+        A timeout is reported as an error result instead of being raised.
+
         Args:
             command (list[str]): Command to execute.
             step (str): The step name reported in the result object.
             env (Optional[dict[str, str]]): Environment variables for the command.
             working_directory (Optional[Path]): Directory in which to run the command.
             use_sudo (bool): Whether to prepend sudo.
+            stream (Optional[bool]): Stream output line by line (see `run`).
+            on_line (Optional[LineCallback]): Receives each output line while streaming.
+            timeout (Optional[float]): Maximum runtime in seconds (see `run`).
 
         Returns:
             Optional[Result]: Result object on failure, otherwise None.
         """
-        res = cls.run(
-            command,
-            env=env,
-            working_directory=working_directory,
-            check=False,
-            use_sudo=use_sudo,
+        try:
+            res = cls.run(
+                command,
+                env=env,
+                working_directory=working_directory,
+                check=False,
+                use_sudo=use_sudo,
+                stream=stream,
+                on_line=on_line,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired as e:
+            return cls._timeout_result(command, step, e.timeout)
+
+        return cls._failure_result(command, step, res)
+
+    @classmethod
+    async def run_as_result_async(
+        cls,
+        command: list[str],
+        step: str,
+        env: dict[str, str] | None = None,
+        working_directory: Path | None = None,
+        use_sudo: bool = True,
+        timeout: float | None = CONFIGURED_TIMEOUT,
+        stream: bool | None = None,
+        on_line: LineCallback | None = None,
+    ) -> Result | None:
+        """Executes a command asynchronously and returns a Result object on failure.
+
+        A timeout is reported as an error result instead of being raised.
+
+        Args:
+            command (list[str]): Command to execute.
+            step (str): The step name reported in the result object.
+            env (Optional[dict[str, str]]): Environment variables for the command.
+            working_directory (Optional[Path]): Directory in which to run the command.
+            use_sudo (bool): Whether to prepend sudo.
+            timeout (Optional[float]): Maximum runtime in seconds (see `run_async`).
+            stream (Optional[bool]): Stream output line by line (see `run_async`).
+            on_line (Optional[LineCallback]): Receives each output line while streaming.
+
+        Returns:
+            Optional[Result]: Result object on failure, otherwise None.
+        """
+        try:
+            res = await cls.run_async(
+                command,
+                env=env,
+                working_directory=working_directory,
+                check=False,
+                use_sudo=use_sudo,
+                timeout=timeout,
+                stream=stream,
+                on_line=on_line,
+            )
+        except subprocess.TimeoutExpired as e:
+            return cls._timeout_result(command, step, e.timeout)
+
+        return cls._failure_result(command, step, res)
+
+    @classmethod
+    def _span(cls, command: list[str], cmd: list[str]) -> AbstractContextManager[Span | None]:
+        """Opens a trace span for a command if a trace is configured.
+
+        Args:
+            command (list[str]): Command as requested by the caller.
+            cmd (list[str]): Command line that is actually executed.
+
+        Returns:
+            AbstractContextManager[Optional[Span]]: Context manager yielding the
+                open span, or None if no trace is configured.
+        """
+        if cls._trace is None:
+            return nullcontext()
+        return cls._trace.span(
+            f"command:{Path(command[0]).name}" if command else "command",
+            "command",
+            **{"process.command_args": list(cmd), "opsflow.dry_run": cls._dry_run},
         )
 
+    @staticmethod
+    def _record_exit(span: Span | None, returncode: int) -> None:
+        """Records the exit code of a command on its span.
+
+        Args:
+            span (Optional[Span]): The command span, if any.
+            returncode (int): Exit code of the command.
+        """
+        if span is None:
+            return
+        span.attributes["process.exit.code"] = returncode
+        if returncode != 0:
+            span.error = f"exit code {returncode}"
+
+    @classmethod
+    def _prepare(
+        cls, command: list[str], use_sudo: bool
+    ) -> tuple[logging.Logger, list[str]]:
+        """Validates the runner configuration and builds the final command line.
+
+        Args:
+            command (list[str]): Command to execute.
+            use_sudo (bool): Whether to prepend 'sudo' to the command.
+
+        Returns:
+            tuple[logging.Logger, list[str]]: The configured logger and the command.
+
+        Raises:
+            RuntimeError: If the runner is not configured.
+        """
+        if cls._logger is None:
+            raise RuntimeError("CommandRunner not configured. Call configure() first.")
+
+        cmd = command.copy()
+        if use_sudo:
+            cmd.insert(0, "sudo")
+
+        # Limits and priorities are inherited across exec, so they are applied
+        # by prefix commands instead of a preexec_fn, which is unsafe in threads
+        config = cls._config
+        if config.cpu_time_limit is not None or config.memory_limit is not None:
+            prefix = ["prlimit"]
+            if config.cpu_time_limit is not None:
+                prefix.append(f"--cpu={config.cpu_time_limit}")
+            if config.memory_limit is not None:
+                prefix.append(f"--as={config.memory_limit}")
+            cmd = [*prefix, "--", *cmd]
+
+        if config.nice is not None:
+            cmd = ["nice", "-n", str(config.nice), *cmd]
+
+        if config.ionice_class is not None:
+            prefix = ["ionice", "-c", _IONICE_CLASSES[config.ionice_class]]
+            if config.ionice_level is not None:
+                prefix += ["-n", str(config.ionice_level)]
+            cmd = prefix + cmd
+
+        cls._logger.debug("RUN: %s", " ".join(cmd))
+        return cls._logger, cmd
+
+    @staticmethod
+    def _finish(
+        logger: logging.Logger,
+        result: subprocess.CompletedProcess,
+        check: bool,
+        log_output: bool = True,
+    ) -> subprocess.CompletedProcess:
+        """Logs the captured output and enforces `check` semantics.
+
+        Args:
+            logger (logging.Logger): Logger used for command tracing.
+            result (subprocess.CompletedProcess): The finished process.
+            check (bool): If True, raises CalledProcessError on non-zero exit code.
+            log_output (bool): Whether to log the captured output. Disabled when
+                the output was already streamed.
+
+        Returns:
+            subprocess.CompletedProcess: The unchanged process result.
+
+        Raises:
+            subprocess.CalledProcessError: If check=True and the command failed.
+        """
+        if log_output and result.stdout:
+            logger.debug("STDOUT: %s", result.stdout.strip())
+        if log_output and result.stderr:
+            logger.debug("STDERR: %s", result.stderr.strip())
+
+        if check and result.returncode != 0:
+            raise subprocess.CalledProcessError(
+                result.returncode, result.args, output=result.stdout, stderr=result.stderr
+            )
+
+        return result
+
+    @classmethod
+    def _failure_result(
+        cls, command: list[str], step: str, res: subprocess.CompletedProcess
+    ) -> Result | None:
+        """Converts a failed process into a Result object.
+
+        Args:
+            command (list[str]): The command as requested by the caller.
+            step (str): The step name reported in the result object.
+            res (subprocess.CompletedProcess): The finished process.
+
+        Returns:
+            Optional[Result]: Result object on failure, otherwise None.
+        """
         if res.returncode != 0:
             message = f"Command {' '.join(command)} failed: {res.stderr.strip()}"
             severity = Severity.ERROR
@@ -126,3 +497,434 @@ class CommandRunner:
             return Result(step=step, severity=severity, message=message)
 
         return None
+
+    @classmethod
+    def _timeout_result(cls, command: list[str], step: str, timeout: float) -> Result:
+        """Builds the Result object for a command that exceeded its timeout.
+
+        Args:
+            command (list[str]): The command as requested by the caller.
+            step (str): The step name reported in the result object.
+            timeout (float): The exceeded timeout in seconds.
+
+        Returns:
+            Result: Error result describing the timeout.
+        """
+        message = f"Command {' '.join(command)} timed out after {timeout}s"
+        if cls._logger:
+            cls._logger.error(message)
+        return Result(step=step, severity=Severity.ERROR, message=message)
+
+    @classmethod
+    def _streaming(cls, stream: bool | None, on_line: LineCallback | None) -> bool:
+        """Resolves whether output should be streamed for a single call.
+
+        Args:
+            stream (Optional[bool]): Per-call override.
+            on_line (Optional[LineCallback]): Per-call line callback.
+
+        Returns:
+            bool: True if output should be streamed.
+        """
+        if stream is not None:
+            return stream
+        return on_line is not None or cls._config.stream_output
+
+    @staticmethod
+    def _log_line(logger: logging.Logger) -> LineCallback:
+        """Builds the default line callback that logs streamed output.
+
+        Args:
+            logger (logging.Logger): Logger used for command tracing.
+
+        Returns:
+            LineCallback: Callback logging each line at debug level.
+        """
+
+        def log(stream: str, line: str) -> None:
+            logger.debug("%s: %s", stream.upper(), line)
+
+        return log
+
+    @classmethod
+    def _timeout(cls, timeout: float | None) -> float | None:
+        """Resolves the timeout of a single call.
+
+        Args:
+            timeout (Optional[float]): Per-call timeout, `CONFIGURED_TIMEOUT` or None.
+
+        Returns:
+            Optional[float]: The timeout in seconds, or None for no timeout.
+        """
+        return cls._config.timeout if timeout is CONFIGURED_TIMEOUT else timeout
+
+    @staticmethod
+    def _popen_options() -> dict[str, Any]:
+        """Builds process creation options that isolate a command.
+
+        Returns:
+            dict[str, Any]: Keyword arguments for `Popen` or
+                `asyncio.create_subprocess_exec`.
+        """
+        if os.name != "posix":
+            return {}
+        return {"start_new_session": True}
+
+    @classmethod
+    def _signal(cls, proc: subprocess.Popen | asyncio.subprocess.Process, sig: int) -> None:
+        """Sends a signal to the process group of a command, or the process itself.
+
+        Args:
+            proc (Popen | asyncio.subprocess.Process): The running process.
+            sig (int): Signal number to send.
+        """
+        if proc.returncode is not None:
+            return
+        try:
+            if os.name == "posix":
+                os.killpg(proc.pid, sig)
+            elif sig == getattr(signal, "SIGKILL", None):
+                proc.kill()
+            else:
+                proc.terminate()
+        except ProcessLookupError:
+            pass
+        except PermissionError:
+            # The group leader runs as another user (e.g. setuid sudo), so the
+            # process itself cannot be signalled either
+            if cls._logger:
+                cls._logger.warning(
+                    "Not permitted to signal command (pid %d) with %s", proc.pid, sig
+                )
+
+    @classmethod
+    def _terminate(cls, proc: subprocess.Popen) -> bool:
+        """Terminates a command with SIGTERM and escalates to SIGKILL.
+
+        Args:
+            proc (subprocess.Popen): The running process.
+
+        Returns:
+            bool: True if the process exited, False if it is left running.
+        """
+        cls._signal(proc, signal.SIGTERM)
+        try:
+            proc.wait(timeout=cls._config.kill_grace_period)
+            return True
+        except subprocess.TimeoutExpired:
+            cls._signal(proc, getattr(signal, "SIGKILL", signal.SIGTERM))
+        try:
+            proc.wait(timeout=_KILL_TIMEOUT)
+            return True
+        except subprocess.TimeoutExpired:
+            cls._report_unkillable(proc.pid)
+            return False
+
+    @classmethod
+    async def _terminate_async(cls, proc: asyncio.subprocess.Process) -> None:
+        """Terminates an async command with SIGTERM and escalates to SIGKILL.
+
+        Args:
+            proc (asyncio.subprocess.Process): The running process.
+        """
+        cls._signal(proc, signal.SIGTERM)
+        try:
+            await asyncio.wait_for(proc.wait(), cls._config.kill_grace_period)
+            return
+        except asyncio.TimeoutError:
+            cls._signal(proc, getattr(signal, "SIGKILL", signal.SIGTERM))
+        try:
+            await asyncio.wait_for(proc.wait(), _KILL_TIMEOUT)
+        except asyncio.TimeoutError:
+            cls._report_unkillable(proc.pid)
+
+    @classmethod
+    def _report_unkillable(cls, pid: int) -> None:
+        """Logs a timed out command that did not exit after SIGKILL.
+
+        Args:
+            pid (int): Process id of the command.
+        """
+        if cls._logger:
+            cls._logger.error(
+                "Command (pid %d) did not exit after SIGKILL; leaving it running", pid
+            )
+
+    @staticmethod
+    def _release(proc: subprocess.Popen, wait: bool) -> None:
+        """Closes the pipes of a process and reaps it.
+
+        Args:
+            proc (subprocess.Popen): The process.
+            wait (bool): Whether to wait for the process to exit. False for a
+                process that could not be terminated.
+        """
+        for pipe in (proc.stdout, proc.stderr):
+            if pipe:
+                with suppress(OSError):
+                    pipe.close()
+        if wait:
+            proc.wait()
+
+    @classmethod
+    def _communicate_streaming(
+        cls, proc: subprocess.Popen, on_line: LineCallback, timeout: float | None
+    ) -> tuple[str, str, bool, bool]:
+        """Forwards the output of a process line by line until it exits.
+
+        Both pipes are read on helper threads, so neither can fill up and block
+        the process. A timer terminates the process if it exceeds `timeout`;
+        if it cannot be terminated, the readers are abandoned.
+
+        Args:
+            proc (subprocess.Popen): The running process.
+            on_line (LineCallback): Receives each output line.
+            timeout (Optional[float]): Maximum runtime in seconds.
+
+        Returns:
+            tuple[str, str, bool, bool]: Retained stdout and stderr tails,
+                whether the process timed out, and whether it exited.
+        """
+        stdout_tail = _OutputTail(cls._config.output_tail_bytes)
+        stderr_tail = _OutputTail(cls._config.output_tail_bytes)
+        timed_out = threading.Event()
+        finished = threading.Event()
+        stopped = [True]
+        errors: list[BaseException] = []
+        remaining = [2]
+        lock = threading.Lock()
+
+        def expire() -> None:
+            timed_out.set()
+            if not cls._terminate(proc):
+                stopped[0] = False
+                finished.set()
+
+        def read(pipe: IO[str] | None, stream: str, tail: _OutputTail) -> None:
+            try:
+                cls._pump(pipe, stream, tail, on_line)
+            except BaseException as e:  # noqa: BLE001 - re-raised on the calling thread
+                errors.append(e)
+            finally:
+                if pipe:
+                    with suppress(OSError):
+                        pipe.close()
+                with lock:
+                    remaining[0] -= 1
+                    if not remaining[0]:
+                        finished.set()
+
+        timer = threading.Timer(timeout, expire) if timeout else None
+        if timer:
+            timer.daemon = True
+            timer.start()
+
+        for pipe, stream, tail in (
+            (proc.stdout, "stdout", stdout_tail),
+            (proc.stderr, "stderr", stderr_tail),
+        ):
+            threading.Thread(target=read, args=(pipe, stream, tail), daemon=True).start()
+        try:
+            finished.wait()
+            if errors:
+                raise errors[0]
+            if stopped[0]:
+                proc.wait()
+        finally:
+            if timer:
+                timer.cancel()
+
+        return stdout_tail.text(), stderr_tail.text(), timed_out.is_set(), stopped[0]
+
+    @staticmethod
+    def _pump(
+        pipe: IO[str] | None, stream: str, tail: "_OutputTail", on_line: LineCallback
+    ) -> None:
+        """Forwards all lines of a text pipe until EOF.
+
+        Reads fixed-size chunks from the underlying binary buffer, so output
+        without line breaks cannot grow without bound.
+
+        Args:
+            pipe (Optional[IO[str]]): The pipe to read from.
+            stream (str): Stream name passed to the callback.
+            tail (_OutputTail): Buffer retaining the output tail.
+            on_line (LineCallback): Receives each output line.
+        """
+        if pipe is None:
+            return
+        splitter = _LineSplitter(_MAX_LINE_BYTES)
+        while chunk := pipe.buffer.read1(_CHUNK_SIZE):
+            for line in splitter.feed(chunk):
+                tail.append(line)
+                on_line(stream, line)
+        for line in splitter.flush():
+            tail.append(line)
+            on_line(stream, line)
+
+    @classmethod
+    async def _communicate_streaming_async(
+        cls, proc: asyncio.subprocess.Process, on_line: LineCallback
+    ) -> tuple[str, str]:
+        """Forwards the output of an async process line by line until it exits.
+
+        Args:
+            proc (asyncio.subprocess.Process): The running process.
+            on_line (LineCallback): Receives each output line.
+
+        Returns:
+            tuple[str, str]: Retained stdout and stderr tails.
+        """
+        stdout_tail = _OutputTail(cls._config.output_tail_bytes)
+        stderr_tail = _OutputTail(cls._config.output_tail_bytes)
+        await asyncio.gather(
+            cls._pump_async(proc.stdout, "stdout", stdout_tail, on_line),
+            cls._pump_async(proc.stderr, "stderr", stderr_tail, on_line),
+        )
+        await proc.wait()
+        return stdout_tail.text(), stderr_tail.text()
+
+    @staticmethod
+    async def _pump_async(
+        reader: asyncio.StreamReader | None,
+        stream: str,
+        tail: "_OutputTail",
+        on_line: LineCallback,
+    ) -> None:
+        """Forwards all lines of an async stream until EOF.
+
+        Reads fixed-size chunks, so arbitrarily long lines do not hit the
+        stream reader's line length limit nor grow without bound.
+
+        Args:
+            reader (Optional[asyncio.StreamReader]): The stream to read from.
+            stream (str): Stream name passed to the callback.
+            tail (_OutputTail): Buffer retaining the output tail.
+            on_line (LineCallback): Receives each output line.
+        """
+        if reader is None:
+            return
+        splitter = _LineSplitter(_MAX_LINE_BYTES)
+        while chunk := await reader.read(_CHUNK_SIZE):
+            for line in splitter.feed(chunk):
+                tail.append(line)
+                on_line(stream, line)
+        for line in splitter.flush():
+            tail.append(line)
+            on_line(stream, line)
+
+    @classmethod
+    def _semaphore(cls) -> asyncio.Semaphore:
+        """Returns the concurrency semaphore bound to the running event loop.
+
+        Returns:
+            asyncio.Semaphore: Semaphore limiting concurrent async commands.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = cls._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(cls._config.max_concurrency)
+            cls._semaphores[loop] = semaphore
+        return semaphore
+
+
+class _OutputTail:
+    """Bounded buffer that retains only the most recent output lines."""
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initializes an empty tail buffer.
+
+        Args:
+            max_bytes (int): Maximum number of bytes to retain.
+        """
+        self.max_bytes = max_bytes
+        self._lines: deque[tuple[str, int]] = deque()
+        self._size = 0
+        self._truncated = False
+
+    def append(self, line: str) -> None:
+        """Appends a line and drops the oldest lines beyond the size limit.
+
+        Sizes are measured in UTF-8 encoded bytes, including a line break.
+
+        Args:
+            line (str): Output line without trailing newline.
+        """
+        encoded = line.encode(errors="replace")
+        # Keep room for the line break, so the end of an over-long line is retained
+        if len(encoded) >= self.max_bytes:
+            self._truncated = True
+            keep = self.max_bytes - 1
+            if keep <= 0:
+                self._lines.clear()
+                self._size = 0
+                return
+            line = encoded[-keep:].decode(errors="ignore")
+            encoded = line.encode()
+        self._lines.append((line, len(encoded) + 1))
+        self._size += len(encoded) + 1
+        while self._size > self.max_bytes and self._lines:
+            _, size = self._lines.popleft()
+            self._size -= size
+            self._truncated = True
+
+    def text(self) -> str:
+        """Returns the retained output.
+
+        Returns:
+            str: The retained lines, prefixed with a marker if output was dropped.
+        """
+        body = "\n".join(line for line, _ in self._lines)
+        if self._truncated:
+            return f"[... output truncated ...]\n{body}"
+        return body
+
+
+class _LineSplitter:
+    """Splits streamed output into lines at LF, CRLF and bare CR line breaks.
+
+    The unterminated rest of the output is kept up to `max_bytes`; only the end
+    of a longer line is retained, as the output tail would drop the rest anyway.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initializes an empty splitter.
+
+        Args:
+            max_bytes (int): Maximum number of bytes retained of an unterminated line.
+        """
+        self._max_bytes = max_bytes
+        self._pending = bytearray()
+        self._after_cr = False
+
+    def feed(self, chunk: bytes) -> list[str]:
+        """Splits a chunk of output.
+
+        Args:
+            chunk (bytes): Output read from the pipe.
+
+        Returns:
+            List[str]: The lines completed by the chunk.
+        """
+        # A \r\n split across two chunks is one line break
+        if self._after_cr and chunk.startswith(b"\n"):
+            chunk = chunk[1:]
+        self._after_cr = chunk.endswith(b"\r")
+        *lines, rest = _LINE_BREAK.split(chunk)
+        if lines:
+            lines[0] = bytes(self._pending) + lines[0]
+            self._pending = bytearray(rest)
+        else:
+            self._pending += rest
+        if len(self._pending) > self._max_bytes:
+            del self._pending[: len(self._pending) - self._max_bytes]
+        return [line.decode(errors="replace") for line in lines]
+
+    def flush(self) -> list[str]:
+        """Returns the unterminated rest of the output.
+
+        Returns:
+            List[str]: The last line, if the output did not end with a line break.
+        """
+        pending, self._pending = self._pending, bytearray()
+        return [pending.decode(errors="replace")] if pending else []
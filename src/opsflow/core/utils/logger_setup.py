@@ -1,49 +1,305 @@
+import copy
+import heapq
+import itertools
+import json
 import logging
-from io import StringIO
-from logging.handlers import RotatingFileHandler
+import queue
+import time
+from collections import deque
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any
 
-from ..config.schema import LoggingConfig
+from ..config.schema import LogFormat, LoggingConfig
+from ..models.trace import Trace
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_DEFAULT_FORMATTER = logging.Formatter()
 
 
 class MemoryLogHandler(logging.Handler):
-    """Logging handler that stores log records in an in-memory buffer."""
+    """Logging handler that keeps a bounded buffer of log records for reports.
+
+    All records of level WARNING and above are kept. Records below WARNING are
+    kept in a ring buffer limited by record count and (approximate) message
+    size; the oldest of them are dropped first. Records are stored unformatted
+    and only formatted when the buffer is read.
+    """
+
+    def __init__(self, max_records: int = 1000, max_bytes: int = 1024 * 1024):
+        """Initializes the in-memory logging buffer.
 
-    def __init__(self):
-        """Initializes the in-memory logging buffer."""
+        Args:
+            max_records (int): Maximum number of retained records below WARNING.
+            max_bytes (int): Maximum approximate message size in bytes of the
+                retained records below WARNING.
+        """
         super().__init__()
-        self._buffer = StringIO()
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self._seq = itertools.count()
+        self._important: list[tuple[int, logging.LogRecord]] = []
+        self._recent: deque[tuple[int, logging.LogRecord, int]] = deque()
+        self._recent_bytes = 0
+        self._dropped = 0
 
     def emit(self, record: logging.LogRecord) -> None:
-        """Stores a formatted log entry in the internal buffer.
+        """Stores a log record in the internal buffer.
+
+        Exception information is rendered immediately, so the buffer does not
+        keep tracebacks (and the frames they reference) alive.
 
         Args:
             record (logging.LogRecord): Log record to store.
         """
-        self._buffer.write(self.format(record) + "\n")
+        if record.exc_info:
+            record = copy.copy(record)
+            if not record.exc_text:
+                record.exc_text = (self.formatter or _DEFAULT_FORMATTER).formatException(
+                    record.exc_info
+                )
+            record.exc_info = None
+
+        seq = next(self._seq)
+        if record.levelno >= logging.WARNING:
+            self._important.append((seq, record))
+            return
+
+        size = self._size(record)
+        self._recent.append((seq, record, size))
+        self._recent_bytes += size
+        while self._recent and (
+            len(self._recent) > self.max_records or self._recent_bytes > self.max_bytes
+        ):
+            _, _, dropped_size = self._recent.popleft()
+            self._recent_bytes -= dropped_size
+            self._dropped += 1
 
     def get_value(self) -> str:
-        """Returns the concatenated log messages.
+        """Returns the formatted log messages in logging order.
 
         Returns:
-            str: All collected log messages.
+            str: All retained log messages, preceded by a note if records
+                were dropped.
         """
-        return self._buffer.getvalue()
+        self.acquire()
+        try:
+            important = list(self._important)
+            recent = [(seq, record) for seq, record, _ in self._recent]
+            dropped = self._dropped
+        finally:
+            self.release()
+
+        lines = []
+        if dropped:
+            lines.append(f"[... {dropped} DEBUG/INFO log records dropped ...]")
+        lines.extend(
+            self.format(record) for _, record in heapq.merge(important, recent, key=lambda e: e[0])
+        )
+        return "".join(line + "\n" for line in lines)
 
     def clear(self) -> None:
         """Clears the stored log messages."""
-        self._buffer = StringIO()
+        self.acquire()
+        try:
+            self._important = []
+            self._recent.clear()
+            self._recent_bytes = 0
+            self._dropped = 0
+        finally:
+            self.release()
+
+    @staticmethod
+    def _size(record: logging.LogRecord) -> int:
+        """Estimates the size of a record's message without formatting it.
+
+        Args:
+            record (logging.LogRecord): The log record.
+
+        Returns:
+            int: Approximate message size in characters.
+        """
+        size = len(record.msg) if isinstance(record.msg, str) else 64
+        args = record.args if isinstance(record.args, tuple) else (record.args,)
+        for arg in args or ():
+            size += len(arg) if isinstance(arg, (str, bytes)) else 16
+        return size
+
+
+class QueueLogHandler(QueueHandler):
+    """Queue handler that forwards records to handlers on a background thread.
+
+    Logging threads only enqueue records; formatting and I/O happen on the
+    listener thread owned by this handler. Records are enqueued unformatted, so
+    handlers that defer formatting (like `MemoryLogHandler`) stay lazy.
+    """
+
+    def __init__(self, *handlers: logging.Handler) -> None:
+        """Initializes the queue and starts the listener thread.
+
+        Args:
+            *handlers (logging.Handler): Handlers receiving the queued records.
+        """
+        self._queue: queue.Queue[logging.LogRecord | None] = queue.Queue()
+        super().__init__(self._queue)
+        self.listener = QueueListener(self._queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        self._running = True
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Returns the record unchanged; formatting is left to the target handlers.
+
+        Args:
+            record (logging.LogRecord): Log record to enqueue.
+
+        Returns:
+            logging.LogRecord: The same record.
+        """
+        return record
+
+    def flush(self) -> None:
+        """Blocks until all enqueued records have been handled and flushes the handlers."""
+        if not self._running:
+            return
+        self._queue.join()
+        for handler in self.listener.handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        """Handles all pending records and stops the listener thread."""
+        if self._running:
+            self._running = False
+            self.listener.stop()
+        super().close()
+
+
+class RunContextFilter(logging.Filter):
+    """Attaches the workflow run context to log records.
+
+    The context is captured in the logging thread, so it is also available to
+    handlers that format records later or on another thread. Attributes that
+    are already set (e.g. via `extra`) are kept.
+
+    Sets:
+        run_id: Identifier of the current trace.
+        step: Name of the innermost open span.
+        duration: Seconds elapsed since that span started.
+    """
 
+    def __init__(self, trace: Trace) -> None:
+        """Initializes the filter.
 
-def setup_logger(config: LoggingConfig) -> tuple[logging.Logger, MemoryLogHandler]:
+        Args:
+            trace (Trace): Trace of the workflow run.
+        """
+        super().__init__()
+        self.trace = trace
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Adds the run context to the record.
+
+        Args:
+            record (logging.LogRecord): Log record to enrich.
+
+        Returns:
+            bool: Always True.
+        """
+        if not hasattr(record, "run_id"):
+            record.run_id = self.trace.trace_id
+        if not hasattr(record, "step"):
+            span = self.trace.current()
+            record.step = span.name if span else None
+            if not hasattr(record, "duration"):
+                record.duration = time.monotonic() - span.start if span else None
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats log records as single-line JSON objects.
+
+    Besides time, level, logger and message, every line contains the plugin (or
+    notifier) name of component loggers, the thread and the run context added by
+    `RunContextFilter`. Uses `orjson` for serialization if it is installed.
+    """
+
+    def __init__(self, root_logger: str) -> None:
+        """Initializes the formatter.
+
+        Args:
+            root_logger (str): Name of the application logger; the name of a
+                child logger relative to it is reported as plugin.
+        """
+        super().__init__()
+        self._prefix = f"{root_logger}."
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Formats a record as JSON.
+
+        Args:
+            record (logging.LogRecord): Log record to format.
+
+        Returns:
+            str: The JSON line without trailing newline.
+        """
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "plugin": (
+                record.name[len(self._prefix) :] if record.name.startswith(self._prefix) else None
+            ),
+            "thread": record.threadName,
+            "run_id": getattr(record, "run_id", None),
+            "step": getattr(record, "step", None),
+            "duration": getattr(record, "duration", None),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return self.serialize(entry)
+
+    @staticmethod
+    def serialize(entry: dict[str, Any]) -> str:
+        """Serializes a log entry to compact JSON.
+
+        Args:
+            entry (dict[str, Any]): The log entry.
+
+        Returns:
+            str: The serialized entry.
+        """
+        if orjson is not None:
+            return orjson.dumps(entry, default=str).decode()
+        return json.dumps(entry, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+def setup_logger(
+    config: LoggingConfig, trace: Trace | None = None
+) -> tuple[logging.Logger, MemoryLogHandler]:
     """Creates and configures the application logger.
 
     This logger writes to a rotating file, the console, and an in-memory handler
-    used for report emails.
+    used for report emails. With `config.queue`, these handlers run on a
+    background thread behind a `QueueLogHandler`; call `flush()` on the logger's
+    handlers to wait until all records have been handled.
+
+    With the JSON format, the file and console output are JSON lines enriched
+    with the run context of `trace`; the report excerpt stays text.
 
     Args:
         config (LoggingConfig):
             Logging configuration
+        trace (Optional[Trace]):
+            Trace of the workflow run, used for the run context of JSON logs.
 
     Returns:
         tuple[logging.Logger, MemoryLogHandler]:
@@ -58,6 +314,9 @@ def setup_logger(config: LoggingConfig) -> tuple[logging.Logger, MemoryLogHandle
     formatter = logging.Formatter(
         fmt="[%(asctime)s] %(levelname)s: %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
     )
+    output_formatter = (
+        JsonFormatter(root_logger=logger.name) if config.format == LogFormat.JSON else formatter
+    )
 
     # Ensure directory exists
     log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -66,20 +325,34 @@ def setup_logger(config: LoggingConfig) -> tuple[logging.Logger, MemoryLogHandle
     file_handler = RotatingFileHandler(
         log_path, maxBytes=5 * 1024 * 1024, backupCount=5, encoding="utf-8"
     )
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(output_formatter)
     file_handler.setLevel(logging.DEBUG if config.debug else logging.INFO)
-    logger.addHandler(file_handler)
+    handlers: list[logging.Handler] = [file_handler]
 
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(output_formatter)
     console_handler.setLevel(logging.DEBUG if config.debug else logging.INFO)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # Memory handler
-    memory_handler = MemoryLogHandler()
+    memory_handler = MemoryLogHandler(
+        max_records=config.memory_max_records, max_bytes=config.memory_max_bytes
+    )
     memory_handler.setFormatter(formatter)
     memory_handler.setLevel(logging.DEBUG if config.debug else logging.INFO)
-    logger.addHandler(memory_handler)
+    handlers.append(memory_handler)
+
+    if config.queue:
+        handlers = [QueueLogHandler(*handlers)]
+
+    # Capture the run context in the logging thread
+    if config.format == LogFormat.JSON and trace is not None:
+        context_filter = RunContextFilter(trace)
+        for handler in handlers:
+            handler.addFilter(context_filter)
+
+    for handler in handlers:
+        logger.addHandler(handler)
 
     return logger, memory_handler
@@ -0,0 +1,159 @@
+import contextlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from ..models.metrics import MetricSample, MetricsCollector
+from ..models.result import Result, Severity
+from ..models.trace import Trace
+
+_LAST_SUCCESS = "opsflow_last_success_timestamp_seconds"
+
+
+class PrometheusTextfileExporter:
+    """Writes workflow run metrics in the Prometheus text exposition format.
+
+    The file is meant for the textfile collector of the node exporter. It is
+    replaced atomically, so the collector never reads a partially written file.
+    Besides the metrics reported by components, the exporter derives run-level
+    metrics from the results and the trace of the run.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initializes the exporter.
+
+        Args:
+            path (str): Target file, e.g. "/var/lib/node_exporter/textfile/opsflow.prom".
+        """
+        self.path = Path(path)
+
+    def export(self, results: list[Result], trace: Trace, metrics: MetricsCollector) -> None:
+        """Writes the metrics of a finished workflow run.
+
+        A run is successful if it produced no ERROR results. The last-success
+        timestamp of a failed run is carried over from the previous file.
+
+        Args:
+            results (List[Result]): Results of the run.
+            trace (Trace): Timing trace of the run.
+            metrics (MetricsCollector): Metrics reported by components.
+        """
+        now = time.time()
+        succeeded = all(r.severity != Severity.ERROR for r in results)
+        run = MetricsCollector()
+
+        workflow = trace.find("workflow")
+        if workflow is not None and workflow.duration is not None:
+            run.set(
+                "opsflow_run_duration_seconds",
+                workflow.duration,
+                help="Duration of the last workflow run.",
+            )
+        for span in trace.spans(category="plugin"):
+            run.set(
+                "opsflow_plugin_duration_seconds",
+                span.duration or 0.0,
+                help="Duration of each plugin in the last workflow run.",
+                plugin=span.name.removeprefix("plugin:"),
+            )
+        for severity in Severity:
+            run.set(
+                "opsflow_results",
+                sum(1 for r in results if r.severity == severity),
+                help="Number of results of the last workflow run by severity.",
+                severity=severity.name.lower(),
+            )
+        run.set(
+            "opsflow_run_success",
+            1 if succeeded else 0,
+            help="Whether the last workflow run produced no errors.",
+        )
+        run.set(
+            "opsflow_run_timestamp_seconds",
+            now,
+            help="UNIX time at which the last workflow run finished.",
+        )
+        last_success = now if succeeded else self._previous_last_success()
+        if last_success is not None:
+            run.set(_LAST_SUCCESS, last_success, help="UNIX time of the last successful run.")
+
+        samples = sorted(run.samples() + metrics.samples(), key=lambda s: (s.name, s.labels))
+        self._write(self.render(samples))
+
+    @classmethod
+    def render(cls, samples: list[MetricSample]) -> str:
+        """Renders samples in the Prometheus text exposition format.
+
+        Args:
+            samples (List[MetricSample]): Samples to render; series of the same
+                metric must be adjacent.
+
+        Returns:
+            str: The rendered metrics.
+        """
+        lines: list[str] = []
+        current = None
+        for sample in samples:
+            if sample.name != current:
+                current = sample.name
+                if sample.help:
+                    lines.append(f"# HELP {sample.name} {cls._escape(sample.help)}")
+                lines.append(f"# TYPE {sample.name} gauge")
+            labels = ",".join(
+                f'{key}="{cls._escape(value, quotes=True)}"' for key, value in sample.labels
+            )
+            series = f"{sample.name}{{{labels}}}" if labels else sample.name
+            lines.append(f"{series} {sample.value:.17g}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _escape(text: str, quotes: bool = False) -> str:
+        """Escapes HELP texts and label values.
+
+        Args:
+            text (str): Text to escape.
+            quotes (bool): Also escape double quotes (label values).
+
+        Returns:
+            str: The escaped text.
+        """
+        text = text.replace("\\", "\\\\").replace("\n", "\\n")
+        return text.replace('"', '\\"') if quotes else text
+
+    def _previous_last_success(self) -> float | None:
+        """Reads the last-success timestamp from the previously written file.
+
+        Returns:
+            Optional[float]: The timestamp, or None if unavailable.
+        """
+        try:
+            content = self.path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        for line in content.splitlines():
+            name, _, value = line.partition(" ")
+            if name == _LAST_SUCCESS:
+                with contextlib.suppress(ValueError):
+                    return float(value)
+        return None
+
+    def _write(self, content: str) -> None:
+        """Atomically replaces the target file.
+
+        Args:
+            content (str): New file content.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
@@ -1,28 +1,67 @@
+import ast
+import contextlib
+import hashlib
 import importlib
+import json
+import os
 import pathlib
 import sys
+import tempfile
 import types
+from collections.abc import Collection
+from importlib.metadata import entry_points
+from typing import Any
+
+MANIFEST_NAME = ".opsflow-manifest.json"
+_MANIFEST_VERSION = 2
+_REGISTER_METHODS = frozenset({"register", "register_class"})
 
 
 class ModuleLoader:
     """Utility class to dynamically load Python modules from directories."""
 
     @staticmethod
-    def load_from_directory(path: str, package: str | None = None) -> None:
+    def load_from_directory(
+        path: str,
+        package: str | None = None,
+        names: Collection[str] | None = None,
+        manifest: str | None = None,
+    ) -> None:
         """
         Import all Python modules from the given directory.
 
+        With `names`, only modules that register one of these components are
+        imported. Which module registers which component is determined without
+        importing it (see `scan_directory`); modules that register components
+        dynamically are always imported.
+
         Args:
             path (str): Filesystem path (relative or absolute) to the directory.
             package (Optional[str]): Python package prefix. Defaults to folder name.
+            names (Optional[Collection[str]]): Component names to load. All
+                modules are imported if None.
+            manifest (Optional[str]): Manifest cache file used with `names`.
+                Defaults to `.opsflow-manifest.json` in the directory.
 
         Raises:
             ImportError: If a module fails to import.
         """
         directory = pathlib.Path(path).resolve()
 
+        files = sorted(f for f in directory.glob("*.py") if f.name != "__init__.py")
+        if names is not None:
+            wanted = set(names)
+            scanned = ModuleLoader.scan_directory(str(directory), manifest=manifest)
+            files = [
+                f
+                for f in files
+                if scanned[f.name]["dynamic"]
+                or any(c["name"] in wanted for c in scanned[f.name]["components"])
+            ]
+
         runtime_root = "__opsflow_runtime__"
-        runtime_ns = f"{runtime_root}.{hash(directory)}"
+        # Stable across processes, so classes of loaded modules can be pickled
+        runtime_ns = f"{runtime_root}.{hashlib.sha256(str(directory).encode()).hexdigest()[:16]}"
 
         if runtime_root not in sys.modules:
             root_pkg = types.ModuleType(runtime_root)
@@ -39,10 +78,7 @@ class ModuleLoader:
             sys.path.insert(0, parent_dir)
 
         try:
-            for file in directory.glob("*.py"):
-                if file.name == "__init__.py":
-                    continue
-
+            for file in files:
                 full_name = f"{runtime_ns}.{file.stem}"
                 if full_name in sys.modules:
                     continue
@@ -51,3 +87,217 @@ class ModuleLoader:
         finally:
             if parent_dir in sys.path:
                 sys.path.remove(parent_dir)
+
+    @staticmethod
+    def scan_directory(path: str, manifest: str | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Determine the components registered by every module of a directory.
+
+        Modules are parsed, not imported: classes decorated with a registry's
+        `register(...)` and a literal `name` are recorded with their config
+        class. Modules calling `register_class(...)` or registering classes
+        without a literal name are marked as dynamic. Results are cached in a
+        manifest and reused while a module's mtime and size, or else its
+        content hash, are unchanged. An unwritable manifest is not an error.
+
+        Args:
+            path (str): Filesystem path to the directory.
+            manifest (Optional[str]): Manifest cache file. Defaults to
+                `.opsflow-manifest.json` in the directory.
+
+        Returns:
+            dict[str, dict[str, Any]]: Mapping of file names to their manifest
+                entry with `mtime_ns`, `size`, `sha256`, `dynamic` and
+                `components` (each with `name`, `class` and `config`).
+        """
+        directory = pathlib.Path(path).resolve()
+        manifest_path = pathlib.Path(manifest) if manifest else directory / MANIFEST_NAME
+
+        cached: dict[str, dict[str, Any]] = {}
+        with contextlib.suppress(OSError, ValueError):
+            data = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if data.get("version") == _MANIFEST_VERSION and data.get("directory") == str(
+                directory
+            ):
+                cached = data["files"]
+
+        files: dict[str, dict[str, Any]] = {}
+        for file in sorted(directory.glob("*.py")):
+            if file.name == "__init__.py":
+                continue
+            stat = file.stat()
+            entry = cached.get(file.name)
+            if entry and (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size):
+                files[file.name] = entry
+                continue
+
+            content = file.read_bytes()
+            digest = hashlib.sha256(content).hexdigest()
+            if entry and entry["sha256"] == digest:
+                entry = {**entry, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            else:
+                dynamic, components = ModuleLoader._scan_source(content, file)
+                entry = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "sha256": digest,
+                    "dynamic": dynamic,
+                    "components": components,
+                }
+            files[file.name] = entry
+
+        if files != cached:
+            ModuleLoader._write_manifest(
+                manifest_path,
+                {"version": _MANIFEST_VERSION, "directory": str(directory), "files": files},
+            )
+        return files
+
+    @staticmethod
+    def load_entry_points(group: str, names: Collection[str] | None = None) -> dict[str, Any]:
+        """
+        Load components published by installed distributions as entry points.
+
+        Args:
+            group (str): Entry point group, e.g. "opsflow.plugins".
+            names (Optional[Collection[str]]): Entry point names to load. All
+                entry points of the group are loaded if None.
+
+        Returns:
+            dict[str, Any]: Mapping of entry point names to the loaded objects.
+
+        Raises:
+            ImportError: If an entry point fails to import.
+        """
+        loaded = {}
+        for ep in entry_points(group=group):
+            if names is None or ep.name in names:
+                loaded[ep.name] = ep.load()
+        return loaded
+
+    @staticmethod
+    def _scan_source(content: bytes, file: pathlib.Path) -> tuple[bool, list[dict[str, Any]]]:
+        """
+        Find the components registered by a module's source.
+
+        Only `@<Registry>.register(...)` decorators of top-level classes are
+        understood. Any other reference to a registry or its `register` methods
+        (an imported bare decorator, registration inside a function or an `if`,
+        `register_class` calls) marks the module as dynamic, so it is imported
+        instead of being skipped.
+
+        Args:
+            content (bytes): Source code of the module.
+            file (pathlib.Path): Path of the module, used in syntax errors.
+
+        Returns:
+            tuple[bool, list[dict[str, Any]]]: Whether the module registers
+                components dynamically, and the statically registered components.
+        """
+        try:
+            tree = ast.parse(content, filename=str(file))
+        except SyntaxError:
+            # Importing the module reports the error
+            return True, []
+
+        understood: set[int] = set()
+        components = []
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            for decorator in node.decorator_list:
+                if not (
+                    isinstance(decorator, ast.Call)
+                    and isinstance(decorator.func, ast.Attribute)
+                    and decorator.func.attr == "register"
+                    and isinstance(decorator.func.value, ast.Name)
+                ):
+                    continue
+                name = ModuleLoader._class_name_attribute(node)
+                if name is None:
+                    # Left unmarked, so the module is treated as dynamic
+                    continue
+                understood.update((id(decorator.func), id(decorator.func.value)))
+                config = decorator.args[0] if decorator.args else None
+                for keyword in decorator.keywords:
+                    if keyword.arg == "config":
+                        config = keyword.value
+                components.append(
+                    {
+                        "name": name,
+                        "class": node.name,
+                        "config": ast.unparse(config) if config is not None else None,
+                    }
+                )
+
+        dynamic = any(
+            id(node) not in understood and ModuleLoader._references_registry(node)
+            for node in ast.walk(tree)
+        )
+        return dynamic, components
+
+    @staticmethod
+    def _references_registry(node: ast.AST) -> bool:
+        """
+        Check whether a syntax node refers to a registry or its registration methods.
+
+        Args:
+            node (ast.AST): The node.
+
+        Returns:
+            bool: True for `register`/`register_class` names, attributes and
+                imports, and for names of `*Registry` classes outside imports.
+        """
+        if isinstance(node, ast.Attribute):
+            return node.attr in _REGISTER_METHODS
+        if isinstance(node, ast.alias):
+            return node.name.rpartition(".")[2] in _REGISTER_METHODS
+        if isinstance(node, ast.Name):
+            return node.id in _REGISTER_METHODS or node.id.endswith("Registry")
+        return False
+
+    @staticmethod
+    def _class_name_attribute(node: ast.ClassDef) -> str | None:
+        """
+        Return the literal value of a class's `name` attribute.
+
+        Args:
+            node (ast.ClassDef): The class definition.
+
+        Returns:
+            Optional[str]: The name, or None if it is not a string literal.
+        """
+        for stmt in node.body:
+            if isinstance(stmt, ast.Assign):
+                targets, value = stmt.targets, stmt.value
+            elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+                targets, value = [stmt.target], stmt.value
+            else:
+                continue
+            if any(isinstance(t, ast.Name) and t.id == "name" for t in targets):
+                if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                    return value.value
+                return None
+        return None
+
+    @staticmethod
+    def _write_manifest(path: pathlib.Path, data: dict[str, Any]) -> None:
+        """
+        Atomically write the manifest, ignoring unwritable locations.
+
+        Args:
+            path (pathlib.Path): Manifest file.
+            data (dict[str, Any]): Manifest content.
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
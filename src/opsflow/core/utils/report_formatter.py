@@ -1,16 +1,27 @@
-from ..models import Result, Severity
+from ..models import Result, ResultCollector, Severity, Span, Trace
 
 
 class ReportFormatter:
     """Formats workflow results into a report."""
 
-    def __init__(self, results: list[Result]) -> None:
-        """Initializes the Report Formatter with a list of results.
+    LOGS_SECTION = "\n\nLogs:\n-----\n"
+    """Separator between the summary (with timings) and the logs of a report."""
+
+    def __init__(
+        self, results: ResultCollector | list[Result], trace: Trace | None = None
+    ) -> None:
+        """Initializes the Report Formatter with the results of a run.
 
         Args:
-            results (List[Result]): List of Result objects to format.
+            results (ResultCollector | List[Result]): Collected results to format.
+            trace (Optional[Trace]): Timing trace of the workflow run.
         """
+        if not isinstance(results, ResultCollector):
+            collector = ResultCollector()
+            collector.add_all(results)
+            results = collector
         self.results = results
+        self.trace = trace
 
     def summary(self) -> str:
         """Creates a compact multi-line summary of results.
@@ -18,36 +29,80 @@ class ReportFormatter:
         Returns:
             str: A simple result summary grouped by severity.
         """
-        if not self.results:
+        if not self.results.count():
             return "No workflow results available."
 
         lines = ["Maintenance Summary", "====================", ""]
 
         for severity in sorted(Severity, key=lambda s: s.value, reverse=True):
-            section = [r for r in self.results if r.severity == severity]
-            if not section:
+            if not self.results.count(severity):
                 continue
 
             lines.append(f"{severity.name}:")
             lines.append("-" * (len(severity.name) + 1))
 
-            for r in section:
+            for r in self.results.iter_results(severity):
                 lines.append(f"  Step:    {r.step}")
                 lines.append(f"  Message: {r.message}")
                 lines.append("")
 
         return "\n".join(lines)
 
+    def timings(self) -> str:
+        """Creates a table of all finished spans of the trace.
+
+        Spans are listed in start order and indented below their parent span.
+        Spans that are still open are not included.
+
+        Returns:
+            str: The timing table, or an empty string if no spans were recorded.
+        """
+        if self.trace is None:
+            return ""
+
+        spans = self.trace.spans()
+        finished = {span.span_id for span in spans}
+
+        # Spans of a still open parent (e.g. the running workflow) are shown
+        # at the top level
+        children: dict[int | None, list[Span]] = {}
+        for span in spans:
+            parent_id = span.parent_id if span.parent_id in finished else None
+            children.setdefault(parent_id, []).append(span)
+
+        rows: list[tuple[str, Span]] = []
+
+        def visit(parent_id: int | None, depth: int) -> None:
+            for span in children.get(parent_id, []):
+                rows.append(("  " * depth + span.name, span))
+                visit(span.span_id, depth + 1)
+
+        visit(None, 0)
+        if not rows:
+            return ""
+
+        width = max(len(label) for label, _ in rows)
+        lines = []
+        for label, span in rows:
+            line = f"  {label:<{width}}  {span.duration or 0.0:>9.3f}s"
+            if span.error:
+                line += "  (failed)"
+            lines.append(line)
+        return "\n".join(lines)
+
     def format_report(self, logs: str = "") -> str:
-        """Formats all results along with logs into a full report.
+        """Formats all results along with timings and logs into a full report.
 
         Args:
             logs (str): Optional log string to append.
 
         Returns:
-            str: Formatted workflow report with summary and logs.
+            str: Formatted workflow report with summary, timings and logs.
         """
         report = self.summary()
-        report += "\n\nLogs:\n-----\n"
+        timings = self.timings()
+        if timings:
+            report += "\n\nTimings:\n--------\n" + timings
+        report += self.LOGS_SECTION
         report += logs.strip() if logs else "(No logs available)"
         return report
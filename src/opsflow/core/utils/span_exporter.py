@@ -0,0 +1,168 @@
+import json
+import socket
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+from ... import __version__
+from ..models.trace import Span, Trace
+
+# OTLP span kind and status codes
+_SPAN_KIND_INTERNAL = 1
+_STATUS_CODE_UNSET = 0
+_STATUS_CODE_ERROR = 2
+
+
+class SpanExporter(ABC):
+    """Abstract base class for exporters of workflow traces."""
+
+    @abstractmethod
+    def export(self, trace: Trace) -> None:
+        """Exports all finished spans of a trace.
+
+        Args:
+            trace (Trace): The trace of a workflow run.
+        """
+
+
+class OtlpJsonEncoder:
+    """Encodes traces as OTLP/JSON `ExportTraceServiceRequest` documents."""
+
+    @classmethod
+    def encode(cls, trace: Trace, service_name: str = "opsflow") -> dict[str, Any]:
+        """Encodes all finished spans of a trace.
+
+        Args:
+            trace (Trace): The trace to encode.
+            service_name (str): Value of the `service.name` resource attribute.
+
+        Returns:
+            dict[str, Any]: The OTLP/JSON document.
+        """
+        resource = {
+            "service.name": service_name,
+            "service.version": __version__,
+            "host.name": socket.gethostname(),
+        }
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": cls._attributes(resource)},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "opsflow", "version": __version__},
+                            "spans": [cls._span(trace, span) for span in trace.spans()],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    @classmethod
+    def _span(cls, trace: Trace, span: Span) -> dict[str, Any]:
+        """Encodes a single span.
+
+        Args:
+            trace (Trace): The trace the span belongs to.
+            span (Span): The span to encode.
+
+        Returns:
+            dict[str, Any]: The OTLP/JSON span.
+        """
+        status: dict[str, Any] = {"code": _STATUS_CODE_UNSET}
+        if span.error:
+            status = {"code": _STATUS_CODE_ERROR, "message": span.error}
+
+        return {
+            "traceId": trace.trace_id,
+            "spanId": f"{span.span_id:016x}",
+            "parentSpanId": f"{span.parent_id:016x}" if span.parent_id else "",
+            "name": span.name,
+            "kind": _SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": cls._nanos(trace, span.start),
+            "endTimeUnixNano": cls._nanos(trace, span.end if span.end is not None else span.start),
+            "attributes": cls._attributes({"opsflow.category": span.category, **span.attributes}),
+            "status": status,
+        }
+
+    @staticmethod
+    def _nanos(trace: Trace, monotonic: float) -> str:
+        """Converts a monotonic timestamp of the trace into UNIX nanoseconds.
+
+        Args:
+            trace (Trace): The trace the timestamp belongs to.
+            monotonic (float): Monotonic time in seconds.
+
+        Returns:
+            str: UNIX time in nanoseconds, encoded as string like all 64-bit
+                integers in OTLP/JSON.
+        """
+        return str(int((trace.origin + monotonic) * 1_000_000_000))
+
+    @classmethod
+    def _attributes(cls, attributes: dict[str, Any]) -> list[dict[str, Any]]:
+        """Encodes attributes as OTLP key-value list.
+
+        Args:
+            attributes (dict[str, Any]): Attribute names and values.
+
+        Returns:
+            list[dict[str, Any]]: The OTLP/JSON attributes.
+        """
+        return [
+            {"key": key, "value": cls._value(value)}
+            for key, value in attributes.items()
+            if value is not None
+        ]
+
+    @classmethod
+    def _value(cls, value: Any) -> dict[str, Any]:
+        """Encodes a single attribute value as OTLP `AnyValue`.
+
+        Args:
+            value (Any): The attribute value.
+
+        Returns:
+            dict[str, Any]: The OTLP/JSON value.
+        """
+        if isinstance(value, bool):
+            return {"boolValue": value}
+        if isinstance(value, int):
+            return {"intValue": str(value)}
+        if isinstance(value, float):
+            return {"doubleValue": value}
+        if isinstance(value, (list, tuple)):
+            return {"arrayValue": {"values": [cls._value(v) for v in value]}}
+        return {"stringValue": str(value)}
+
+
+class OtlpJsonFileExporter(SpanExporter):
+    """Appends traces to a file in the OTLP/JSON file format.
+
+    Every exported trace is written as a single line, as read by the
+    OpenTelemetry Collector's `otlpjsonfile` receiver.
+    """
+
+    def __init__(self, path: str, service_name: str = "opsflow") -> None:
+        """Initializes the exporter.
+
+        Args:
+            path (str): File to append the traces to.
+            service_name (str): Value of the `service.name` resource attribute.
+        """
+        self.path = Path(path)
+        self.service_name = service_name
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        """Appends all finished spans of a trace as one OTLP/JSON line.
+
+        Args:
+            trace (Trace): The trace of a workflow run.
+        """
+        line = json.dumps(OtlpJsonEncoder.encode(trace, self.service_name), separators=(",", ":"))
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
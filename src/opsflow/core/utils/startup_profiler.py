@@ -0,0 +1,228 @@
+import importlib.abc
+import json
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from ..models.trace import Trace
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """Time spent importing a single module.
+
+    Attributes:
+        module (str): Fully qualified module name.
+        duration (float): Time in seconds including nested imports.
+        self_duration (float): Time in seconds excluding nested imports.
+    """
+
+    module: str
+    duration: float
+    self_duration: float
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Loader proxy that times `exec_module` of the wrapped loader.
+
+    Every other attribute is delegated, so the proxy can stay on the imported
+    module as its `__loader__`.
+    """
+
+    def __init__(self, loader, timer: "_ImportTimer", fullname: str) -> None:
+        self._loader = loader
+        self._timer = timer
+        self._fullname = fullname
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        create_module = getattr(self._loader, "create_module", None)
+        return create_module(spec) if create_module else None
+
+    def exec_module(self, module) -> None:
+        stack = self._timer._stack()
+        frame = [0.0]
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += duration
+            self._timer._profiler._record_import(
+                ImportTiming(self._fullname, duration, duration - frame[0])
+            )
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path finder that times the execution of every imported module.
+
+    It does not find modules itself: it asks the remaining finders and returns
+    their spec with the loader wrapped in a timing proxy. Loaders themselves
+    are never modified, as they may be shared between modules.
+    """
+
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        loader = spec.loader
+        # Class-level loaders (builtin, frozen) are shared and fast; skip them
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return spec
+
+        spec.loader = _TimedLoader(loader, self, fullname)
+        return spec
+
+    def _stack(self) -> list[list[float]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+class StartupProfiler:
+    """Records where the startup of a workflow spends its time.
+
+    Phase timings are taken from the spans of the workflow trace; module import
+    timings are recorded while the profiler is running. Modules imported before
+    `start()` are not included, so start the profiler before importing heavy
+    dependencies to see them.
+    """
+
+    def __init__(self) -> None:
+        """Initializes a stopped profiler."""
+        self._timer = _ImportTimer(self)
+        self._imports: list[ImportTiming] = []
+        self._lock = threading.Lock()
+        self._started: float | None = None
+        self._stopped: float | None = None
+        self._phases: list[tuple[str, float]] = []
+
+    def start(self) -> None:
+        """Starts timing module imports."""
+        if self._timer not in sys.meta_path:
+            sys.meta_path.insert(0, self._timer)
+        self._started = time.perf_counter()
+
+    def stop(self, trace: Trace | None = None) -> None:
+        """Stops timing module imports and records the startup phases.
+
+        Args:
+            trace (Optional[Trace]): Trace whose finished "phase" spans are
+                recorded as phases.
+        """
+        self._stopped = time.perf_counter()
+        if self._timer in sys.meta_path:
+            sys.meta_path.remove(self._timer)
+        if trace is not None:
+            self._phases = [(span.name, span.duration) for span in trace.spans("phase")]
+
+    @property
+    def total(self) -> float:
+        """Time in seconds between `start()` and `stop()`."""
+        if self._started is None:
+            return 0.0
+        end = self._stopped if self._stopped is not None else time.perf_counter()
+        return end - self._started
+
+    def imports(self) -> list[ImportTiming]:
+        """Retrieves the recorded imports, slowest (excluding nested imports) first.
+
+        Returns:
+            List[ImportTiming]: The import timings.
+        """
+        with self._lock:
+            return sorted(self._imports, key=lambda i: i.self_duration, reverse=True)
+
+    def phases(self) -> list[tuple[str, float]]:
+        """Retrieves the recorded startup phases, slowest first.
+
+        Returns:
+            List[Tuple[str, float]]: Phase names and durations in seconds.
+        """
+        return sorted(self._phases, key=lambda p: p[1], reverse=True)
+
+    def check_budget(self, budgets: dict[str, float]) -> list[str]:
+        """Compares the timings with a budget.
+
+        Args:
+            budgets (Dict[str, float]): Maximum seconds for "total", for a phase
+                (e.g. "config_load") or for the import of a module
+                ("import:<module>", including nested imports).
+
+        Returns:
+            List[str]: One message per exceeded budget.
+        """
+        timings = {"total": self.total}
+        timings.update(self._phases)
+        for timing in self._imports:
+            timings.setdefault(f"import:{timing.module}", timing.duration)
+
+        violations = []
+        for key, budget in sorted(budgets.items()):
+            actual = timings.get(key)
+            if actual is not None and actual > budget:
+                violations.append(f"{key} took {actual:.3f}s (budget {budget:.3f}s)")
+        return violations
+
+    def report(self, limit: int = 20) -> str:
+        """Formats the timings as a text report.
+
+        Args:
+            limit (int): Maximum number of imports listed.
+
+        Returns:
+            str: The report.
+        """
+        lines = [f"Startup profile: {self.total:.3f}s total", "", "Phases:"]
+        lines += [f"  {name:<40} {duration:>9.3f}s" for name, duration in self.phases()]
+        imports = self.imports()
+        lines += ["", f"Imports ({len(imports)} modules, slowest {min(limit, len(imports))}):"]
+        lines += [
+            f"  {i.module:<40} {i.self_duration:>9.3f}s  (cumulative {i.duration:.3f}s)"
+            for i in imports[:limit]
+        ]
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """Returns the timings in a machine-readable form.
+
+        Returns:
+            dict: Total, phases and imports, slowest first.
+        """
+        return {
+            "total": self.total,
+            "phases": [{"name": n, "duration": d} for n, d in self.phases()],
+            "imports": [asdict(i) for i in self.imports()],
+        }
+
+    def write_json(self, path: str) -> None:
+        """Writes the timings as JSON.
+
+        Args:
+            path (str): Target file.
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+    def _record_import(self, timing: ImportTiming) -> None:
+        with self._lock:
+            self._imports.append(timing)
@@ -0,0 +1,222 @@
+import asyncio
+import contextvars
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from ..plugin.base import Plugin
+
+
+class PluginScheduler:
+    """Dependency-aware scheduler for plugin execution.
+
+    Plugins are started as soon as all of their dependencies have finished
+    successfully. Plugins whose dependencies failed, are not enabled, or form
+    a cycle are skipped instead of being executed.
+    """
+
+    def __init__(self, plugins: list[Plugin], logger: logging.Logger) -> None:
+        """Initialize the scheduler and build the dependency graph.
+
+        Args:
+            plugins (List[Plugin]): Plugins to schedule, in their default order.
+            logger (logging.Logger): Logger used for scheduling diagnostics.
+        """
+        self._logger = logger
+        self._plugins: dict[str, Plugin] = {p.name: p for p in plugins}
+        self._deps: dict[str, list[str]] = {
+            p.name: self.dependencies_of(p) for p in plugins
+        }
+        self._dependents: dict[str, list[str]] = {name: [] for name in self._plugins}
+        for name, deps in self._deps.items():
+            for dep in deps:
+                if dep in self._dependents:
+                    self._dependents[dep].append(name)
+
+    @staticmethod
+    def dependencies_of(plugin: Plugin) -> list[str]:
+        """Return the declared dependencies of a plugin.
+
+        Dependencies from the `depends_on` class attribute and from the plugin
+        configuration are merged, preserving declaration order.
+
+        Args:
+            plugin (Plugin): The plugin to inspect.
+
+        Returns:
+            List[str]: Unique names of the plugins this plugin depends on.
+        """
+        declared: list[str] = []
+        for source in (
+            getattr(plugin, "depends_on", None),
+            getattr(getattr(plugin, "config", None), "depends_on", None),
+        ):
+            if isinstance(source, (list, tuple, set, frozenset)):
+                declared.extend(str(dep) for dep in source)
+        return list(dict.fromkeys(declared))
+
+    def run(
+        self,
+        execute: Callable[[Plugin], bool],
+        on_skip: Callable[[Plugin, str], None],
+        parallel: bool = False,
+        max_workers: int = 4,
+    ) -> None:
+        """Execute all plugins respecting their dependencies.
+
+        Args:
+            execute (Callable[[Plugin], bool]): Runs a single plugin and returns
+                True if it succeeded.
+            on_skip (Callable[[Plugin, str], None]): Called with the plugin and
+                the reason whenever a plugin is skipped.
+            parallel (bool): If True, independent plugins run concurrently.
+            max_workers (int): Maximum number of threads when running in parallel.
+        """
+        state = _ScheduleState(self._plugins, self._deps, self._dependents, on_skip)
+
+        if not parallel:
+            while state.ready:
+                name = state.ready.popleft()
+                state.complete(name, execute(self._plugins[name]))
+            state.skip_unfinished()
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running: dict[Future, str] = {}
+            while state.ready or running:
+                while state.ready:
+                    name = state.ready.popleft()
+                    # Run in a copy of the current context so context-local
+                    # state (e.g. the open trace span) reaches the worker thread
+                    ctx = contextvars.copy_context()
+                    future = executor.submit(ctx.run, execute, self._plugins[name])
+                    running[future] = name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._finish(state, running.pop(future), future)
+
+        state.skip_unfinished()
+
+    async def run_async(
+        self,
+        execute: Callable[[Plugin], Awaitable[bool]],
+        on_skip: Callable[[Plugin, str], None],
+    ) -> None:
+        """Execute all plugins on the running event loop respecting their dependencies.
+
+        Every plugin whose dependencies are satisfied is started as a task
+        immediately; concurrency limits are left to the `execute` coroutine.
+
+        Args:
+            execute (Callable[[Plugin], Awaitable[bool]]): Coroutine function that
+                runs a single plugin and returns True if it succeeded.
+            on_skip (Callable[[Plugin, str], None]): Called with the plugin and
+                the reason whenever a plugin is skipped.
+        """
+        state = _ScheduleState(self._plugins, self._deps, self._dependents, on_skip)
+
+        running: dict[asyncio.Future, str] = {}
+        while state.ready or running:
+            while state.ready:
+                name = state.ready.popleft()
+                running[asyncio.ensure_future(execute(self._plugins[name]))] = name
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                self._finish(state, running.pop(future), future)
+
+        state.skip_unfinished()
+
+    def _finish(
+        self, state: "_ScheduleState", name: str, future: Future | asyncio.Future
+    ) -> None:
+        """Mark a completed plugin future as finished.
+
+        Args:
+            state (_ScheduleState): Bookkeeping of the current run.
+            name (str): Name of the plugin that finished.
+            future (Future | asyncio.Future): The completed future.
+        """
+        try:
+            succeeded = bool(future.result())
+        except Exception:
+            self._logger.exception("Plugin %s raised in scheduler", name)
+            succeeded = False
+        self._logger.debug("Plugin %s finished (success=%s)", name, succeeded)
+        state.complete(name, succeeded)
+
+
+class _ScheduleState:
+    """Bookkeeping of pending, ready and finished plugins for a single run."""
+
+    def __init__(
+        self,
+        plugins: dict[str, Plugin],
+        deps: dict[str, list[str]],
+        dependents: dict[str, list[str]],
+        on_skip: Callable[[Plugin, str], None],
+    ) -> None:
+        """Initialize the run state and skip plugins with unknown dependencies.
+
+        Args:
+            plugins (dict[str, Plugin]): Plugins by name.
+            deps (dict[str, List[str]]): Dependencies by plugin name.
+            dependents (dict[str, List[str]]): Dependent plugin names by plugin name.
+            on_skip (Callable[[Plugin, str], None]): Callback for skipped plugins.
+        """
+        self._plugins = plugins
+        self._dependents = dependents
+        self._on_skip = on_skip
+        self._pending = {name: set(d) for name, d in deps.items()}
+        self.finished: set[str] = set()
+        self.ready: deque[str] = deque()
+
+        for name, plugin_deps in deps.items():
+            if name in self.finished:
+                # already skipped by a cascade from an earlier plugin
+                continue
+            missing = [dep for dep in plugin_deps if dep not in plugins]
+            if missing:
+                self._skip(name, f"dependency '{missing[0]}' is not enabled")
+
+        self.ready.extend(
+            name
+            for name, pending in self._pending.items()
+            if not pending and name not in self.finished
+        )
+
+    def complete(self, name: str, succeeded: bool) -> None:
+        """Mark a plugin as finished and release or skip its dependents.
+
+        Args:
+            name (str): Name of the finished plugin.
+            succeeded (bool): Whether the plugin finished successfully.
+        """
+        self.finished.add(name)
+        for dependent in self._dependents[name]:
+            if dependent in self.finished:
+                continue
+            if not succeeded:
+                self._skip(dependent, f"dependency '{name}' did not succeed")
+                continue
+            self._pending[dependent].discard(name)
+            if not self._pending[dependent]:
+                self.ready.append(dependent)
+
+    def skip_unfinished(self) -> None:
+        """Skip all plugins that could never become ready due to a cycle."""
+        for name in self._plugins:
+            if name not in self.finished:
+                self._skip(name, "dependency cycle detected")
+
+    def _skip(self, name: str, reason: str) -> None:
+        """Report a plugin as skipped and cascade to its dependents.
+
+        Args:
+            name (str): Name of the skipped plugin.
+            reason (str): Human-readable reason for skipping.
+        """
+        self._on_skip(self._plugins[name], reason)
+        self.complete(name, False)
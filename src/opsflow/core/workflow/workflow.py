@@ -1,22 +1,42 @@
+import asyncio
+import contextvars
+import hashlib
 import sys
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from threading import current_thread
 
+from pydantic import BaseModel
+
 from opsflow.core.utils.report_formatter import ReportFormatter
 
 from ..config.loader import ConfigLoader
 from ..config.schema import CoreConfig
 from ..models.context import Context
+from ..models.metrics import MetricsCollector
 from ..models.result import Result, ResultCollector, Severity
+from ..models.trace import Trace
 from ..notifier.composite import CompositeNotifier
 from ..notifier.factory import NotifierFactory
-from ..plugin.base import Plugin
+from ..notifier.outbox import NotificationOutbox
+from ..notifier.registry import NotifierRegistry
+from ..plugin.base import AsyncPlugin, Plugin
 from ..plugin.factory import PluginFactory
+from ..plugin.registry import PluginRegistry
+from ..registry.base import Registry
+from ..state import RunStateStore, RunTracker
 from ..system.base import SystemManager
 from ..utils.command_runner import CommandRunner
 from ..utils.logger_setup import setup_logger
+from ..utils.metrics_exporter import PrometheusTextfileExporter
 from ..utils.module_loader import ModuleLoader
+from ..utils.span_exporter import OtlpJsonFileExporter, SpanExporter
+from ..utils.startup_profiler import StartupProfiler
+from .scheduler import PluginScheduler
+
+# Command-line flag enabling the startup profile
+PROFILE_STARTUP_FLAG = "--profile-startup"
 
 
 class Workflow:
@@ -32,6 +52,10 @@ class Workflow:
         config_path: str | None = None,
         plugin_dir: str | None = None,
         notifier_dir: str | None = None,
+        span_exporters: list[SpanExporter] | None = None,
+        profile_startup: bool = False,
+        config_cache_dir: str | None = None,
+        config_env_prefix: str | None = None,
     ):
         """Initialize the workflow orchestrator.
 
@@ -44,13 +68,60 @@ class Workflow:
             config_path (Optional[str]): Path to a configuration file (used if `config` is None).
             plugin_dir (Optional[str]): Directory containing plugin modules.
             notifier_dir (Optional[str]): Directory containing notifier modules.
+            span_exporters (Optional[List[SpanExporter]]): Exporters receiving the
+                trace after every full workflow run, in addition to the exporter
+                configured in `tracing`.
+            profile_startup (bool): Record the duration of every initialization
+                phase and module import, as with `--profile-startup` on the
+                command line or `profiling.enabled` in the configuration.
+            config_cache_dir (Optional[str]): Directory caching the parsed
+                configuration files and the validated configuration loaded from
+                `config_path` between runs.
+            config_env_prefix (Optional[str]): Prefix of environment variables
+                overriding values of the configuration loaded from `config_path`,
+                e.g. "OPSFLOW_". Disabled if None.
         """
+        # Optional startup profile; started first so that imports made while
+        # loading the configuration are included
+        self._profiler = (
+            StartupProfiler() if profile_startup or PROFILE_STARTUP_FLAG in sys.argv[1:] else None
+        )
+        if self._profiler:
+            self._profiler.start()
+
+        # Timing trace of all workflow phases, shared with the runtime components
+        self._trace = Trace()
+
         # Load and validate core configuration (from object or config file)
-        self._config = config or self._load_config(config_path)
+        path = raw = None
+        try:
+            with self._trace.span("config_load", "phase"):
+                if config is None:
+                    path, raw = self._read_config(
+                        config_path,
+                        trace=self._trace,
+                        cache_dir=config_cache_dir,
+                        env_prefix=config_env_prefix,
+                    )
+                    # Plugins and notifiers are validated against their own
+                    # models once the modules providing them are loaded
+                    config = CoreConfig.model_validate(raw)
+                self._config = config
+        except BaseException:
+            if self._profiler:
+                self._profiler.stop()
+            raise
+
+        if not self._profiler and self._config.profiling.enabled:
+            self._profiler = StartupProfiler()
+            self._profiler.start()
 
         # Initialize logging early so all subsystems (plugins, command runner, etc.)
         # can rely on a fully configured logger
-        self._logger, self._memory_handler = setup_logger(self._config.logging)
+        with self._trace.span("logger_setup", "phase"):
+            self._logger, self._memory_handler = setup_logger(
+                self._config.logging, trace=self._trace
+            )
         self._logger.debug("Logger initialized")
 
         # Configure CommandRunner as a process-wide service
@@ -58,17 +129,43 @@ class Workflow:
         CommandRunner.configure(
             dry_run=self._config.dry_run,
             logger=self._logger,
+            config=self._config.commands,
+            trace=self._trace,
         )
 
-        # Create shared result collector used across the workflow
+        # Exporters for the trace of every full workflow run
+        self._span_exporters = list(span_exporters or [])
+        self._completed_runs = 0
+
+        # Optional node exporter textfile with the metrics of every full run
+        self._metrics_exporter = (
+            PrometheusTextfileExporter(self._config.metrics.textfile)
+            if self._config.metrics.textfile
+            else None
+        )
+        if self._config.tracing.otlp_file:
+            self._span_exporters.append(
+                OtlpJsonFileExporter(
+                    self._config.tracing.otlp_file,
+                    service_name=self._config.tracing.service_name,
+                )
+            )
+
+        # Create shared result and metrics collectors used across the workflow
         self._result_collector = ResultCollector()
+        self._metrics = MetricsCollector()
 
         # Build execution context passed to all runtime components
         self._ctx = Context(
             result_collector=self._result_collector,
             dry_run=self._config.dry_run,
+            trace=self._trace,
+            metrics=self._metrics,
         )
 
+        # Open the optional run-state store used for resumable runs
+        self._tracker: RunTracker | None = self._build_tracker()
+
         # Attach framework-managed runtime dependencies to the system manager
         # before it is used by the workflow
         if system_manager:
@@ -84,6 +181,7 @@ class Workflow:
             step="module_load:plugins",
             success_msg="Plugins loaded from directory: %s",
             error_msg="Failed loading plugins from %s",
+            components=self._config.plugins,
         )
 
         self._load_modules(
@@ -91,13 +189,40 @@ class Workflow:
             step="module_load:notifiers",
             success_msg="Notifiers loaded from directory: %s",
             error_msg="Failed loading notifiers from %s",
+            components=self._config.notifiers,
         )
 
+        if self._config.discovery.entry_points:
+            self._load_entry_points("opsflow.plugins", PluginRegistry, self._config.plugins)
+            self._load_entry_points("opsflow.notifiers", NotifierRegistry, self._config.notifiers)
+
+        if raw is not None:
+            try:
+                self._config = ConfigLoader.validate(
+                    raw, path, trace=self._trace, cache_dir=config_cache_dir
+                )
+            except BaseException:
+                if self._profiler:
+                    self._profiler.stop()
+                raise
+
         # Build notifiers and plugins
-        self._notifier: CompositeNotifier = self._build_notifier()
-        self._plugins: list[Plugin] = self._build_plugins()
+        with self._trace.span("build:notifiers", "phase"):
+            self._notifier: CompositeNotifier = self._build_notifier()
+        with self._trace.span("build:plugins", "phase"):
+            self._plugins: list[Plugin] = self._build_plugins()
+        # Setup outcome of plugins set up ahead of their run, by plugin name
+        self._prepared: dict[str, bool] = {}
         self._logger.debug("Workflow initialized with %d plugins", len(self._plugins))
 
+        if self._profiler:
+            self._report_startup_profile()
+
+    @property
+    def trace(self) -> Trace:
+        """Timing trace of all workflow phases recorded so far."""
+        return self._trace
+
     def run_system_update(self) -> None:
         """Execute the system update via the system manager and collect the results.
 
@@ -106,91 +231,535 @@ class Workflow:
         if not self._system_manager:
             return
 
+        step = "system_update"
+        if self._skip_step(step, fingerprint=None):
+            return
+
         self._logger.info("Starting system update...")
+        if self._tracker:
+            self._tracker.start(step, fingerprint=None)
+        succeeded = True
         try:
-            self._logger.debug("Calling system_manager.update()")
-            self._system_manager.update()
+            with self._trace.span(step, "phase"):
+                self._logger.debug("Calling system_manager.update()")
+                self._system_manager.update()
 
-            self._logger.debug("Checking if reboot is required")
-            self._system_manager.check_reboot_required()
+                self._logger.debug("Checking if reboot is required")
+                self._system_manager.check_reboot_required()
 
-            self._logger.debug("Checking for major OS release")
-            self._system_manager.check_new_stable_available()
+                self._logger.debug("Checking for major OS release")
+                self._system_manager.check_new_stable_available()
 
         except Exception as e:
+            succeeded = False
             self._logger.exception("System update failed")
             self._result_collector.add(
-                Result(step="system_update", severity=Severity.ERROR, message=str(e))
+                Result(step=step, severity=Severity.ERROR, message=str(e))
             )
 
+        if self._tracker:
+            self._tracker.finish(step, succeeded, fingerprint=None)
         self._logger.debug("System update completed")
 
     def run_plugins(self, parallel: bool = False, max_workers: int = 4) -> None:
         """Execute all instantiated plugins and collect their results.
 
+        Plugins are scheduled according to their declared dependencies: a plugin
+        starts only after all plugins it depends on have finished successfully,
+        and is skipped if any of them failed. With `plugin_setup.concurrent`,
+        all plugins are set up concurrently before the first one runs.
+
         Args:
-            parallel (bool): If True, run plugins in parallel threads.
+            parallel (bool): If True, run independent plugins in parallel threads.
             max_workers (int): Maximum number of threads when running in parallel.
         """
         self._logger.info(
             "Running %d plugins (parallel=%s)...", len(self._plugins), parallel
         )
-        if not parallel:
-            for plugin in self._plugins:
-                self._run_single_plugin(plugin)
-            return
+        scheduler = PluginScheduler(self._plugins, logger=self._logger)
+        self._prepared = {}
+        if self._config.plugin_setup.concurrent:
+            self._setup_plugins()
+        with self._trace.span("plugins", "phase"):
+            scheduler.run(
+                execute=self._run_tracked_plugin,
+                on_skip=self._skip_plugin,
+                parallel=parallel,
+                max_workers=max_workers,
+            )
+            self._teardown_unused()
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(self._run_single_plugin, p): p for p in self._plugins
-            }
-            for _ in as_completed(futures):
-                # _run_single_plugin handles exceptions and results
-                self._logger.debug(
-                    "Plugin future completed in thread %s", current_thread().name
-                )
+    async def run_plugins_async(self, max_workers: int = 4) -> None:
+        """Execute all instantiated plugins on the running event loop.
+
+        Async plugins are awaited concurrently on the current event loop, while
+        synchronous plugins are offloaded to a bounded thread pool. Declared
+        plugin dependencies and the concurrent setup phase are handled in the
+        same way as in `run_plugins`.
+
+        Args:
+            max_workers (int): Maximum number of threads for synchronous plugins.
+        """
+        self._logger.info("Running %d plugins (async)...", len(self._plugins))
+        loop = asyncio.get_running_loop()
+        scheduler = PluginScheduler(self._plugins, logger=self._logger)
+        self._prepared = {}
+        if self._config.plugin_setup.concurrent:
+            await self._setup_plugins_async()
+
+        with (
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+            self._trace.span("plugins", "phase"),
+        ):
+
+            async def execute(plugin: Plugin) -> bool:
+                if not isinstance(plugin, AsyncPlugin):
+                    ctx = contextvars.copy_context()
+                    return await loop.run_in_executor(
+                        executor, ctx.run, self._run_tracked_plugin, plugin
+                    )
+
+                step, fingerprint, incremental = self._plugin_step(plugin)
+                if self._skip_step(step, fingerprint, incremental):
+                    return True
+                if self._tracker:
+                    self._tracker.start(step, fingerprint)
+                succeeded = await self._run_single_plugin_async(plugin)
+                if self._tracker:
+                    self._tracker.finish(step, succeeded, fingerprint)
+                return succeeded
+
+            await scheduler.run_async(execute=execute, on_skip=self._skip_plugin)
+            await self._teardown_unused_async()
 
     def process_results(self) -> None:
         """Format all collected results and send a report via the notifier."""
         self._logger.debug("Processing results for report")
-        reporter = ReportFormatter(results=self._result_collector.all_results())
-        logs = self._memory_handler.get_value()
-        report = reporter.format_report(logs=logs)
-        try:
-            self._notifier.notify("Workflow Report", report)
-            self._logger.info("Report sent successfully.")
-        except Exception as e:
-            self._logger.error("Failed to send report: %s", e)
+        with self._trace.span("process_results", "phase"):
+            report = self._format_report()
+            try:
+                with self._trace.span("notify", "notification"):
+                    failures = self._notifier.notify("Workflow Report", report)
+            except Exception as e:  # noqa: BLE001 - a failed report must not fail the run
+                self._logger.error("Failed to send report: %s", e)
+                return
+            self._record_delivery(failures)
+
+    async def process_results_async(self) -> None:
+        """Format all collected results and send a report from the event loop.
+
+        Notifiers with a native asyncio client deliver on the running loop;
+        all others run in worker threads.
+        """
+        self._logger.debug("Processing results for report (async)")
+        with self._trace.span("process_results", "phase"):
+            report = await asyncio.to_thread(self._format_report)
+            try:
+                with self._trace.span("notify", "notification"):
+                    failures = await self._notifier.notify_async("Workflow Report", report)
+            except Exception as e:  # noqa: BLE001 - a failed report must not fail the run
+                self._logger.error("Failed to send report: %s", e)
+                return
+            self._record_delivery(failures)
 
     def run_all(self) -> None:
         """Run the full workflow: system update, plugin execution, and result processing."""
         self._logger.info("Starting full workflow run")
-        self.run_system_update()
-        self.run_plugins()
-        self.process_results()
+        self._start_run()
+        try:
+            with self._trace.span("workflow", "workflow"):
+                if self._tracker:
+                    self._tracker.begin()
+                self.run_system_update()
+                self.run_plugins()
+                self.process_results()
+                if self._tracker:
+                    self._tracker.end()
+        finally:
+            self._notifier.close()
+        self._export_trace()
+        self._export_metrics()
         self._logger.info("Workflow run finished")
 
-    def _run_single_plugin(self, plugin: Plugin) -> None:
+    async def run_all_async(self, max_workers: int = 4) -> None:
+        """Run the full workflow on the current event loop.
+
+        The system update is blocking and runs in a worker thread, while plugins
+        and the report delivery are executed on the loop via `run_plugins_async`
+        and `process_results_async`.
+
+        Args:
+            max_workers (int): Maximum number of threads for synchronous plugins.
+        """
+        self._logger.info("Starting full workflow run (async)")
+        self._start_run()
+        try:
+            with self._trace.span("workflow", "workflow"):
+                if self._tracker:
+                    self._tracker.begin()
+                await asyncio.to_thread(self.run_system_update)
+                await self.run_plugins_async(max_workers=max_workers)
+                await self.process_results_async()
+                if self._tracker:
+                    self._tracker.end()
+        finally:
+            await asyncio.to_thread(self._notifier.close)
+        await asyncio.to_thread(self._export_trace)
+        await asyncio.to_thread(self._export_metrics)
+        self._logger.info("Workflow run finished")
+
+    def _report_startup_profile(self) -> None:
+        """Stop the startup profiler and report its timings.
+
+        The profile is logged, written to the configured report file, and every
+        exceeded budget is added to the results as a warning.
+        """
+        self._profiler.stop(self._trace)
+        profiling = self._config.profiling
+        self._logger.info("%s", self._profiler.report())
+
+        if profiling.report_file:
+            try:
+                self._profiler.write_json(profiling.report_file)
+                self._logger.debug("Startup profile written to %s", profiling.report_file)
+            except OSError:
+                self._logger.exception(
+                    "Failed to write startup profile to %s", profiling.report_file
+                )
+
+        for violation in self._profiler.check_budget(profiling.budgets):
+            self._logger.warning("Startup budget exceeded: %s", violation)
+            self._result_collector.add(
+                Result(
+                    step="startup_profile",
+                    severity=Severity.WARNING,
+                    message=f"Startup budget exceeded: {violation}",
+                )
+            )
+
+    def _format_report(self) -> str:
+        """Format the collected results, timings and logs into a report.
+
+        Returns:
+            str: The report.
+        """
+        # Make sure queued log records are part of the report
+        for handler in self._logger.handlers:
+            handler.flush()
+        reporter = ReportFormatter(results=self._result_collector, trace=self._trace)
+        return reporter.format_report(logs=self._memory_handler.get_value())
+
+    def _record_delivery(self, failures: list[Result]) -> None:
+        """Record the outcome of sending the report.
+
+        Args:
+            failures (List[Result]): Results of the notifiers that failed.
+        """
+        if failures:
+            self._result_collector.add_all(failures)
+            self._logger.error("Failed to send report via %d notifier(s)", len(failures))
+        else:
+            self._logger.info("Report sent successfully.")
+
+    def _start_run(self) -> None:
+        """Start a new trace and metrics set for a full workflow run.
+
+        The first run keeps the spans recorded during initialization; every
+        later run starts with an empty trace and no metrics.
+        """
+        if self._completed_runs:
+            self._trace.reset()
+            self._metrics.clear()
+
+    def _export_trace(self) -> None:
+        """Pass the trace of the finished run to all span exporters.
+
+        The report has already been sent at this point, so export failures are
+        only logged.
+        """
+        self._completed_runs += 1
+        for exporter in self._span_exporters:
+            try:
+                exporter.export(self._trace)
+                self._logger.debug("Trace exported via %s", type(exporter).__name__)
+            except Exception:
+                self._logger.exception("Failed to export trace via %s", type(exporter).__name__)
+
+    def _export_metrics(self) -> None:
+        """Write the metrics of the finished run to the configured textfile.
+
+        The report has already been sent at this point, so export failures are
+        only logged.
+        """
+        if not self._metrics_exporter:
+            return
+        try:
+            self._metrics_exporter.export(
+                self._result_collector.all_results(), self._trace, self._metrics
+            )
+            self._logger.debug("Metrics written to %s", self._metrics_exporter.path)
+        except Exception:
+            self._logger.exception("Failed to write metrics to %s", self._metrics_exporter.path)
+
+    def _run_tracked_plugin(self, plugin: Plugin) -> bool:
+        """Execute a single plugin and record it in the run-state store.
+
+        Args:
+            plugin (Plugin): The plugin instance to execute.
+
+        Returns:
+            bool: True if the plugin succeeded or was skipped as already done.
+        """
+        if not self._tracker:
+            return self._run_single_plugin(plugin)
+
+        step, fingerprint, incremental = self._plugin_step(plugin)
+        if self._skip_step(step, fingerprint, incremental):
+            return True
+        self._tracker.start(step, fingerprint)
+        succeeded = self._run_single_plugin(plugin)
+        self._tracker.finish(step, succeeded, fingerprint)
+        return succeeded
+
+    def _run_single_plugin(self, plugin: Plugin) -> bool:
         """Execute a single plugin, handling setup, run, teardown, and result collection.
 
         Args:
             plugin (Plugin): The plugin instance to execute.
+
+        Returns:
+            bool: True if setup and run succeeded, False otherwise.
         """
+        if isinstance(plugin, AsyncPlugin):
+            return asyncio.run(self._run_single_plugin_async(plugin))
+
         thread = current_thread().name
         name = plugin.name
 
-        self._logger.debug("[%s] Plugin %s setup started", thread, name)
-        if not self._safe_call(
-            plugin.setup, step="setup", plugin=plugin, severity=Severity.ERROR
+        with (
+            self._trace.span(f"plugin:{name}", "plugin") as span,
+            self._plugin_ctx.buffered_results(),
+        ):
+            prepared = self._prepared.pop(name, None)
+            if prepared is None:
+                self._logger.debug("[%s] Plugin %s setup started", thread, name)
+                prepared = self._safe_call(
+                    plugin.setup, step="setup", plugin=plugin, severity=Severity.ERROR
+                )
+            if not prepared:
+                span.error = "setup failed"
+                return False
+
+            self._logger.debug("[%s] Plugin %s run started", thread, name)
+            succeeded = self._safe_call(
+                plugin.run, step="run", plugin=plugin, severity=Severity.ERROR
+            )
+
+            self._logger.debug("[%s] Plugin %s teardown started", thread, name)
+            self._safe_call(
+                plugin.teardown, step="teardown", plugin=plugin, severity=Severity.WARNING
+            )
+            if not succeeded:
+                span.error = "run failed"
+            return succeeded
+
+    async def _run_single_plugin_async(self, plugin: AsyncPlugin) -> bool:
+        """Execute a single async plugin on the running event loop.
+
+        Args:
+            plugin (AsyncPlugin): The plugin instance to execute.
+
+        Returns:
+            bool: True if setup and run succeeded, False otherwise.
+        """
+        name = plugin.name
+
+        with (
+            self._trace.span(f"plugin:{name}", "plugin") as span,
+            self._plugin_ctx.buffered_results(),
+        ):
+            prepared = self._prepared.pop(name, None)
+            if prepared is None:
+                self._logger.debug("Async plugin %s setup started", name)
+                prepared = await self._safe_call_async(
+                    plugin.setup, step="setup", plugin=plugin, severity=Severity.ERROR
+                )
+            if not prepared:
+                span.error = "setup failed"
+                return False
+
+            self._logger.debug("Async plugin %s run started", name)
+            succeeded = await self._safe_call_async(
+                plugin.run, step="run", plugin=plugin, severity=Severity.ERROR
+            )
+
+            self._logger.debug("Async plugin %s teardown started", name)
+            await self._safe_call_async(
+                plugin.teardown, step="teardown", plugin=plugin, severity=Severity.WARNING
+            )
+            if not succeeded:
+                span.error = "run failed"
+            return succeeded
+
+    def _setup_plugins(self) -> None:
+        """Set up all synchronous plugins concurrently before any plugin runs.
+
+        Async plugins are set up as part of their own run, on the event loop
+        they run on. A failed setup only affects its plugin: it is reported
+        when the plugin is due to run.
+        """
+        plugins = [p for p in self._plugins if not isinstance(p, AsyncPlugin)]
+        if not plugins:
+            return
+        self._logger.debug("Setting up %d plugins concurrently", len(plugins))
+        with (
+            self._trace.span("plugin_setup", "phase"),
+            ThreadPoolExecutor(
+                max_workers=self._config.plugin_setup.max_workers,
+                thread_name_prefix="plugin-setup",
+            ) as executor,
         ):
+            futures = {
+                plugin.name: executor.submit(
+                    contextvars.copy_context().run, self._setup_plugin, plugin
+                )
+                for plugin in plugins
+            }
+        self._prepared = {name: future.result() for name, future in futures.items()}
+
+    async def _setup_plugins_async(self) -> None:
+        """Set up all plugins concurrently from the event loop before any plugin runs.
+
+        Async plugins are set up on the running loop, synchronous plugins in a
+        bounded thread pool; at most `plugin_setup.max_workers` setups run at
+        the same time.
+        """
+        if not self._plugins:
             return
+        self._logger.debug("Setting up %d plugins concurrently (async)", len(self._plugins))
+        limit = asyncio.Semaphore(self._config.plugin_setup.max_workers)
+
+        async def setup(plugin: Plugin) -> bool:
+            async with limit:
+                if not isinstance(plugin, AsyncPlugin):
+                    return await asyncio.to_thread(self._setup_plugin, plugin)
+                with self._plugin_ctx.buffered_results():
+                    return await self._safe_call_async(
+                        plugin.setup, step="setup", plugin=plugin, severity=Severity.ERROR
+                    )
 
-        self._logger.debug("[%s] Plugin %s run started", thread, name)
-        self._safe_call(plugin.run, step="run", plugin=plugin, severity=Severity.ERROR)
+        with self._trace.span("plugin_setup", "phase"):
+            results = await asyncio.gather(*(setup(p) for p in self._plugins))
+        self._prepared = {p.name: ok for p, ok in zip(self._plugins, results)}
+
+    def _setup_plugin(self, plugin: Plugin) -> bool:
+        """Set up a single synchronous plugin ahead of its run.
+
+        Args:
+            plugin (Plugin): The plugin instance.
+
+        Returns:
+            bool: True if the setup succeeded.
+        """
+        self._logger.debug("[%s] Plugin %s setup started", current_thread().name, plugin.name)
+        with self._plugin_ctx.buffered_results():
+            return self._safe_call(
+                plugin.setup, step="setup", plugin=plugin, severity=Severity.ERROR
+            )
+
+    def _teardown_unused(self) -> None:
+        """Tear down plugins that were set up ahead but never ran.
+
+        This happens to plugins that were skipped because of their dependencies
+        or the run-state store.
+        """
+        for plugin in self._plugins:
+            if self._prepared.pop(plugin.name, False):
+                self._safe_call(
+                    plugin.teardown, step="teardown", plugin=plugin, severity=Severity.WARNING
+                )
+
+    async def _teardown_unused_async(self) -> None:
+        """Tear down plugins that were set up ahead but never ran, from the event loop."""
+        for plugin in self._plugins:
+            if not self._prepared.pop(plugin.name, False):
+                continue
+            if isinstance(plugin, AsyncPlugin):
+                await self._safe_call_async(
+                    plugin.teardown, step="teardown", plugin=plugin, severity=Severity.WARNING
+                )
+            else:
+                await asyncio.to_thread(
+                    self._safe_call,
+                    plugin.teardown,
+                    step="teardown",
+                    plugin=plugin,
+                    severity=Severity.WARNING,
+                )
+
+    @staticmethod
+    def _plugin_step(plugin: Plugin) -> tuple[str, str, bool]:
+        """Return the state-store step identifier and fingerprint of a plugin.
 
-        self._logger.debug("[%s] Plugin %s teardown started", thread, name)
-        self._safe_call(
-            plugin.teardown, step="teardown", plugin=plugin, severity=Severity.WARNING
+        The fingerprint covers the plugin class, its configuration and the
+        plugin-provided input fingerprint.
+
+        Args:
+            plugin (Plugin): The plugin instance.
+
+        Returns:
+            tuple[str, str, bool]: Step identifier, fingerprint, and whether the
+                plugin is incremental (provides its own input fingerprint).
+        """
+        inputs = plugin.fingerprint()
+        digest = hashlib.sha256()
+        digest.update(f"{type(plugin).__module__}.{type(plugin).__qualname__}".encode())
+        if isinstance(plugin.config, BaseModel):
+            digest.update(plugin.config.model_dump_json().encode())
+        if inputs is not None:
+            digest.update(inputs.encode())
+        return f"plugin:{plugin.name}", digest.hexdigest(), inputs is not None
+
+    def _skip_step(
+        self, step: str, fingerprint: str | None, incremental: bool = False
+    ) -> bool:
+        """Check the run-state store and record the step as skipped if possible.
+
+        Args:
+            step (str): Step identifier.
+            fingerprint (Optional[str]): Fingerprint of the step inputs.
+            incremental (bool): Whether the fingerprint fully describes the inputs.
+
+        Returns:
+            bool: True if the step was skipped.
+        """
+        if not self._tracker:
+            return False
+        reason = self._tracker.skip_reason(step, fingerprint, incremental)
+        if reason is None:
+            return False
+
+        self._logger.info("Step %s skipped: %s", step, reason)
+        self._tracker.skip(step, fingerprint)
+        self._plugin_ctx.add_result(
+            Result(step=step, severity=Severity.INFO, message=f"Skipped: {reason}")
+        )
+        return True
+
+    def _skip_plugin(self, plugin: Plugin, reason: str) -> None:
+        """Record a plugin that was not executed because of its dependencies.
+
+        Args:
+            plugin (Plugin): The skipped plugin instance.
+            reason (str): Human-readable reason for skipping the plugin.
+        """
+        self._logger.warning("Plugin %s skipped: %s", plugin.name, reason)
+        self._result_collector.add(
+            Result(
+                step=f"plugin:skipped:{plugin.name}",
+                severity=Severity.WARNING,
+                message=f"Skipped: {reason}",
+            )
         )
 
     def _safe_call(
@@ -211,51 +780,121 @@ class Workflow:
         Returns:
             bool: True if the call succeeded, False if an exception occurred.
         """
-        try:
-            func()
-            return True
-        except Exception as e:
-            self._logger.exception(
-                "[%s] %s failed for plugin %s",
-                current_thread().name,
-                step,
-                plugin.name,
-            )
-            self._result_collector.add(
-                Result(
-                    step=f"plugin:{step}:{plugin.name}",
-                    severity=severity,
-                    message=str(e),
-                )
+        with self._trace.span(f"plugin:{plugin.name}:{step}", "plugin_step") as span:
+            try:
+                func()
+                return True
+            except Exception as e:  # noqa: BLE001 - any plugin error becomes a result
+                span.error = str(e)
+                self._record_plugin_failure(e, step=step, plugin=plugin, severity=severity)
+                return False
+
+    async def _safe_call_async(
+        self,
+        func: Callable[[], Awaitable[None]],
+        step: str,
+        plugin: Plugin,
+        severity: Severity,
+    ) -> bool:
+        """Safely await an async plugin method, catching exceptions and logging results.
+
+        Args:
+            func (Callable[[], Awaitable[None]]): The plugin coroutine method to await.
+            step (str): The step identifier (e.g., "setup", "run", "teardown").
+            plugin (Plugin): The plugin instance.
+            severity (Severity): Severity level for logging errors.
+
+        Returns:
+            bool: True if the call succeeded, False if an exception occurred.
+        """
+        with self._trace.span(f"plugin:{plugin.name}:{step}", "plugin_step") as span:
+            try:
+                await func()
+                return True
+            except Exception as e:  # noqa: BLE001 - any plugin error becomes a result
+                span.error = str(e)
+                self._record_plugin_failure(e, step=step, plugin=plugin, severity=severity)
+                return False
+
+    def _record_plugin_failure(
+        self, error: Exception, step: str, plugin: Plugin, severity: Severity
+    ) -> None:
+        """Log a failed plugin call and add it to the results of the plugin.
+
+        Args:
+            error (Exception): The exception raised by the plugin.
+            step (str): The step identifier (e.g., "setup", "run", "teardown").
+            plugin (Plugin): The plugin instance.
+            severity (Severity): Severity level of the recorded result.
+        """
+        self._logger.exception(
+            "[%s] %s failed for plugin %s",
+            current_thread().name,
+            step,
+            plugin.name,
+            exc_info=error,
+        )
+        self._plugin_ctx.add_result(
+            Result(
+                step=f"plugin:{step}:{plugin.name}",
+                severity=severity,
+                message=str(error),
             )
-            return False
+        )
 
     @staticmethod
-    def _load_config(config_path: str | None) -> CoreConfig:
-        """Load the configuration from the specified file or command-line argument.
+    def _read_config(
+        config_path: str | None,
+        trace: Trace | None = None,
+        cache_dir: str | None = None,
+        env_prefix: str | None = None,
+    ) -> tuple[str, dict]:
+        """Read the configuration from the specified file or command-line argument.
 
         Args:
             config_path (Optional[str]): Path to the configuration file.
+            trace (Optional[Trace]): Trace recording the loading phases.
+            cache_dir (Optional[str]): Directory of the configuration caches.
+            env_prefix (Optional[str]): Prefix of overriding environment variables.
 
         Returns:
-            CoreConfig: The loaded configuration object.
+            tuple[str, dict]: The path of the configuration file and its raw,
+                not yet validated content.
         """
-        path = config_path or (sys.argv[1] if len(sys.argv) > 1 else "config.yaml")
-        return ConfigLoader.load(path)
+        args = [arg for arg in sys.argv[1:] if arg != PROFILE_STARTUP_FLAG]
+        path = config_path or (args[0] if args else "config.yaml")
+        return path, ConfigLoader.read(
+            path, trace=trace, cache_dir=cache_dir, env_prefix=env_prefix
+        )
 
-    def _load_modules(self, directory, step, success_msg, error_msg) -> None:
+    def _load_modules(self, directory, step, success_msg, error_msg, components=None) -> None:
         """Load modules from a specified directory with error handling.
 
+        With lazy discovery, only the modules providing enabled components are
+        imported.
+
         Args:
             directory (str): Directory path to load modules from.
             step (str): Identifier for the loading step.
             success_msg (str): Message to log on successful loading.
             error_msg (str): Message to log on loading failure.
+            components (Optional[dict]): Configured components of the directory.
         """
         if not directory:
             return
+        discovery = self._config.discovery
+        names = manifest = None
+        if discovery.lazy:
+            names = self._enabled_names(components or {})
+            if discovery.manifest_dir:
+                kind = step.rpartition(":")[2]
+                manifest = str(Path(discovery.manifest_dir) / f"{kind}-manifest.json")
         try:
-            ModuleLoader.load_from_directory(directory)
+            with self._trace.span(step, "phase", directory=str(directory)):
+                if names is None:
+                    ModuleLoader.load_from_directory(directory)
+                else:
+                    ModuleLoader.load_from_directory(directory, names=names, manifest=manifest)
             self._logger.debug(success_msg, directory)
         except Exception as e:
             self._logger.exception(error_msg, directory)
@@ -267,6 +906,78 @@ class Workflow:
                 )
             )
 
+    def _load_entry_points(self, group: str, registry: Registry, components: dict) -> None:
+        """Load and register components published as entry points.
+
+        With lazy discovery, only enabled components that are not registered
+        yet are loaded. Entry points usually reference a module or class that
+        registers itself via the registry decorator; other classes are
+        registered with the configuration class they declare as type argument
+        of their base class, e.g. `Plugin[BackupConfig]`.
+
+        Args:
+            group (str): Entry point group.
+            registry (Registry): Registry of the component kind.
+            components (dict): Configured components of this kind.
+        """
+        names = None
+        if self._config.discovery.lazy:
+            names = self._enabled_names(components) - set(registry.entries)
+            if not names:
+                return
+        step = f"entry_points:{group}"
+        try:
+            with self._trace.span(step, "phase"):
+                loaded = ModuleLoader.load_entry_points(group, names=names)
+                for name, obj in loaded.items():
+                    if isinstance(obj, type) and name not in registry.entries:
+                        registry.register_class(obj, config=registry.declared_config(obj))
+            self._logger.debug("Entry points loaded from %s: %s", group, sorted(loaded))
+        except Exception as e:
+            self._logger.exception("Failed loading entry points from %s", group)
+            self._result_collector.add(Result(step=step, severity=Severity.ERROR, message=str(e)))
+
+    @staticmethod
+    def _enabled_names(components: dict) -> set[str]:
+        """Return the names of the enabled components of a configuration section.
+
+        Args:
+            components (dict): Mapping of component names to configurations.
+
+        Returns:
+            set[str]: Names of the enabled components.
+        """
+        return {name for name, cfg in components.items() if getattr(cfg, "enabled", False)}
+
+    def _build_tracker(self) -> RunTracker | None:
+        """Open the run-state store if enabled in the configuration.
+
+        Failures are recorded as a warning and the workflow continues without
+        persistent state.
+
+        Returns:
+            Optional[RunTracker]: Tracker for the run-state store, or None.
+        """
+        state = self._config.state
+        if not state.enabled:
+            return None
+        try:
+            store = RunStateStore(state.path)
+        except Exception as e:
+            self._logger.exception("Failed to open state store %s", state.path)
+            self._result_collector.add(
+                Result(step="state_store", severity=Severity.WARNING, message=str(e))
+            )
+            return None
+
+        self._logger.debug("State store opened: %s", state.path)
+        return RunTracker(
+            store,
+            logger=self._logger,
+            resume=state.resume,
+            skip_unchanged=state.skip_unchanged,
+        )
+
     def _build_notifier(self) -> CompositeNotifier:
         """Instantiate a CompositeNotifier containing all registered notifiers.
 
@@ -275,7 +986,18 @@ class Workflow:
         """
         self._logger.debug("Building notifiers")
         factory = NotifierFactory(config=self._config, logger=self._logger)
-        composite = CompositeNotifier()
+        notification = self._config.notification
+        outbox = None
+        if notification.spool_dir:
+            outbox = NotificationOutbox(
+                notification.spool_dir,
+                logger=self._logger,
+                backoff=notification.retry_backoff,
+                max_backoff=notification.max_retry_backoff,
+                max_attempts=notification.max_attempts,
+                batch=notification.batch,
+            )
+        composite = CompositeNotifier(deadline=notification.deadline, outbox=outbox)
         for notifier in factory.create_all():
             composite.add_notifier(notifier)
             self._logger.debug("Notifier added: %s", type(notifier).__name__)
@@ -284,14 +1006,20 @@ class Workflow:
     def _build_plugins(self) -> list[Plugin]:
         """Instantiate all enabled plugins with a shared execution context.
 
+        With `plugin_setup.concurrent`, the plugins are constructed concurrently.
+
         Returns:
             List[Plugin]: List of plugin instances ready for execution.
         """
         self._logger.debug("Building plugins")
-        ctx = Context(
-            result_collector=self._result_collector, dry_run=self._config.dry_run
+        self._plugin_ctx = Context(
+            result_collector=self._result_collector,
+            dry_run=self._config.dry_run,
+            trace=self._trace,
+            metrics=self._metrics,
         )
-        factory = PluginFactory(config=self._config, ctx=ctx, logger=self._logger)
-        plugins = list(factory.create_all())
+        factory = PluginFactory(config=self._config, ctx=self._plugin_ctx, logger=self._logger)
+        setup = self._config.plugin_setup
+        plugins = list(factory.create_all(max_workers=setup.max_workers if setup.concurrent else 1))
         self._logger.debug("Total plugins instantiated: %d", len(plugins))
         return plugins
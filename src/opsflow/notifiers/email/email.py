@@ -1,9 +1,21 @@
+import asyncio
+import gzip
+import io
+import threading
+from collections.abc import Iterable
 from email.message import EmailMessage
-from smtplib import SMTP, SMTP_SSL
+from smtplib import SMTP, SMTP_SSL, SMTPServerDisconnected
 
 from opsflow.core.notifier import Notifier
+from opsflow.core.utils.report_formatter import ReportFormatter
 
 from .email_config import EmailNotifierConfig, SmtpSecurity
+from .smtp_pool import SmtpConnectionPool
+
+try:
+    import aiosmtplib
+except ImportError:  # pragma: no cover - optional dependency
+    aiosmtplib = None
 
 
 class EmailNotifier(Notifier[EmailNotifierConfig]):
@@ -11,9 +23,24 @@ class EmailNotifier(Notifier[EmailNotifierConfig]):
 
     name = "email"
 
+    def __init__(self, config: EmailNotifierConfig, logger):
+        """Initializes the notifier.
+
+        Args:
+            config (EmailNotifierConfig): Notifier configuration.
+            logger (logging.Logger): Logger instance for logging messages.
+        """
+        super().__init__(config, logger)
+        self._pool: SmtpConnectionPool | None = None
+        self._pool_lock = threading.Lock()
+
     def notify(self, subject: str, message: str) -> None:
         """Sends an email notification.
 
+        With `keep_alive`, the SMTP session is reused for later messages. If the
+        server dropped a reused session, the message is sent once more on a new
+        session.
+
         Args:
             subject (str): Email subject.
             message (str): Email body text.
@@ -24,24 +51,198 @@ class EmailNotifier(Notifier[EmailNotifierConfig]):
         if self.config is None or not self.config.enabled:
             return
 
+        self._send(self.build_message(subject, message))
+
+    async def notify_async(self, subject: str, message: str) -> None:
+        """Sends an email notification from an event loop.
+
+        Args:
+            subject (str): Email subject.
+            message (str): Email body text.
+
+        Raises:
+            SMTPException: If sending the email fails.
+            TimeoutError: If sending exceeds `send_timeout`.
+        """
+        if self.config is None or not self.config.enabled:
+            return
+
+        await self.send_async([self.build_message(subject, message)])
+
+    async def send_async(self, messages: Iterable[EmailMessage]) -> None:
+        """Sends several messages concurrently, e.g. to different recipient groups.
+
+        At most `max_in_flight` messages are sent at the same time and each one
+        is bounded by `send_timeout`. Messages are delivered with `aiosmtplib`
+        on the running loop if it is installed, otherwise via the blocking
+        client in a worker thread.
+
+        Args:
+            messages (Iterable[EmailMessage]): Messages to send.
+
+        Raises:
+            Exception: The first error, after all messages were attempted.
+        """
+        semaphore = asyncio.Semaphore(self.config.max_in_flight)
+
+        async def send(msg: EmailMessage) -> None:
+            async with semaphore:
+                await asyncio.wait_for(self._send_async(msg), self.config.send_timeout)
+
+        outcomes = await asyncio.gather(*(send(m) for m in messages), return_exceptions=True)
+        errors = [o for o in outcomes if isinstance(o, BaseException)]
+        if errors:
+            if len(errors) > 1:
+                self.logger.error("%d of %d emails could not be sent", len(errors), len(outcomes))
+            raise errors[0]
+
+    def build_message(
+        self, subject: str, message: str, recipients: list[str] | None = None
+    ) -> EmailMessage:
+        """Builds an email from the configured sender.
+
+        If the body exceeds `attachment_threshold`, the logs of a report are
+        attached gzip-compressed and only the summary is kept inline.
+
+        Args:
+            subject (str): Email subject.
+            message (str): Email body text.
+            recipients (Optional[List[str]]): Recipients; defaults to the
+                configured recipients.
+
+        Returns:
+            EmailMessage: The email.
+        """
         msg = EmailMessage()
         msg["From"] = self.config.sender
-        msg["To"] = ", ".join(self.config.recipient)
+        msg["To"] = ", ".join(recipients or self.config.recipient)
         msg["Subject"] = subject
-        msg.set_content(message)
 
+        threshold = self.config.attachment_threshold
+        if threshold is None or len(message) <= threshold:
+            msg.set_content(message)
+            return msg
+
+        # Compress the logs in place instead of splitting off a copy of them
+        section = message.find(ReportFormatter.LOGS_SECTION)
+        logs_start = 0 if section < 0 else section + len(ReportFormatter.LOGS_SECTION)
+        summary = message[:section] if section > 0 else ""
+        filename = self.config.attachment_name
+        msg.set_content(
+            f"{summary}{ReportFormatter.LOGS_SECTION}"
+            f"({len(message) - logs_start} characters, attached as {filename})"
+        )
+        msg.add_attachment(
+            self._compress(message, start=logs_start),
+            maintype="application",
+            subtype="gzip",
+            filename=filename,
+        )
+        return msg
+
+    @staticmethod
+    def _compress(text: str, start: int = 0, chunk_size: int = 64 * 1024) -> bytes:
+        """Gzip-compresses the end of a text, encoding it chunk by chunk.
+
+        Only one chunk of the text is copied and encoded at a time. The
+        compressed data is copied once more when it is returned, and the email
+        package base64-encodes it when the message is sent.
+
+        Args:
+            text (str): Text to compress.
+            start (int): Offset of the first character to compress.
+            chunk_size (int): Number of characters encoded at a time.
+
+        Returns:
+            bytes: The gzip data.
+        """
+        buffer = io.BytesIO()
+        with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as gz:
+            for offset in range(start, len(text), chunk_size):
+                gz.write(text[offset : offset + chunk_size].encode("utf-8"))
+        return buffer.getvalue()
+
+    def close(self) -> None:
+        """Closes all kept-alive SMTP sessions."""
+        if self._pool is not None:
+            self._pool.close()
+
+    def _send(self, msg: EmailMessage) -> None:
+        """Sends a message on a pooled session, reconnecting once if it was dropped.
+
+        Only a session reused from the pool is retried: a new session that is
+        dropped points to a server problem that a reconnect would not solve.
+
+        Args:
+            msg (EmailMessage): The message to send.
+        """
+        pool = self._get_pool()
+        reused = False
+        try:
+            with pool.connection() as (server, reused):
+                server.send_message(msg)
+        except SMTPServerDisconnected as e:
+            if not reused:
+                raise
+            self.logger.debug("SMTP session lost (%s), reconnecting", e)
+            with pool.connection(fresh=True) as (server, _):
+                server.send_message(msg)
+
+    async def _send_async(self, msg: EmailMessage) -> None:
+        """Sends a message without blocking the event loop.
+
+        Args:
+            msg (EmailMessage): The message to send.
+        """
+        if aiosmtplib is None:
+            await asyncio.to_thread(self._send, msg)
+            return
+
+        login = bool(self.config.user and self.config.password)
+        await aiosmtplib.send(
+            msg,
+            hostname=self.config.server,
+            port=self.config.port,
+            username=self.config.user if login else None,
+            password=self.config.password if login else None,
+            use_tls=self.config.security is SmtpSecurity.SSL,
+            start_tls=self.config.security is SmtpSecurity.STARTTLS,
+        )
+
+    def _get_pool(self) -> SmtpConnectionPool:
+        """Creates the session pool on first use.
+
+        Returns:
+            SmtpConnectionPool: The pool of this notifier.
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = SmtpConnectionPool(
+                    self._connect,
+                    max_idle=self.config.pool_size if self.config.keep_alive else 0,
+                    idle_timeout=self.config.idle_timeout,
+                )
+            return self._pool
+
+    def _connect(self) -> SMTP:
+        """Opens an SMTP session, including STARTTLS and login if configured.
+
+        Returns:
+            SMTP: The ready-to-send session.
+        """
         if self.config.security is SmtpSecurity.SSL:
             smtp_cls = SMTP_SSL
         else:
             smtp_cls = SMTP
 
-        with smtp_cls(self.config.server, self.config.port) as server:
+        server = smtp_cls(self.config.server, self.config.port)
+        try:
             if self.config.security is SmtpSecurity.STARTTLS:
                 server.starttls()
 
             if self.config.user and self.config.password:
                 server.login(self.config.user, self.config.password)
-
-            server.send_message(msg)
-
-            server.quit()
+        except BaseException:
+            server.close()
+            raise
+        return server
@@ -1,7 +1,7 @@
 from typing import List
 from enum import Enum
 
-from pydantic import field_validator
+from pydantic import Field, field_validator
 
 from opsflow.core.config import NotifierConfig
 
@@ -22,6 +22,20 @@ class EmailNotifierConfig(NotifierConfig):
         port (int): SMTP server port. Defaults to 25.
         sender (str): Email sender address.
         recipient (str | List[str]): Email recipient address.
+        keep_alive (bool): Keep SMTP sessions open between messages and reuse
+            them after a NOOP health check. Defaults to False.
+        pool_size (int): Maximum number of idle sessions kept open. Defaults to 1.
+        idle_timeout (float): Seconds after which an idle session is closed
+            instead of reused. Defaults to 300.
+        max_in_flight (int): Maximum number of emails sent concurrently by the
+            asyncio delivery path. Defaults to 4.
+        send_timeout (Optional[float]): Maximum time in seconds to send a single
+            email on the asyncio delivery path. Unbounded if None.
+        attachment_threshold (Optional[int]): Body size in characters above
+            which the logs of a report are sent as gzip attachment. Disabled
+            if None.
+        attachment_name (str): File name of the attachment.
+            Defaults to "opsflow-report.log.gz".
     """
 
     server: str = "localhost"
@@ -31,6 +45,13 @@ class EmailNotifierConfig(NotifierConfig):
     security: SmtpSecurity = SmtpSecurity.NONE
     password: str | None = None
     user: str | None = None
+    keep_alive: bool = False
+    pool_size: int = Field(default=1, ge=1)
+    idle_timeout: float = Field(default=300.0, gt=0)
+    max_in_flight: int = Field(default=4, ge=1)
+    send_timeout: float | None = Field(default=None, gt=0)
+    attachment_threshold: int | None = Field(default=None, ge=0)
+    attachment_name: str = "opsflow-report.log.gz"
 
     @field_validator("port")
     def validate_port(cls, v: int) -> int:
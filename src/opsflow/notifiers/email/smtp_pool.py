@@ -0,0 +1,135 @@
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from smtplib import SMTP
+
+
+class SmtpConnectionPool:
+    """Pool of authenticated SMTP sessions that are kept alive between messages.
+
+    Idle sessions are checked with NOOP before they are reused and replaced if
+    the server dropped them, so the TLS handshake and AUTH are performed once
+    per session instead of once per message.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], SMTP],
+        max_idle: int = 1,
+        idle_timeout: float = 300.0,
+    ) -> None:
+        """Initializes an empty pool.
+
+        Args:
+            connect (Callable[[], SMTP]): Opens a new, ready-to-send session.
+            max_idle (int): Maximum number of idle sessions kept open. With 0,
+                every session is closed after use.
+            idle_timeout (float): Seconds after which an idle session is closed
+                instead of reused.
+        """
+        self._connect = connect
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self._idle: list[tuple[SMTP, float]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self, fresh: bool = False) -> Iterator[tuple[SMTP, bool]]:
+        """Provides a healthy session for the duration of the block.
+
+        A session that raised an SMTP or connection error is discarded, since
+        its protocol state is unknown; any other session is returned to the pool.
+
+        Args:
+            fresh (bool): Open a new session instead of reusing an idle one.
+
+        Yields:
+            Tuple[SMTP, bool]: The session and whether it was reused from the pool.
+        """
+        server, reused = (self._connect(), False) if fresh else self._acquire()
+        try:
+            yield server, reused
+        except OSError:  # includes SMTPException
+            self._discard(server)
+            raise
+        except BaseException:
+            self._release(server)
+            raise
+        self._release(server)
+
+    def close(self) -> None:
+        """Closes all idle sessions."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            self._quit(server)
+
+    def _acquire(self) -> tuple[SMTP, bool]:
+        """Takes a healthy idle session or opens a new one.
+
+        Returns:
+            Tuple[SMTP, bool]: The session and whether it was reused from the pool.
+        """
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                server, released = self._idle.pop()
+            if time.monotonic() - released > self.idle_timeout:
+                self._quit(server)
+            elif self._alive(server):
+                return server, True
+            else:
+                self._discard(server)
+        return self._connect(), False
+
+    def _release(self, server: SMTP) -> None:
+        """Returns a session to the pool or closes it if the pool is full.
+
+        Args:
+            server (SMTP): The session.
+        """
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append((server, time.monotonic()))
+                return
+        self._quit(server)
+
+    @staticmethod
+    def _alive(server: SMTP) -> bool:
+        """Checks whether the server still accepts commands on a session.
+
+        Args:
+            server (SMTP): The session.
+
+        Returns:
+            bool: True if the server answered NOOP with 250.
+        """
+        try:
+            code, _ = server.noop()
+        except OSError:
+            return False
+        return code == 250
+
+    @staticmethod
+    def _quit(server: SMTP) -> None:
+        """Ends a session gracefully.
+
+        Args:
+            server (SMTP): The session.
+        """
+        try:
+            server.quit()
+        except OSError:
+            SmtpConnectionPool._discard(server)
+
+    @staticmethod
+    def _discard(server: SMTP) -> None:
+        """Closes a broken session without talking to the server.
+
+        Args:
+            server (SMTP): The session.
+        """
+        with suppress(OSError):
+            server.close()
@@ -1,18 +1,22 @@
+import asyncio
 import logging
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
-
-import rclone as rc_adapter
+from typing import TYPE_CHECKING
 
 from opsflow.core.models import Result, Severity
-from opsflow.core.plugin import Plugin
+from opsflow.core.plugin import AsyncPlugin
 
 from .rclone_config import RCloneAction, RClonePluginConfig, RCloneTask
 
+if TYPE_CHECKING:
+    # The adapter is imported when the first task runs, so that discovering
+    # or configuring the plugin does not pay for it
+    import rclone as rc_adapter
+
 
-class RClonePlugin(Plugin[RClonePluginConfig]):
-    """Plugin to execute rclone tasks in parallel with OpsFlow."""
+class RClonePlugin(AsyncPlugin[RClonePluginConfig]):
+    """Plugin to execute rclone tasks concurrently on a single event loop."""
 
     name = "rclone"
 
@@ -26,37 +30,43 @@ class RClonePlugin(Plugin[RClonePluginConfig]):
             ctx (Context): Workflow execution context.
         """
         super().__init__(config, logger, ctx)
-        self._lock = threading.Lock()
         self.logger.debug("RClonePlugin initialized")
 
-    def run(self) -> None:
-        """Run all configured RClone tasks in parallel using ThreadPoolExecutor."""
+    async def run(self) -> None:
+        """Run all configured RClone tasks concurrently, bounded by `max_workers`."""
         if not self.config.tasks:
             self.logger.info("No rclone tasks configured.")
             return
 
         self.logger.debug(
-            f"Starting ThreadPoolExecutor with max_workers={self.config.max_workers}"
+            f"Running {len(self.config.tasks)} tasks with max_workers={self.config.max_workers}"
         )
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            future_to_task = {
-                executor.submit(self._run_task, task): task
-                for task in self.config.tasks
-            }
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
-                desc = f" ({task.description})" if task.description else ""
-                try:
-                    future.result()
-                    self.logger.debug(
-                        f"Task '{task.name}'{desc} completed successfully {task.src} → {task.dest}"
-                    )
-                except Exception as e:
-                    self.logger.exception(
-                        f"Unhandled exception in task '{task.name}'{desc}: {e}"
-                    )
-
-    def _run_task(self, task: RCloneTask) -> rc_adapter.CommandResult | None:
+        semaphore = asyncio.Semaphore(self.config.max_workers)
+
+        async def bounded(task: RCloneTask) -> "rc_adapter.CommandResult | None":
+            async with semaphore:
+                return await self._run_task(task)
+
+        outcomes = await asyncio.gather(
+            *(bounded(task) for task in self.config.tasks), return_exceptions=True
+        )
+        for task, outcome in zip(self.config.tasks, outcomes, strict=True):
+            desc = f" ({task.description})" if task.description else ""
+            if isinstance(outcome, BaseException):
+                self.logger.exception(
+                    f"Unhandled exception in task '{task.name}'{desc}: {outcome}",
+                    exc_info=outcome,
+                )
+                self._add_result(self._step_name(task), None, f"Exception: {outcome}")
+                if not isinstance(outcome, Exception):
+                    # e.g. cancellation; propagate instead of reporting success
+                    raise outcome
+            else:
+                self.logger.debug(
+                    f"Task '{task.name}'{desc} completed successfully {task.src} → {task.dest}"
+                )
+
+    async def _run_task(self, task: RCloneTask) -> "rc_adapter.CommandResult | None":
         """
         Execute a single RClone task.
 
@@ -66,31 +76,33 @@ class RClonePlugin(Plugin[RClonePluginConfig]):
         Returns:
             Optional[CommandResult]: Result of the rclone command.
         """
-        step = (
-            f"RClone {task.action.value.capitalize()} - {task.name or 'Unnamed Task'}"
-        )
+        step = self._step_name(task)
         desc = f" ({task.description})" if task.description else ""
         self.logger.debug(f"Starting task '{task.name}'{desc} {task.src} → {task.dest}")
 
-        rc_config = rc_adapter.RCloneConfig(
-            config_file=(
-                Path(self.config.config_file) if self.config.config_file else None
-            ),
-            default_flags=self._default_flags_from_ctx(),
-        )
-        rc = rc_adapter.RClone(rc_config)
-
         try:
+            # A missing adapter or an invalid configuration fails the task
+            import rclone as rc_adapter
+
+            rc_config = rc_adapter.RCloneConfig(
+                config_file=(
+                    Path(self.config.config_file) if self.config.config_file else None
+                ),
+                default_flags=self._default_flags_from_ctx(),
+            )
+            rc = rc_adapter.RClone(rc_config)
+
             if task.action == RCloneAction.SYNC:
-                cmd_result = self._sync(rc, task)
+                cmd_result = await self._sync(rc, task)
             elif task.action == RCloneAction.COPY:
-                cmd_result = self._copy(rc, task)
+                cmd_result = await self._copy(rc, task)
             elif task.action == RCloneAction.MOVE:
-                cmd_result = self._move(rc, task)
+                cmd_result = await self._move(rc, task)
             else:
                 raise ValueError(f"Unsupported RClone action: {task.action}")
 
             self._add_result(step, cmd_result)
+            self._record_metrics(task, cmd_result)
             self.logger.debug(f"Task completed: '{task.name}'{desc}")
             return cmd_result
 
@@ -101,6 +113,19 @@ class RClonePlugin(Plugin[RClonePluginConfig]):
             self._add_result(step, None, f"Exception: {e}")
             return None
 
+    @staticmethod
+    def _step_name(task: RCloneTask) -> str:
+        """
+        Return the result step name of a task.
+
+        Args:
+            task (RCloneTask): The task.
+
+        Returns:
+            str: The step name.
+        """
+        return f"RClone {task.action.value.capitalize()} - {task.name or 'Unnamed Task'}"
+
     def _default_flags_from_ctx(self) -> list[str]:
         """
         Generate default rclone flags based on the workflow context.
@@ -117,11 +142,11 @@ class RClonePlugin(Plugin[RClonePluginConfig]):
     def _add_result(
         self,
         step_name: str,
-        cmd_result: rc_adapter.CommandResult | None,
+        cmd_result: "rc_adapter.CommandResult | None",
         exception_message: str | None = None,
     ) -> None:
         """
-        Add a task result to the workflow context in a thread-safe manner.
+        Add a task result to the workflow context.
 
         Args:
             step_name (str): Name of the step.
@@ -134,32 +159,79 @@ class RClonePlugin(Plugin[RClonePluginConfig]):
                 if cmd_result.success
                 else (Severity.ERROR if cmd_result.errors else Severity.WARNING)
             )
-            message_parts = [
-                f"Return code: {cmd_result.return_code}",
-                f"Files transferred: {cmd_result.files_transferred}",
-                f"Bytes transferred: {cmd_result.bytes_transferred}",
-                f"Duration: {cmd_result.duration_seconds:.2f}s",
-            ]
-            if cmd_result.errors:
-                message_parts.append(f"Errors: {[str(e) for e in cmd_result.errors]}")
-            if cmd_result.stdout:
-                message_parts.append(f"Stdout: {cmd_result.stdout}")
-            if cmd_result.stderr:
-                message_parts.append(f"Stderr: {cmd_result.stderr}")
-            message = "\n".join(message_parts)
+            details = {
+                "return_code": cmd_result.return_code,
+                "files_transferred": cmd_result.files_transferred,
+                "bytes_transferred": cmd_result.bytes_transferred,
+                "duration_seconds": cmd_result.duration_seconds,
+                "errors": [str(e) for e in cmd_result.errors],
+                "stdout": cmd_result.stdout,
+                "stderr": cmd_result.stderr,
+            }
+            # Output can be large; it is only formatted when the report is built
+            plugin_result = Result(
+                step=step_name,
+                severity=severity,
+                message=partial(self._format_message, details),
+                details=details,
+            )
         else:
             severity = Severity.ERROR
             message = exception_message or "Unknown error executing RClone task."
+            plugin_result = Result(step=step_name, severity=severity, message=message)
 
-        plugin_result = Result(step=step_name, severity=severity, message=message)
-        with self._lock:
-            self.ctx.add_result(plugin_result)
-            self.logger.debug(
-                f"Result added for step '{step_name}' with severity {severity.name}"
-            )
+        self.ctx.add_result(plugin_result)
+        self.logger.debug(f"Result added for step '{step_name}' with severity {severity.name}")
+
+    @staticmethod
+    def _format_message(details: dict) -> str:
+        """
+        Format the details of a task result into a human-readable message.
+
+        Args:
+            details (dict): Details of the task result.
+
+        Returns:
+            str: The message.
+        """
+        message_parts = [
+            f"Return code: {details['return_code']}",
+            f"Files transferred: {details['files_transferred']}",
+            f"Bytes transferred: {details['bytes_transferred']}",
+            f"Duration: {details['duration_seconds']:.2f}s",
+        ]
+        if details["errors"]:
+            message_parts.append(f"Errors: {details['errors']}")
+        if details["stdout"]:
+            message_parts.append(f"Stdout: {details['stdout']}")
+        if details["stderr"]:
+            message_parts.append(f"Stderr: {details['stderr']}")
+        return "\n".join(message_parts)
+
+    def _record_metrics(self, task: RCloneTask, cmd_result: "rc_adapter.CommandResult") -> None:
+        """
+        Record the transfer statistics of a task in the workflow metrics.
+
+        Args:
+            task (RCloneTask): The executed task.
+            cmd_result (CommandResult): Result of the rclone command.
+        """
+        name = task.name or "unnamed"
+        self.ctx.metrics.add(
+            "opsflow_rclone_transferred_bytes",
+            cmd_result.bytes_transferred,
+            help="Bytes transferred by rclone tasks in the last run.",
+            task=name,
+        )
+        self.ctx.metrics.add(
+            "opsflow_rclone_transferred_files",
+            cmd_result.files_transferred,
+            help="Files transferred by rclone tasks in the last run.",
+            task=name,
+        )
 
     @staticmethod
-    def _sync(rc: rc_adapter.RClone, task: RCloneTask) -> rc_adapter.CommandResult:
+    async def _sync(rc: "rc_adapter.RClone", task: RCloneTask) -> "rc_adapter.CommandResult":
         """
         Execute rclone sync for a given task.
 
@@ -170,10 +242,10 @@ class RClonePlugin(Plugin[RClonePluginConfig]):
         Returns:
             CommandResult: Result of the rclone sync command.
         """
-        return __import__("asyncio").run(rc.sync(task.src, task.dest, task.options))
+        return await rc.sync(task.src, task.dest, task.options)
 
     @staticmethod
-    def _copy(rc: rc_adapter.RClone, task: RCloneTask) -> rc_adapter.CommandResult:
+    async def _copy(rc: "rc_adapter.RClone", task: RCloneTask) -> "rc_adapter.CommandResult":
         """
         Execute rclone copy for a given task.
 
@@ -184,10 +256,10 @@ class RClonePlugin(Plugin[RClonePluginConfig]):
         Returns:
             CommandResult: Result of the rclone copy command.
         """
-        return __import__("asyncio").run(rc.copy(task.src, task.dest, task.options))
+        return await rc.copy(task.src, task.dest, task.options)
 
     @staticmethod
-    def _move(rc: rc_adapter.RClone, task: RCloneTask) -> rc_adapter.CommandResult:
+    async def _move(rc: "rc_adapter.RClone", task: RCloneTask) -> "rc_adapter.CommandResult":
         """
         Execute rclone move for a given task.
 
@@ -198,4 +270,4 @@ class RClonePlugin(Plugin[RClonePluginConfig]):
         Returns:
             CommandResult: Result of the rclone move command.
         """
-        return __import__("asyncio").run(rc.move(task.src, task.dest, task.options))
+        return await rc.move(task.src, task.dest, task.options)
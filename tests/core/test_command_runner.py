@@ -0,0 +1,355 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from opsflow.core.config import CommandConfig, IoPriorityClass
+from opsflow.core.models import Severity
+from opsflow.core.utils import CommandRunner
+from opsflow.core.utils.command_runner import _LineSplitter, _OutputTail
+
+
+def python_cmd(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+@pytest.fixture
+def runner(logger):
+    CommandRunner.configure(dry_run=False, logger=logger, config=CommandConfig(max_concurrency=2))
+    yield CommandRunner
+    CommandRunner.configure(dry_run=False, logger=logger)
+
+
+def test_run_async_captures_output(runner):
+    res = asyncio.run(
+        runner.run_async(python_cmd("print('hello'); import sys; sys.exit(3)"), use_sudo=False)
+    )
+
+    assert res.returncode == 3
+    assert res.stdout.strip() == "hello"
+
+
+def test_run_async_check_raises(runner):
+    with pytest.raises(subprocess.CalledProcessError):
+        asyncio.run(runner.run_async(python_cmd("raise SystemExit(1)"), check=True, use_sudo=False))
+
+
+def test_run_async_dry_run_skips_execution(logger):
+    CommandRunner.configure(dry_run=True, logger=logger)
+
+    res = asyncio.run(CommandRunner.run_async(["definitely-not-a-command"]))
+
+    assert res.returncode == 0
+    assert res.args == ["sudo", "definitely-not-a-command"]
+
+
+def test_run_async_timeout_kills_process(runner):
+    start = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        asyncio.run(
+            runner.run_async(python_cmd("import time; time.sleep(30)"), use_sudo=False, timeout=0.2)
+        )
+    assert time.monotonic() - start < 10
+
+
+def test_run_as_result_async_reports_failures(runner):
+    async def main():
+        return await asyncio.gather(
+            runner.run_as_result_async(python_cmd("pass"), "ok", use_sudo=False),
+            runner.run_as_result_async(
+                python_cmd("import sys; sys.stderr.write('bad'); sys.exit(1)"),
+                "failing",
+                use_sudo=False,
+            ),
+            runner.run_as_result_async(
+                python_cmd("import time; time.sleep(30)"), "slow", use_sudo=False, timeout=0.2
+            ),
+        )
+
+    ok, failing, slow = asyncio.run(main())
+
+    assert ok is None
+    assert failing.severity == Severity.ERROR
+    assert "bad" in failing.message
+    assert slow.severity == Severity.ERROR
+    assert "timed out" in slow.message
+
+
+def test_run_async_bounds_concurrency(runner):
+    code = "import time; print(time.monotonic()); time.sleep(0.3)"
+
+    async def main():
+        return await asyncio.gather(
+            *(runner.run_async(python_cmd(code), use_sudo=False) for _ in range(4))
+        )
+
+    start = time.monotonic()
+    asyncio.run(main())
+
+    # max_concurrency=2 -> four commands need at least two rounds
+    assert time.monotonic() - start >= 0.6
+
+
+STREAM_CODE = (
+    "import sys\n"
+    "for i in range(200):\n"
+    "    print(f'line {i}')\n"
+    "sys.stderr.write('warn\\n')\n"
+)
+
+
+def test_run_streams_lines_to_callback(runner):
+    lines = []
+
+    res = runner.run(
+        python_cmd(STREAM_CODE), use_sudo=False, on_line=lambda s, line: lines.append((s, line))
+    )
+
+    assert res.returncode == 0
+    assert ("stdout", "line 0") in lines
+    assert ("stdout", "line 199") in lines
+    assert ("stderr", "warn") in lines
+
+
+def test_run_async_streams_lines_to_callback(runner):
+    lines = []
+
+    res = asyncio.run(
+        runner.run_async(
+            python_cmd(STREAM_CODE), use_sudo=False, on_line=lambda s, line: lines.append((s, line))
+        )
+    )
+
+    assert res.returncode == 0
+    assert [line for s, line in lines if s == "stdout"] == [f"line {i}" for i in range(200)]
+    assert res.stderr == "warn"
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_streaming_retains_bounded_tail(logger, use_async):
+    CommandRunner.configure(
+        dry_run=False,
+        logger=logger,
+        config=CommandConfig(stream_output=True, output_tail_bytes=64),
+    )
+    cmd = python_cmd(STREAM_CODE)
+
+    if use_async:
+        res = asyncio.run(CommandRunner.run_async(cmd, use_sudo=False))
+    else:
+        res = CommandRunner.run(cmd, use_sudo=False)
+
+    assert res.stdout.startswith("[... output truncated ...]")
+    assert res.stdout.endswith("line 199")
+    assert "line 0\n" not in res.stdout
+    assert len(res.stdout) < 128
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_streaming_splits_carriage_returns_and_bounds_long_lines(logger, use_async):
+    CommandRunner.configure(
+        dry_run=False,
+        logger=logger,
+        config=CommandConfig(stream_output=True, output_tail_bytes=64),
+    )
+    code = (
+        "import sys\n"
+        "sys.stdout.write('10%\\r50%\\r100%\\r\\n')\n"
+        "sys.stdout.write('x' * 1_000_000 + 'end')\n"
+    )
+    lines = []
+
+    if use_async:
+        res = asyncio.run(
+            CommandRunner.run_async(
+                python_cmd(code), use_sudo=False, on_line=lambda s, line: lines.append(line)
+            )
+        )
+    else:
+        res = CommandRunner.run(
+            python_cmd(code), use_sudo=False, on_line=lambda s, line: lines.append(line)
+        )
+
+    assert lines[:3] == ["10%", "50%", "100%"]
+    assert len(lines) == 4
+    assert lines[3] == "x" * 1_000_000 + "end"
+    assert res.stdout.endswith("xend")
+    assert len(res.stdout.encode()) < 128
+
+
+def test_lines_split_across_chunks_are_forwarded_whole(logger):
+    CommandRunner.configure(
+        dry_run=False,
+        logger=logger,
+        config=CommandConfig(stream_output=True, output_tail_bytes=0),
+    )
+    code = (
+        "import sys, time\n"
+        "sys.stdout.write('hello wor'); sys.stdout.flush(); time.sleep(0.1)\n"
+        "sys.stdout.write('ld\\n')\n"
+    )
+    lines = []
+
+    res = CommandRunner.run(
+        python_cmd(code), use_sudo=False, on_line=lambda s, line: lines.append(line)
+    )
+
+    assert lines == ["hello world"]
+    assert res.stdout == "[... output truncated ...]\n"
+
+
+def test_line_splitter_bounds_unterminated_output():
+    splitter = _LineSplitter(max_bytes=4)
+
+    lines = splitter.feed(b"hello wor") + splitter.feed(b"ld\n")
+
+    assert lines == [" world"]
+
+
+def test_output_tail_is_measured_in_bytes():
+    tail = _OutputTail(max_bytes=4)
+
+    tail.append("€€€")
+
+    assert tail.text() == "[... output truncated ...]\n€"
+
+
+def test_line_splitter_joins_crlf_across_chunks():
+    splitter = _LineSplitter(max_bytes=1024)
+
+    lines = splitter.feed(b"a\r") + splitter.feed(b"\nb") + splitter.feed(b"c\n") + splitter.flush()
+
+    assert lines == ["a", "bc"]
+
+
+GRANDCHILD_CODE = (
+    "import subprocess, sys, time\n"
+    "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+    "print(child.pid, flush=True)\n"
+    "time.sleep(30)\n"
+)
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # reaped zombies of foreign parents count as dead
+    with open(f"/proc/{pid}/stat") as f:
+        return f.read().split()[2] != "Z"
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="requires /proc")
+@pytest.mark.parametrize("stream", [False, True])
+def test_run_timeout_kills_process_group(logger, stream):
+    CommandRunner.configure(
+        dry_run=False, logger=logger, config=CommandConfig(timeout=0.5, kill_grace_period=1)
+    )
+    lines = []
+
+    with pytest.raises(subprocess.TimeoutExpired) as exc:
+        CommandRunner.run(
+            python_cmd(GRANDCHILD_CODE),
+            use_sudo=False,
+            stream=stream,
+            on_line=lambda s, line: lines.append(line),
+        )
+
+    output = lines[0] if stream else exc.value.output
+    grandchild = int(output.split()[0])
+    time.sleep(0.2)
+    assert not _alive(grandchild)
+
+
+def test_run_as_result_reports_timeout(runner):
+    res = runner.run_as_result(
+        python_cmd("import time; time.sleep(30)"), "slow", use_sudo=False, timeout=0.2
+    )
+
+    assert res.severity == Severity.ERROR
+    assert "timed out after 0.2s" in res.message
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX only")
+def test_run_applies_priority_and_limits(logger):
+    CommandRunner.configure(
+        dry_run=False,
+        logger=logger,
+        config=CommandConfig(nice=5, cpu_time_limit=100, memory_limit=4 * 1024**3),
+    )
+    code = (
+        "import os, resource\n"
+        "print(os.nice(0), resource.getrlimit(resource.RLIMIT_CPU)[0],"
+        " resource.getrlimit(resource.RLIMIT_AS)[0])\n"
+    )
+    base = os.nice(0)
+
+    res = CommandRunner.run(python_cmd(code), use_sudo=False)
+
+    niceness, cpu, mem = map(int, res.stdout.split())
+    assert niceness == min(base + 5, 19)
+    assert cpu == 100
+    assert mem == 4 * 1024**3
+
+
+def test_ionice_prefix(logger):
+    CommandRunner.configure(
+        dry_run=True,
+        logger=logger,
+        config=CommandConfig(ionice_class=IoPriorityClass.IDLE, ionice_level=7),
+    )
+
+    res = CommandRunner.run(["apt-get", "update"])
+
+    assert res.args == ["ionice", "-c", "3", "-n", "7", "sudo", "apt-get", "update"]
+
+
+def test_priority_and_limit_prefixes(logger):
+    CommandRunner.configure(
+        dry_run=True,
+        logger=logger,
+        config=CommandConfig(
+            nice=5, cpu_time_limit=100, memory_limit=1024, ionice_class=IoPriorityClass.IDLE
+        ),
+    )
+
+    res = CommandRunner.run(["apt-get", "update"])
+
+    assert res.args == [
+        "ionice", "-c", "3",
+        "nice", "-n", "5",
+        "prlimit", "--cpu=100", "--as=1024", "--",
+        "sudo", "apt-get", "update",
+    ]  # fmt: skip
+
+
+def test_timeout_none_disables_configured_timeout(logger):
+    CommandRunner.configure(dry_run=False, logger=logger, config=CommandConfig(timeout=0.1))
+
+    res = CommandRunner.run(
+        python_cmd("import time; time.sleep(0.3)"), use_sudo=False, timeout=None
+    )
+
+    assert res.returncode == 0
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_unkillable_command_is_left_running(logger, monkeypatch, stream):
+    # Simulates a sudo command of another user, which cannot be signalled
+    CommandRunner.configure(
+        dry_run=False, logger=logger, config=CommandConfig(kill_grace_period=0.1)
+    )
+    monkeypatch.setattr(CommandRunner, "_signal", classmethod(lambda cls, proc, sig: None))
+    monkeypatch.setattr("opsflow.core.utils.command_runner._KILL_TIMEOUT", 0.1)
+
+    start = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        CommandRunner.run(
+            python_cmd("import time; time.sleep(3)"), use_sudo=False, timeout=0.2, stream=stream
+        )
+
+    assert time.monotonic() - start < 2
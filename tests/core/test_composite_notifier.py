@@ -1,5 +1,10 @@
-import pytest
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
 
+from opsflow.core.models import Severity
 from opsflow.core.notifier.composite import CompositeNotifier
 
 from ..dummies.notifier.dummy_notifier import (
@@ -8,6 +13,7 @@ from ..dummies.notifier.dummy_notifier import (
 )
 from ..dummies.notifier.raising_notifier import RaisingNotifier
 from ..dummies.notifier.recording_notifier import RecordingNotifier
+from ..dummies.notifier.slow_notifier import SlowNotifier
 
 
 def test_composite_forwards_message_to_all_notifiers(logger):
@@ -27,8 +33,8 @@ def test_composite_forwards_message_to_all_notifiers(logger):
     assert recorder.calls == [("subject", "payload")]
 
 
-def test_composite_stops_on_exception_and_skips_remaining(logger):
-    """If a notifier raises, composite should propagate the error and stop processing."""
+def test_composite_isolates_failures_as_results(logger):
+    """A raising notifier must not prevent delivery to the remaining notifiers."""
     comp = CompositeNotifier()
     cfg = DummyNotifierConfig()
 
@@ -38,24 +44,121 @@ def test_composite_stops_on_exception_and_skips_remaining(logger):
     comp.add_notifier(raising)
     comp.add_notifier(recorder)
 
-    with pytest.raises(RuntimeError):
-        comp.notify("s", "m")
+    results = comp.notify("s", "m")
 
-    assert recorder.calls == []  # must not be called
+    assert recorder.calls == [("s", "m")]
+    assert len(results) == 1
+    assert results[0].severity is Severity.ERROR
+    assert results[0].step == "notifier:unnamed"
+    assert "intentional" in results[0].message
 
 
-def test_composite_calls_previous_notifiers_before_exception(logger):
-    """If the second notifier raises, the first one must still have been called."""
+def test_composite_returns_no_results_on_success(logger):
     comp = CompositeNotifier()
-    cfg = DummyNotifierConfig()
+    comp.add_notifier(RecordingNotifier(DummyNotifierConfig(), logger))
 
-    recorder = RecordingNotifier(cfg, logger)
-    raising = RaisingNotifier(cfg, logger)
+    assert comp.notify("alpha", "beta") == []
+    assert CompositeNotifier().notify("alpha", "beta") == []
+
+
+def test_composite_delivers_concurrently_with_per_notifier_timeout(logger):
+    """A slow notifier is cut off at its timeout without delaying the others."""
+    comp = CompositeNotifier()
+    slow = SlowNotifier(DummyNotifierConfig(timeout=0.2), logger)
+    recorder = RecordingNotifier(DummyNotifierConfig(), logger)
 
+    comp.add_notifier(slow)
     comp.add_notifier(recorder)
-    comp.add_notifier(raising)
 
-    with pytest.raises(RuntimeError):
-        comp.notify("alpha", "beta")
+    start = time.monotonic()
+    results = comp.notify("s", "m")
+    elapsed = time.monotonic() - start
+    slow.released.set()
+
+    assert elapsed < 2
+    assert recorder.calls == [("s", "m")]
+    assert [(r.step, r.message) for r in results] == [
+        ("notifier:slow", "Notification timed out after 0.2s")
+    ]
+
+
+def test_composite_deadline_bounds_all_notifiers(logger):
+    comp = CompositeNotifier(deadline=0.2)
+    first = SlowNotifier(DummyNotifierConfig(channel="#a"), logger)
+    second = SlowNotifier(DummyNotifierConfig(channel="#b", timeout=10), logger)
 
-    assert recorder.calls == [("alpha", "beta")]
+    comp.add_notifier(first)
+    comp.add_notifier(second)
+
+    start = time.monotonic()
+    results = comp.notify("s", "m")
+    elapsed = time.monotonic() - start
+    first.released.set()
+    second.released.set()
+
+    assert elapsed < 2
+    assert len(results) == 2
+
+
+def test_composite_ignores_duplicate_notifiers(logger):
+    comp = CompositeNotifier()
+    first = RecordingNotifier(DummyNotifierConfig(), logger)
+    duplicate = RecordingNotifier(DummyNotifierConfig(), logger)
+    other = RecordingNotifier(DummyNotifierConfig(channel="#other"), logger)
+
+    for notifier in (first, duplicate, other, first):
+        comp.add_notifier(notifier)
+    comp.notify("s", "m")
+
+    assert first.calls == [("s", "m")]
+    assert duplicate.calls == []
+    assert other.calls == [("s", "m")]
+
+
+def test_composite_notify_async_isolates_failures_and_timeouts(logger):
+    comp = CompositeNotifier()
+    slow = SlowNotifier(DummyNotifierConfig(timeout=0.2), logger)
+    raising = RaisingNotifier(DummyNotifierConfig(), logger)
+    recorder = RecordingNotifier(DummyNotifierConfig(), logger)
+
+    for notifier in (slow, raising, recorder):
+        comp.add_notifier(notifier)
+
+    async def main():
+        start = time.monotonic()
+        results = await comp.notify_async("s", "m")
+        elapsed = time.monotonic() - start
+        slow.released.set()
+        return results, elapsed
+
+    results, elapsed = asyncio.run(main())
+
+    assert elapsed < 2
+    assert recorder.calls == [("s", "m")]
+    assert [r.step for r in results] == ["notifier:slow", "notifier:unnamed"]
+
+
+def test_hung_notifier_does_not_delay_interpreter_exit():
+    """Threads of notifiers that exceeded their timeout are not joined at exit."""
+    code = (
+        "import logging\n"
+        "from opsflow.core.notifier.composite import CompositeNotifier\n"
+        "from tests.dummies.notifier.dummy_notifier import DummyNotifierConfig\n"
+        "from tests.dummies.notifier.slow_notifier import SlowNotifier\n"
+        "comp = CompositeNotifier(deadline=0.1)\n"
+        "comp.add_notifier(SlowNotifier(DummyNotifierConfig(), logging.getLogger(), delay=60))\n"
+        "print(len(comp.notify('s', 'm')))\n"
+    )
+
+    start = time.monotonic()
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        check=False,
+        cwd=Path(__file__).parents[2],
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+    assert proc.stdout.strip() == "1", proc.stderr
+    assert time.monotonic() - start < 10
@@ -1,12 +1,18 @@
+import os
+
 import pytest
+import yaml
 from pydantic import ValidationError
 
 from opsflow.core.config import CoreConfig, NotifierConfig, PluginConfig
 
 # product code
+from opsflow.core.config import loader as loader_module
 from opsflow.core.config.loader import ConfigLoader
+from opsflow.core.models import Trace
 from opsflow.core.notifier.registry import NotifierRegistry
 from opsflow.core.plugin import PluginRegistry
+from opsflow.core.utils.module_loader import ModuleLoader
 
 from ..dummies.notifier.dummy_notifier import (
     DummyNotifier,
@@ -166,3 +172,269 @@ def test_subclass_validation_fails_on_incorrect_field_type(tmp_path):
 
     with pytest.raises(ValidationError):
         ConfigLoader.load(str(p))
+
+
+CACHED_YAML = """
+dry_run: true
+plugins:
+  plugin_a:
+    enabled: true
+    value: 5
+notifiers:
+  dummy:
+    enabled: true
+    channel: "#ci"
+"""
+
+
+def load_traced(path, cache_dir):
+    trace = Trace()
+    cfg = ConfigLoader.load(str(path), trace=trace, cache_dir=str(cache_dir))
+    return cfg, {s.name for s in trace.spans()}
+
+
+def test_yaml_is_parsed_with_libyaml_if_available():
+    """The C loader is used when PyYAML was built with libyaml."""
+    expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+    assert loader_module._YamlLoader is expected
+
+
+def test_cached_config_is_reused_without_validation(tmp_path):
+    """An unchanged file is loaded from the cache without validating it."""
+    p = tmp_path / "cfg.yaml"
+    p.write_text(CACHED_YAML)
+
+    first, first_spans = load_traced(p, tmp_path / "cache")
+    second, second_spans = load_traced(p, tmp_path / "cache")
+
+    assert "config_load:validate" in first_spans
+    assert second_spans == {"config_load:parse", "config_load:cache"}
+    assert second == first
+    assert second is not first
+    assert isinstance(second.plugins["plugin_a"], PluginAConfig)
+    assert second.notifiers["dummy"].channel == "#ci"
+
+
+def test_cache_is_invalidated_by_content_change(tmp_path):
+    p = tmp_path / "cfg.yaml"
+    p.write_text(CACHED_YAML)
+    load_traced(p, tmp_path / "cache")
+
+    p.write_text(CACHED_YAML.replace("value: 5", "value: 6"))
+    cfg, spans = load_traced(p, tmp_path / "cache")
+
+    assert "config_load:validate" in spans
+    assert cfg.plugins["plugin_a"].value == 6
+
+
+def test_cache_is_invalidated_by_registry_change(tmp_path):
+    p = tmp_path / "cfg.yaml"
+    p.write_text(CACHED_YAML)
+    load_traced(p, tmp_path / "cache")
+
+    del PluginRegistry.entries["plugin_b"]
+    _, spans = load_traced(p, tmp_path / "cache")
+
+    assert "config_load:validate" in spans
+
+
+def test_corrupt_cache_falls_back_to_validation(tmp_path):
+    p = tmp_path / "cfg.yaml"
+    p.write_text(CACHED_YAML)
+    cache_dir = tmp_path / "cache"
+    load_traced(p, cache_dir)
+    for cache_file in cache_dir.glob("config-*.pickle"):
+        cache_file.write_bytes(b"not a pickle")
+
+    cfg, spans = load_traced(p, cache_dir)
+
+    assert "config_load:validate" in spans
+    assert cfg.plugins["plugin_a"].value == 5
+    _, spans = load_traced(p, cache_dir)
+    assert "config_load:validate" not in spans
+
+
+def test_unwritable_cache_is_ignored(tmp_path):
+    p = tmp_path / "cfg.yaml"
+    p.write_text(CACHED_YAML)
+    blocker = tmp_path / "cache"
+    blocker.write_text("not a directory")
+
+    cfg, _ = load_traced(p, blocker)
+
+    assert cfg.dry_run is True
+
+
+def test_configs_of_directory_modules_are_cached(tmp_path):
+    """Config classes of modules loaded by ModuleLoader survive the cache."""
+    plugin_dir = tmp_path / "plugins"
+    plugin_dir.mkdir()
+    (plugin_dir / "cached.py").write_text(
+        "from opsflow.core.config import PluginConfig\n"
+        "from opsflow.core.plugin import Plugin, PluginRegistry\n\n\n"
+        "class CachedConfig(PluginConfig):\n"
+        "    target: str\n\n\n"
+        "@PluginRegistry.register(CachedConfig)\n"
+        "class Cached(Plugin):\n"
+        "    name = 'cached'\n\n"
+        "    def run(self):\n"
+        "        pass\n"
+    )
+    ModuleLoader.load_from_directory(str(plugin_dir))
+    p = tmp_path / "cfg.yaml"
+    p.write_text("plugins:\n  cached:\n    target: /srv\n")
+
+    load_traced(p, tmp_path / "cache")
+    cfg, spans = load_traced(p, tmp_path / "cache")
+
+    assert "config_load:validate" not in spans
+    config_cls = PluginRegistry.entries["cached"].config_cls
+    assert type(cfg.plugins["cached"]) is config_cls
+    assert cfg.plugins["cached"].target == "/srv"
+
+
+def test_registry_fingerprint_tracks_entries():
+    before = PluginRegistry.fingerprint()
+    assert PluginRegistry.fingerprint() == before
+
+    del PluginRegistry.entries["plugin_b"]
+
+    assert PluginRegistry.fingerprint() != before
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def test_includes_and_fragments_are_merged_in_order(tmp_path):
+    """Fragments overlay the including file: mappings merge, lists concatenate."""
+    main = write(
+        tmp_path / "cfg.yaml",
+        """
+        include: [base.yaml, conf.d/*.yaml]
+        dry_run: true
+        plugins:
+          plugin_a:
+            enabled: true
+            value: 1
+            depends_on: [plugin_b]
+        """,
+    )
+    write(tmp_path / "base.yaml", "notifiers:\n  dummy:\n    enabled: true\n    channel: '#base'\n")
+    write(tmp_path / "conf.d" / "20-team-b.yaml", "plugins:\n  plugin_a:\n    value: 3\n")
+    write(
+        tmp_path / "conf.d" / "10-team-a.yaml",
+        "plugins:\n  plugin_a:\n    value: 2\n    depends_on: [backup]\n",
+    )
+
+    cfg = ConfigLoader.load(str(main))
+
+    assert cfg.dry_run is True
+    assert cfg.plugins["plugin_a"].value == 3
+    assert cfg.plugins["plugin_a"].depends_on == ["plugin_b", "backup"]
+    assert cfg.notifiers["dummy"].channel == "#base"
+
+
+def test_nested_includes_are_relative_to_their_file(tmp_path):
+    main = write(tmp_path / "cfg.yaml", "include: teams/all.yaml\n")
+    write(tmp_path / "teams" / "all.yaml", "include: [a.yaml]\n")
+    write(tmp_path / "teams" / "a.yaml", "dry_run: true\n")
+
+    assert ConfigLoader.load(str(main)).dry_run is True
+
+
+def test_circular_include_raises(tmp_path):
+    main = write(tmp_path / "cfg.yaml", "include: other.yaml\n")
+    write(tmp_path / "other.yaml", "include: cfg.yaml\n")
+
+    with pytest.raises(ValueError, match="Circular include"):
+        ConfigLoader.load(str(main))
+
+
+def test_file_included_twice_is_merged_once(tmp_path):
+    main = write(tmp_path / "cfg.yaml", "include: [a.yaml, b.yaml]\n")
+    write(tmp_path / "a.yaml", "include: common.yaml\n")
+    write(tmp_path / "b.yaml", "include: ./common.yaml\n")
+    write(
+        tmp_path / "common.yaml",
+        "plugins:\n  plugin_a:\n    enabled: true\n    depends_on: [plugin_b]\n",
+    )
+
+    cfg = ConfigLoader.load(str(main))
+
+    assert cfg.plugins["plugin_a"].depends_on == ["plugin_b"]
+
+
+def test_missing_include_raises_but_empty_glob_does_not(tmp_path):
+    main = write(tmp_path / "cfg.yaml", "include: [conf.d/*.yaml]\ndry_run: true\n")
+    assert ConfigLoader.load(str(main)).dry_run is True
+
+    write(main, "include: missing.yaml\n")
+    with pytest.raises(OSError):
+        ConfigLoader.load(str(main))
+
+
+def test_malformed_fragments_are_reported_with_their_path(tmp_path):
+    main = write(tmp_path / "cfg.yaml", "include: frag.yaml\n")
+    frag = write(tmp_path / "frag.yaml", "unknown_section: 1\n")
+
+    with pytest.raises(ValueError, match=r"frag\.yaml: unknown configuration section"):
+        ConfigLoader.load(str(main))
+
+    write(frag, "- not a mapping\n")
+    with pytest.raises(TypeError, match=r"frag\.yaml"):
+        ConfigLoader.load(str(main))
+
+
+def test_environment_overrides_values(tmp_path, monkeypatch):
+    p = write(tmp_path / "cfg.yaml", CACHED_YAML)
+    monkeypatch.setenv("OPSFLOW_DRY_RUN", "false")
+    monkeypatch.setenv("OPSFLOW_PLUGINS__PLUGIN_A__VALUE", "9")
+    monkeypatch.setenv("OPSFLOW_LOGGING__FILE", "/tmp/opsflow.log")
+    monkeypatch.setenv("OPSFLOW_HOME", "/opt/opsflow")
+
+    cfg = ConfigLoader.load(str(p), env_prefix=loader_module.ENV_PREFIX)
+
+    assert cfg.dry_run is False
+    assert cfg.plugins["plugin_a"].value == 9
+    assert cfg.logging.file == "/tmp/opsflow.log"
+
+    assert ConfigLoader.load(str(p)).dry_run is True
+
+
+def test_environment_override_of_scalar_section_raises(tmp_path, monkeypatch):
+    p = write(tmp_path / "cfg.yaml", CACHED_YAML)
+    monkeypatch.setenv("OPSFLOW_DRY_RUN__VALUE", "1")
+
+    with pytest.raises(TypeError, match="OPSFLOW_DRY_RUN__VALUE"):
+        ConfigLoader.load(str(p), env_prefix=loader_module.ENV_PREFIX)
+
+
+def test_unchanged_fragments_are_not_reparsed(tmp_path, monkeypatch):
+    main = write(tmp_path / "cfg.yaml", "include: conf.d/*.yaml\n" + CACHED_YAML)
+    write(tmp_path / "conf.d" / "a.yaml", "plugins:\n  plugin_b:\n    enabled: true\n")
+    team = write(tmp_path / "conf.d" / "b.yaml", "plugins:\n  plugin_a:\n    value: 6\n")
+    parsed = []
+    yaml_load = yaml.load
+
+    def counting_load(stream, Loader):
+        parsed.append(getattr(stream, "name", stream))
+        return yaml_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(yaml, "load", counting_load)
+    cache_dir = tmp_path / "cache"
+
+    load_traced(main, cache_dir)
+    assert len(parsed) == 3
+
+    parsed.clear()
+    write(team, "plugins:\n  plugin_a:\n    value: 7\n")
+    stat = team.stat()
+    os.utime(team, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    cfg, spans = load_traced(main, cache_dir)
+
+    assert parsed == [str(team)]
+    assert "config_load:validate" in spans
+    assert cfg.plugins["plugin_a"].value == 7
@@ -0,0 +1,100 @@
+import asyncio
+import threading
+
+from opsflow.core.models import Result, ResultCollector, Severity
+from opsflow.core.models.context import Context
+
+
+def result(step: str) -> Result:
+    return Result(step=step, severity=Severity.INFO, message=step)
+
+
+def test_results_are_added_directly_without_buffer():
+    collector = ResultCollector()
+    ctx = Context(result_collector=collector, dry_run=True)
+
+    ctx.add_result(result("a"))
+    ctx.add_results([result("b")])
+
+    assert [r.step for r in collector.all_results()] == ["a", "b"]
+
+
+def test_buffered_results_are_merged_in_insertion_order():
+    collector = ResultCollector()
+    ctx = Context(result_collector=collector, dry_run=True)
+
+    with ctx.buffered_results():
+        ctx.add_result(result("task:b"))
+        ctx.add_result(None)
+        ctx.add_results([result("task:a"), result("task:c")])
+        assert collector.count() == 0
+        assert [r.step for r in ctx.all_results()] == ["task:b", "task:a", "task:c"]
+
+    assert [r.step for r in collector.all_results()] == ["task:b", "task:a", "task:c"]
+
+
+def test_blocks_are_merged_in_the_order_they_were_opened():
+    collector = ResultCollector()
+    ctx = Context(result_collector=collector, dry_run=True)
+    first_opened, second_closed = threading.Event(), threading.Event()
+
+    def first() -> None:
+        with ctx.buffered_results():
+            first_opened.set()
+            second_closed.wait()
+            ctx.add_result(result("first"))
+
+    thread = threading.Thread(target=first)
+    thread.start()
+    first_opened.wait()
+    with ctx.buffered_results():
+        ctx.add_result(result("second"))
+    assert collector.count() == 0
+    assert [r.step for r in ctx.all_results()] == ["second"]
+    second_closed.set()
+    thread.join()
+
+    assert [r.step for r in collector.all_results()] == ["first", "second"]
+
+
+def test_buffers_are_merged_as_contiguous_blocks_per_thread():
+    collector = ResultCollector()
+    ctx = Context(result_collector=collector, dry_run=True)
+    barrier = threading.Barrier(2)
+
+    def plugin(name: str) -> None:
+        with ctx.buffered_results():
+            for i in range(100):
+                ctx.add_result(result(f"{name}:{i:03d}"))
+                if i == 50:
+                    barrier.wait()
+
+    threads = [threading.Thread(target=plugin, args=(n,)) for n in ("x", "y")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    steps = [r.step for r in collector.all_results()]
+    blocks = [steps[:100], steps[100:]]
+    assert sorted(block[0][0] for block in blocks) == ["x", "y"]
+    for block in blocks:
+        assert block == sorted(s for s in steps if s[0] == block[0][0])
+
+
+def test_tasks_share_the_buffer_of_their_plugin():
+    collector = ResultCollector()
+    ctx = Context(result_collector=collector, dry_run=True)
+
+    async def task(step: str) -> None:
+        await asyncio.sleep(0)
+        ctx.add_result(result(step))
+
+    async def plugin() -> None:
+        with ctx.buffered_results():
+            await asyncio.gather(task("t2"), task("t1"))
+            assert collector.count() == 0
+
+    asyncio.run(plugin())
+
+    assert [r.step for r in collector.all_results()] == ["t2", "t1"]
@@ -0,0 +1,42 @@
+import json
+import threading
+
+import pytest
+
+from opsflow.core.config import LogFormat, LoggingConfig
+from opsflow.core.models import Trace
+from opsflow.core.utils import logger_setup
+from opsflow.core.utils.logger_setup import setup_logger
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_format_includes_run_context(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(logger_setup, "orjson", None)
+    log_file = tmp_path / "json.log"
+    trace = Trace()
+    logger, memory_handler = setup_logger(
+        LoggingConfig(file=str(log_file), format=LogFormat.JSON), trace=trace
+    )
+
+    try:
+        with trace.span("plugin:rclone:run", "plugin_step"):
+            logger.getChild("rclone").info("copied %d files", 3)
+        logger.warning("done", extra={"step": "custom", "duration": 1.5})
+        for handler in logger.handlers:
+            handler.flush()
+
+        first, second = (json.loads(line) for line in log_file.read_text().splitlines())
+        assert first["message"] == "copied 3 files"
+        assert first["plugin"] == "rclone"
+        assert first["step"] == "plugin:rclone:run"
+        assert first["run_id"] == trace.trace_id
+        assert first["thread"] == threading.current_thread().name
+        assert first["duration"] >= 0
+        assert second["plugin"] is None
+        assert (second["step"], second["duration"]) == ("custom", 1.5)
+        assert "] INFO: copied 3 files" in memory_handler.get_value()
+    finally:
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
@@ -0,0 +1,130 @@
+import logging
+import threading
+
+import pytest
+
+from opsflow.core.config import LoggingConfig
+from opsflow.core.utils.logger_setup import MemoryLogHandler, QueueLogHandler, setup_logger
+
+
+@pytest.fixture
+def make_logger():
+    loggers = []
+
+    def _make(handler: MemoryLogHandler) -> logging.Logger:
+        logger = logging.getLogger(f"memory_handler_test_{len(loggers)}")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        logger.addHandler(handler)
+        loggers.append((logger, handler))
+        return logger
+
+    yield _make
+    for logger, handler in loggers:
+        logger.removeHandler(handler)
+
+
+class TestMemoryLogHandler:
+    def test_keeps_last_records_and_all_warnings_in_order(self, make_logger):
+        handler = MemoryLogHandler(max_records=2)
+        logger = make_logger(handler)
+
+        logger.info("one")
+        logger.warning("two")
+        logger.debug("three")
+        logger.info("four")
+        logger.error("five")
+        logger.info("six")
+
+        assert handler.get_value().splitlines() == [
+            "[... 2 DEBUG/INFO log records dropped ...]",
+            "WARNING two",
+            "INFO four",
+            "ERROR five",
+            "INFO six",
+        ]
+
+    def test_limits_retained_bytes(self, make_logger):
+        handler = MemoryLogHandler(max_bytes=100)
+        logger = make_logger(handler)
+
+        logger.debug("STDOUT: %s", "x" * 80)
+        logger.debug("STDOUT: %s", "y" * 80)
+
+        lines = handler.get_value().splitlines()
+        assert lines[0] == "[... 1 DEBUG/INFO log records dropped ...]"
+        assert lines[1].endswith("y" * 80)
+
+    def test_formats_lazily(self):
+        handler = MemoryLogHandler()
+        handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        formatted = []
+
+        class Lazy:
+            def __str__(self):
+                formatted.append(True)
+                return "value"
+
+        record = logging.LogRecord("lazy", logging.INFO, __file__, 1, "lazy %s", (Lazy(),), None)
+        handler.handle(record)
+
+        assert formatted == []
+        assert handler.get_value() == "INFO lazy value\n"
+
+    def test_renders_exceptions_immediately(self, make_logger):
+        handler = MemoryLogHandler()
+        logger = make_logger(handler)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+
+        assert handler._important[0][1].exc_info is None
+        value = handler.get_value()
+        assert "ERROR failed" in value
+        assert "ValueError: boom" in value
+
+    def test_clear(self, make_logger):
+        handler = MemoryLogHandler(max_records=1)
+        logger = make_logger(handler)
+        logger.info("a")
+        logger.info("b")
+
+        handler.clear()
+
+        assert handler.get_value() == ""
+
+
+def test_setup_logger_applies_memory_limits(tmp_path):
+    config = LoggingConfig(file=str(tmp_path / "limits.log"), memory_max_records=5)
+
+    logger, handler = setup_logger(config)
+    try:
+        assert handler.max_records == 5
+        assert handler.max_bytes == 1024 * 1024
+    finally:
+        for h in list(logger.handlers):
+            logger.removeHandler(h)
+            h.close()
+
+
+def test_queue_pipeline_hands_records_to_background_thread(tmp_path):
+    config = LoggingConfig(file=str(tmp_path / "queued.log"), debug=True, queue=True)
+    logger, memory_handler = setup_logger(config)
+    threads = []
+    memory_handler.emit = lambda record: threads.append(threading.current_thread())
+
+    try:
+        (queue_handler,) = logger.handlers
+        assert isinstance(queue_handler, QueueLogHandler)
+
+        logger.info("queued")
+        queue_handler.flush()
+
+        assert threads and threads[0] is not threading.current_thread()
+        assert "queued" in (tmp_path / "queued.log").read_text()
+    finally:
+        logger.removeHandler(queue_handler)
+        queue_handler.close()
@@ -0,0 +1,95 @@
+from opsflow.core.config import MetricsConfig
+from opsflow.core.models import MetricsCollector, Result, Severity, Trace
+from opsflow.core.plugin.registry import PluginRegistry
+from opsflow.core.system import PackageManager, SystemManager
+from opsflow.core.utils import PrometheusTextfileExporter
+from opsflow.core.workflow import Workflow
+
+from ..dummies.plugins import FailingPlugin, PluginAConfig
+
+
+class NoopPackageManager(PackageManager):
+    def update(self, dry_run: bool = False) -> Result | None:
+        return None
+
+    def upgrade(self, dry_run: bool = False) -> Result | None:
+        return None
+
+
+class RebootingManager(SystemManager):
+    def _is_reboot_required(self) -> bool:
+        return True
+
+    def _is_new_stable_os_available(self) -> bool:
+        return False
+
+
+def parse(text: str) -> dict[str, float]:
+    return {
+        series: float(value)
+        for series, _, value in (line.rpartition(" ") for line in text.splitlines())
+        if not series.startswith("#")
+    }
+
+
+class TestMetricsCollector:
+    def test_add_accumulates_per_series(self):
+        metrics = MetricsCollector()
+
+        metrics.add("bytes", 10, task="a")
+        metrics.add("bytes", 5, task="a")
+        metrics.add("bytes", 1, task="b")
+        metrics.set("flag", 1)
+
+        assert [(s.name, s.labels, s.value) for s in metrics.samples()] == [
+            ("bytes", (("task", "a"),), 15.0),
+            ("bytes", (("task", "b"),), 1.0),
+            ("flag", (), 1.0),
+        ]
+
+
+class TestPrometheusTextfileExporter:
+    def test_render_escapes_help_and_labels(self):
+        metrics = MetricsCollector()
+        metrics.set("m", 2.5, help="a\\b\nc", task='x"y')
+
+        text = PrometheusTextfileExporter.render(metrics.samples())
+
+        assert text == '# HELP m a\\\\b\\nc\n# TYPE m gauge\nm{task="x\\"y"} 2.5\n'
+
+    def test_failed_run_keeps_last_success(self, tmp_path):
+        path = tmp_path / "opsflow.prom"
+        exporter = PrometheusTextfileExporter(str(path))
+        exporter.export([], Trace(), MetricsCollector())
+        last_success = parse(path.read_text())["opsflow_last_success_timestamp_seconds"]
+
+        failed = [Result(step="s", severity=Severity.ERROR, message="m")]
+        exporter.export(failed, Trace(), MetricsCollector())
+
+        values = parse(path.read_text())
+        assert values["opsflow_run_success"] == 0
+        assert values["opsflow_last_success_timestamp_seconds"] == last_success
+        assert values['opsflow_results{severity="error"}'] == 1
+        assert [p.name for p in tmp_path.iterdir()] == ["opsflow.prom"]
+
+
+class TestWorkflowMetricsExport:
+    def test_run_all_writes_textfile(self, config_with_plugins, tmp_path):
+        path = tmp_path / "textfile" / "opsflow.prom"
+        PluginRegistry.register_class(FailingPlugin, config=PluginAConfig)
+        config_with_plugins.plugins[FailingPlugin.name] = PluginAConfig(value=1)
+        config_with_plugins.metrics = MetricsConfig(textfile=str(path))
+        manager = RebootingManager(pkg_manager=NoopPackageManager())
+        workflow = Workflow(system_manager=manager, config=config_with_plugins)
+
+        workflow.run_all()
+
+        values = parse(path.read_text())
+        assert values["opsflow_run_duration_seconds"] > 0
+        assert values['opsflow_plugin_duration_seconds{plugin="plugin_a"}'] >= 0
+        assert 'opsflow_plugin_duration_seconds{plugin="failing_plugin"}' in values
+        assert values['opsflow_results{severity="error"}'] == 2
+        assert values['opsflow_results{severity="warning"}'] == 1
+        assert values["opsflow_reboot_required"] == 1
+        assert values["opsflow_run_success"] == 0
+        assert "opsflow_last_success_timestamp_seconds" not in values
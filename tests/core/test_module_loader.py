@@ -1,6 +1,10 @@
 import sys
-from typing import Protocol, cast
+from importlib.metadata import EntryPoint
 from pathlib import Path
+from typing import Protocol, cast
+
+import pytest
+
 from opsflow.core.utils.module_loader import ModuleLoader
 
 
@@ -64,3 +68,117 @@ def test_load_directory_is_idempotent(tmp_path):
 
     assert first.keys() == second.keys()
     assert cast(_PluginModule, next(iter(second.values()))).X == 1
+
+
+PLUGIN_SOURCE = """
+from opsflow.core.config import PluginConfig
+from opsflow.core.plugin import Plugin, PluginRegistry
+
+
+class {cls}Config(PluginConfig):
+    pass
+
+
+@PluginRegistry.register(config={cls}Config)
+class {cls}(Plugin):
+    name = "{name}"
+
+    def run(self):
+        pass
+"""
+
+
+def write_plugin(directory: Path, module: str, name: str) -> None:
+    cls = "".join(part.capitalize() for part in name.split("_"))
+    (directory / f"{module}.py").write_text(PLUGIN_SOURCE.format(cls=cls, name=name))
+
+
+def test_scan_directory_finds_components_without_importing(tmp_path):
+    pkg_dir = tmp_path / "plugins"
+    pkg_dir.mkdir()
+    write_plugin(pkg_dir, "backup", "backup")
+    (pkg_dir / "dynamic.py").write_text("Registry.register_class(make(), None)")
+
+    files = ModuleLoader.scan_directory(str(pkg_dir))
+
+    assert files["backup.py"]["components"] == [
+        {"name": "backup", "class": "Backup", "config": "BackupConfig"}
+    ]
+    assert files["backup.py"]["dynamic"] is False
+    assert files["dynamic.py"]["dynamic"] is True
+    assert modules_from_dir(pkg_dir) == {}
+    assert (pkg_dir / ".opsflow-manifest.json").exists()
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        (
+            "from opsflow.core.plugin.registry import register\n\n@register()\nclass A:\n"
+            "    name = 'a'\n"
+        ),
+        "if ENABLED:\n    @PluginRegistry.register()\n    class A:\n        name = 'a'\n",
+        "def setup():\n    @PluginRegistry.register()\n    class A:\n        name = 'a'\n",
+        "register = PluginRegistry.register\n",
+        "@PluginRegistry.register()\nclass A:\n    name = NAME\n",
+    ],
+    ids=["bare-decorator", "conditional", "in-function", "alias", "computed-name"],
+)
+def test_scan_marks_unrecognized_registrations_dynamic(tmp_path, source):
+    dynamic, components = ModuleLoader._scan_source(source.encode(), tmp_path / "m.py")
+
+    assert dynamic is True
+    assert components == []
+
+
+def test_scan_directory_reuses_manifest_until_module_changes(tmp_path, monkeypatch):
+    pkg_dir = tmp_path / "plugins"
+    pkg_dir.mkdir()
+    write_plugin(pkg_dir, "backup", "backup")
+    manifest = tmp_path / "cache" / "manifest.json"
+    ModuleLoader.scan_directory(str(pkg_dir), manifest=str(manifest))
+
+    parsed = []
+    original = ModuleLoader._scan_source
+    monkeypatch.setattr(
+        ModuleLoader,
+        "_scan_source",
+        staticmethod(lambda content, file: parsed.append(file.name) or original(content, file)),
+    )
+
+    ModuleLoader.scan_directory(str(pkg_dir), manifest=str(manifest))
+    assert parsed == []
+
+    write_plugin(pkg_dir, "backup", "nightly_backup")
+    files = ModuleLoader.scan_directory(str(pkg_dir), manifest=str(manifest))
+    assert parsed == ["backup.py"]
+    assert files["backup.py"]["components"][0]["name"] == "nightly_backup"
+
+
+def test_load_directory_imports_only_requested_components(tmp_path):
+    pkg_dir = tmp_path / "plugins"
+    pkg_dir.mkdir()
+    write_plugin(pkg_dir, "backup", "backup")
+    write_plugin(pkg_dir, "prune", "prune")
+    (pkg_dir / "helpers.py").write_text("VALUE = 1")
+
+    ModuleLoader.load_from_directory(str(pkg_dir), names={"backup"})
+
+    assert sorted(name.rsplit(".", 1)[1] for name in modules_from_dir(pkg_dir)) == ["backup"]
+
+
+def test_load_entry_points_filters_by_name(tmp_path, monkeypatch):
+    (tmp_path / "ep_module.py").write_text("LOADED = True")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    eps = [
+        EntryPoint("wanted", "ep_module:LOADED", "opsflow.plugins"),
+        EntryPoint("other", "missing_module:X", "opsflow.plugins"),
+    ]
+    monkeypatch.setattr(
+        "opsflow.core.utils.module_loader.entry_points",
+        lambda group: [ep for ep in eps if ep.group == group],
+    )
+
+    assert ModuleLoader.load_entry_points("opsflow.plugins", names={"wanted"}) == {
+        "wanted": True
+    }
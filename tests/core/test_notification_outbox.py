@@ -0,0 +1,192 @@
+import json
+import threading
+import time
+
+import pytest
+
+from opsflow.core.config import NotificationConfig
+from opsflow.core.notifier.composite import CompositeNotifier
+from opsflow.core.notifier.outbox import NotificationOutbox, OutboxEntry
+from opsflow.core.workflow import Workflow
+
+from ..dummies.notifier.dummy_notifier import DummyNotifierConfig
+from ..dummies.notifier.recording_notifier import RecordingNotifier
+
+
+class FlakyNotifier(RecordingNotifier):
+    name = "flaky"
+
+    def __init__(self, config, logger):
+        super().__init__(config, logger)
+        self.down = True
+
+    def notify(self, subject, message):
+        if self.down:
+            raise ConnectionError("relay unavailable")
+        super().notify(subject, message)
+
+
+@pytest.fixture
+def outbox(tmp_path, logger):
+    return NotificationOutbox(str(tmp_path / "outbox"), logger=logger, backoff=0)
+
+
+def make_composite(outbox, *notifiers):
+    composite = CompositeNotifier(outbox=outbox)
+    for notifier in notifiers:
+        composite.add_notifier(notifier)
+    return composite
+
+
+class TestNotificationOutbox:
+    def test_failed_entries_back_off_exponentially(self, tmp_path, logger):
+        outbox = NotificationOutbox(str(tmp_path), logger=logger, backoff=10, max_backoff=25)
+        entry = outbox.enqueue("email", "s", "m")
+
+        delays = []
+        for _ in range(3):
+            before = time.time()
+            outbox.failed("email", [entry], "boom")
+            (stored,) = outbox.pending("email")
+            delays.append(round(stored.next_attempt - before))
+
+        assert delays == [10, 20, 25]
+        assert stored.attempts == 3
+        assert stored.last_error == "boom"
+        assert outbox.due("email") == []
+        assert outbox.due("email", now=time.time() + 30) == [stored]
+
+    def test_entries_are_discarded_after_max_attempts(self, tmp_path, logger):
+        outbox = NotificationOutbox(str(tmp_path), logger=logger, max_attempts=2)
+        entry = outbox.enqueue("email", "s", "m")
+
+        outbox.failed("email", [entry], "boom")
+        outbox.failed("email", [entry], "boom")
+
+        assert outbox.pending("email") == []
+
+    def test_unreadable_entries_are_skipped(self, tmp_path, logger):
+        outbox = NotificationOutbox(str(tmp_path), logger=logger)
+        outbox.enqueue("email", "s", "m")
+        (tmp_path / "email" / "0-broken.json").write_text("{")
+
+        assert [e.subject for e in outbox.pending("email")] == ["s"]
+
+    def test_combine_lists_newest_report_first(self):
+        entries = [
+            OutboxEntry(id="1", subject="Workflow Report", message="old", created=0),
+            OutboxEntry(id="2", subject="Workflow Report", message="new", created=60),
+        ]
+
+        subject, message = NotificationOutbox.combine(entries)
+
+        assert subject == "Workflow Report (+1 pending)"
+        assert message.index("new") < message.index("old")
+
+
+class TestSpooledDelivery:
+    def test_failed_report_is_retried_by_next_run(self, outbox, logger):
+        flaky = FlakyNotifier(DummyNotifierConfig(), logger)
+        recorder = RecordingNotifier(DummyNotifierConfig(channel="#ops"), logger)
+        composite = make_composite(outbox, flaky, recorder)
+
+        results = composite.notify("first", "report 1")
+
+        assert [r.step for r in results] == ["notifier:flaky"]
+        assert recorder.calls == [("first", "report 1")]
+        assert outbox.pending(composite._queue(recorder)) == []
+        assert [e.subject for e in outbox.pending(composite._queue(flaky))] == ["first"]
+
+        flaky.down = False
+        assert composite.notify("second", "report 2") == []
+
+        assert flaky.calls == [("first", "report 1"), ("second", "report 2")]
+        assert outbox.pending(composite._queue(flaky)) == []
+
+    def test_failed_report_does_not_block_newer_reports(self, outbox, logger):
+        class PoisonNotifier(RecordingNotifier):
+            def notify(self, subject, message):
+                if subject == "poison":
+                    raise ValueError("rejected")
+                super().notify(subject, message)
+
+        notifier = PoisonNotifier(DummyNotifierConfig(), logger)
+        composite = make_composite(outbox, notifier)
+
+        composite.notify("poison", "report 1")
+        results = composite.notify("second", "report 2")
+
+        assert notifier.calls == [("second", "report 2")]
+        assert "rejected" in results[0].message
+        (pending,) = outbox.pending(composite._queue(notifier))
+        assert (pending.subject, pending.attempts) == ("poison", 2)
+
+    def test_pending_reports_are_batched(self, tmp_path, logger):
+        outbox = NotificationOutbox(str(tmp_path), logger=logger, backoff=0, batch=True)
+        flaky = FlakyNotifier(DummyNotifierConfig(), logger)
+        composite = make_composite(outbox, flaky)
+
+        composite.notify("first", "report 1")
+        composite.notify("second", "report 2")
+        flaky.down = False
+        composite.notify("third", "report 3")
+
+        ((subject, message),) = flaky.calls
+        assert subject == "third (+2 pending)"
+        assert message.index("report 3") < message.index("report 2") < message.index("report 1")
+
+    def test_backed_off_report_is_not_retried_early(self, tmp_path, logger):
+        outbox = NotificationOutbox(str(tmp_path), logger=logger, backoff=3600)
+        flaky = FlakyNotifier(DummyNotifierConfig(), logger)
+        composite = make_composite(outbox, flaky)
+
+        composite.notify("first", "report 1")
+        flaky.down = False
+        composite.notify("second", "report 2")
+
+        assert flaky.calls == [("second", "report 2")]
+        (pending,) = outbox.pending(composite._queue(flaky))
+        assert pending.subject == "first"
+        assert pending.attempts == 1
+
+    def test_notifiers_sharing_a_name_use_separate_queues(self, outbox, logger):
+        first = FlakyNotifier(DummyNotifierConfig(channel="#a"), logger)
+        second = FlakyNotifier(DummyNotifierConfig(channel="#b"), logger)
+
+        make_composite(outbox, first, second).notify("s", "m")
+        make_composite(outbox, second).notify("s", "m")
+
+        assert len(outbox.pending(CompositeNotifier._queue(first))) == 1
+        assert len(outbox.pending(CompositeNotifier._queue(second))) == 2
+
+    def test_queue_is_locked_during_delivery(self, outbox, logger):
+        recorder = RecordingNotifier(DummyNotifierConfig(), logger)
+        composite = make_composite(outbox, recorder)
+        queue = composite._queue(recorder)
+        delivered = threading.Event()
+
+        def deliver():
+            composite.notify("s", "m")
+            delivered.set()
+
+        with outbox.lock(queue):
+            thread = threading.Thread(target=deliver)
+            thread.start()
+            assert not delivered.wait(0.2)
+        thread.join()
+
+        assert recorder.calls == [("s", "m")]
+
+
+def test_workflow_spools_reports(config_with_plugins, tmp_path):
+    spool = tmp_path / "outbox"
+    config_with_plugins.notification = NotificationConfig(spool_dir=str(spool))
+    workflow = Workflow(config=config_with_plugins)
+    flaky = FlakyNotifier(DummyNotifierConfig(), workflow._logger)
+    workflow._notifier.add_notifier(flaky)
+
+    workflow.process_results()
+
+    (entry,) = spool.glob("flaky-*/*.json")
+    assert json.loads(entry.read_text())["subject"] == "Workflow Report"
+    assert any(r.step == "notifier:flaky" for r in workflow._result_collector.all_results())
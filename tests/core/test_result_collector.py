@@ -0,0 +1,105 @@
+import pickle
+import sys
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from opsflow.core.models import Result, ResultCollector, Severity
+from opsflow.core.utils.report_formatter import ReportFormatter
+
+
+def result(step: str, severity: Severity) -> Result:
+    return Result(step=step, severity=severity, message=f"{step} done")
+
+
+def test_aggregates_are_maintained_incrementally():
+    collector = ResultCollector()
+    assert collector.overall_severity() is Severity.INFO
+    assert collector.count() == 0
+
+    collector.add(result("a", Severity.WARNING))
+    collector.add(None)
+    collector.add_all([result("b", Severity.INFO), result("c", Severity.WARNING)])
+
+    assert collector.overall_severity() is Severity.WARNING
+    assert collector.count() == 3
+    assert collector.count(Severity.WARNING) == 2
+    assert collector.counts() == {Severity.INFO: 1, Severity.WARNING: 2, Severity.ERROR: 0}
+
+    collector.add(result("d", Severity.ERROR))
+    collector.add(result("e", Severity.INFO))
+
+    assert collector.overall_severity() is Severity.ERROR
+
+
+def test_iter_results_filters_by_severity_in_insertion_order():
+    collector = ResultCollector()
+    collector.add_all(
+        [
+            result("a", Severity.WARNING),
+            result("b", Severity.INFO),
+            result("c", Severity.WARNING),
+        ]
+    )
+
+    assert [r.step for r in collector.iter_results(Severity.WARNING)] == ["a", "c"]
+    assert [r.step for r in collector.iter_results()] == ["a", "b", "c"]
+
+
+def test_iter_results_excludes_results_added_during_iteration():
+    collector = ResultCollector()
+    collector.add(result("a", Severity.INFO))
+
+    steps = []
+    for r in collector.iter_results():
+        steps.append(r.step)
+        collector.add(result("late", Severity.INFO))
+
+    assert steps == ["a"]
+    assert collector.count() == 2
+
+
+def test_report_groups_collector_results_by_severity():
+    collector = ResultCollector()
+    collector.add_all(
+        [
+            result("ok", Severity.INFO),
+            result("broken", Severity.ERROR),
+            result("slow", Severity.WARNING),
+        ]
+    )
+
+    summary = ReportFormatter(collector).summary()
+
+    assert summary.index("ERROR:") < summary.index("WARNING:") < summary.index("INFO:")
+    assert summary == ReportFormatter(collector.all_results()).summary()
+
+
+def test_result_is_frozen_and_slotted():
+    r = result("a", Severity.INFO)
+
+    with pytest.raises(FrozenInstanceError):
+        r.message = "changed"
+    assert not hasattr(r, "__dict__")
+    assert r == result("a", Severity.INFO)
+    assert hash(r) == hash(result("a", Severity.INFO))
+
+
+def test_result_interns_step_and_renders_message_once():
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "rendered"
+
+    name = "check"
+    step = f"plugin:{name}"  # built at runtime, not a constant
+    r = Result(step=step, severity=Severity.INFO, message=render, details={"rows": 3})
+
+    assert r.step is sys.intern("plugin:check")
+    assert calls == []
+    assert r.message == "rendered"
+    assert r.message == "rendered"
+    assert calls == [1]
+    assert r.details == {"rows": 3}
+    assert pickle.loads(pickle.dumps(r)) == r
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import subprocess
+import sys
+
+import pytest
+
+from opsflow.core.config import TracingConfig
+from opsflow.core.models import Trace
+from opsflow.core.utils import CommandRunner, OtlpJsonEncoder, SpanExporter
+from opsflow.core.workflow import Workflow
+
+
+class RecordingExporter(SpanExporter):
+    def __init__(self):
+        self.traces = []
+
+    def export(self, trace):
+        self.traces.append([s.name for s in trace.spans()])
+
+
+class FailingExporter(SpanExporter):
+    def export(self, trace):
+        raise OSError("collector unreachable")
+
+
+def attributes(span: dict) -> dict:
+    return {a["key"]: a["value"] for a in span["attributes"]}
+
+
+@pytest.fixture
+def trace(logger):
+    trace = Trace()
+    CommandRunner.configure(dry_run=False, logger=logger, trace=trace)
+    yield trace
+    CommandRunner.configure(dry_run=False, logger=logger)
+
+
+class TestCommandSpans:
+    def test_command_is_child_span_with_argv_and_exit_code(self, trace):
+        with trace.span("plugin:x:run", "plugin_step"):
+            CommandRunner.run([sys.executable, "-c", "raise SystemExit(3)"], use_sudo=False)
+
+        span = trace.spans(category="command")[0]
+        assert span.parent_id == trace.find("plugin:x:run").span_id
+        assert span.name == f"command:{sys.executable.rsplit('/', 1)[-1]}"
+        assert span.attributes["process.command_args"][1:] == ["-c", "raise SystemExit(3)"]
+        assert span.attributes["process.exit.code"] == 3
+        assert span.error == "exit code 3"
+        assert span.duration > 0
+
+    def test_async_command_timeout_is_recorded(self, trace):
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(
+                CommandRunner.run_async(
+                    [sys.executable, "-c", "import time; time.sleep(30)"],
+                    use_sudo=False,
+                    timeout=0.2,
+                )
+            )
+
+        span = trace.spans(category="command")[0]
+        assert "timed out" in span.error
+        assert "process.exit.code" not in span.attributes
+
+    def test_no_spans_without_trace(self, logger):
+        CommandRunner.configure(dry_run=True, logger=logger)
+
+        assert CommandRunner.run(["true"]).returncode == 0
+
+
+class TestOtlpJsonEncoder:
+    def test_encodes_spans_with_hierarchy_and_status(self):
+        trace = Trace()
+        with (
+            trace.span("workflow", "workflow"),
+            pytest.raises(RuntimeError),
+            trace.span("plugin:x", "plugin", retries=2),
+        ):
+            raise RuntimeError("boom")
+
+        doc = OtlpJsonEncoder.encode(trace, service_name="host-maintenance")
+
+        resource = attributes(doc["resourceSpans"][0]["resource"])
+        assert resource["service.name"] == {"stringValue": "host-maintenance"}
+        assert "host.name" in resource
+
+        spans = doc["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        workflow, plugin = spans
+        assert workflow["traceId"] == plugin["traceId"] == trace.trace_id
+        assert len(trace.trace_id) == 32
+        assert workflow["parentSpanId"] == ""
+        assert plugin["parentSpanId"] == workflow["spanId"]
+        assert int(workflow["startTimeUnixNano"]) <= int(plugin["startTimeUnixNano"])
+        assert int(plugin["endTimeUnixNano"]) <= int(workflow["endTimeUnixNano"])
+        assert workflow["status"] == {"code": 0}
+        assert plugin["status"] == {"code": 2, "message": "boom"}
+        assert attributes(plugin) == {
+            "opsflow.category": {"stringValue": "plugin"},
+            "retries": {"intValue": "2"},
+        }
+
+    def test_encodes_attribute_types(self):
+        assert OtlpJsonEncoder._value(True) == {"boolValue": True}
+        assert OtlpJsonEncoder._value(1.5) == {"doubleValue": 1.5}
+        assert OtlpJsonEncoder._value(["a", 1]) == {
+            "arrayValue": {"values": [{"stringValue": "a"}, {"intValue": "1"}]}
+        }
+
+
+class TestWorkflowSpanExport:
+    def test_run_all_appends_otlp_line_per_run(self, config_with_plugins, tmp_path):
+        path = tmp_path / "traces" / "opsflow.jsonl"
+        config_with_plugins.tracing = TracingConfig(otlp_file=str(path))
+        workflow = Workflow(config=config_with_plugins)
+
+        workflow.run_all()
+        workflow.run_all()
+
+        first, second = (
+            json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+            for line in path.read_text().splitlines()
+        )
+        assert {"config_load", "workflow", "plugins", "plugin:plugin_a"} <= {
+            s["name"] for s in first
+        }
+        # every run is exported as its own trace
+        assert "config_load" not in {s["name"] for s in second}
+        assert [s["name"] for s in second].count("workflow") == 1
+        assert first[0]["traceId"] != second[0]["traceId"]
+
+    def test_exporters_receive_trace_and_failures_are_isolated(self, config_with_plugins):
+        recording = RecordingExporter()
+        workflow = Workflow(
+            config=config_with_plugins, span_exporters=[FailingExporter(), recording]
+        )
+
+        workflow.run_all()
+
+        assert "workflow" in recording.traces[0]
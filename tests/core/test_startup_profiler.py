@@ -0,0 +1,174 @@
+import json
+import sys
+import zipfile
+
+import yaml
+
+from opsflow.core.config import ProfilingConfig
+from opsflow.core.config.loader import ConfigLoader
+from opsflow.core.models import Severity, Trace
+from opsflow.core.utils import StartupProfiler
+from opsflow.core.workflow import Workflow
+
+
+def write_modules(tmp_path, monkeypatch):
+    """Create a module importing a nested module and make both importable."""
+    (tmp_path / "profiled_outer.py").write_text("import profiled_inner\n")
+    (tmp_path / "profiled_inner.py").write_text("import time\n\ntime.sleep(0.02)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "profiled_outer", raising=False)
+    monkeypatch.delitem(sys.modules, "profiled_inner", raising=False)
+
+
+class TestStartupProfiler:
+    def test_records_import_timings(self, tmp_path, monkeypatch):
+        write_modules(tmp_path, monkeypatch)
+        profiler = StartupProfiler()
+
+        profiler.start()
+        import profiled_outer  # noqa: F401
+
+        profiler.stop()
+
+        timings = {t.module: t for t in profiler.imports()}
+        outer, inner = timings["profiled_outer"], timings["profiled_inner"]
+        assert inner.duration >= 0.02
+        assert outer.duration >= inner.duration
+        assert outer.self_duration < inner.duration
+        assert profiler.imports()[0].module == "profiled_inner"
+        assert profiler.total >= outer.duration
+
+    def test_shared_loaders_are_not_modified(self, tmp_path, monkeypatch):
+        archive = tmp_path / "modules.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("zipped_outer.py", "import zipped_inner\n")
+            zf.writestr("zipped_inner.py", "VALUE = 1\n")
+        monkeypatch.syspath_prepend(str(archive))
+        for name in ("zipped_outer", "zipped_inner"):
+            monkeypatch.delitem(sys.modules, name, raising=False)
+        profiler = StartupProfiler()
+
+        profiler.start()
+        import zipped_outer
+
+        profiler.stop()
+
+        assert zipped_outer.zipped_inner.VALUE == 1
+        assert {t.module for t in profiler.imports()} >= {"zipped_outer", "zipped_inner"}
+        assert "exec_module" not in vars(zipped_outer.__loader__._loader)
+
+    def test_stop_removes_import_hook(self):
+        profiler = StartupProfiler()
+        profiler.start()
+        assert profiler._timer in sys.meta_path
+
+        profiler.stop()
+
+        assert profiler._timer not in sys.meta_path
+
+    def test_phases_are_taken_from_trace(self):
+        trace = Trace()
+        with trace.span("config_load", "phase"):
+            pass
+        with trace.span("plugin:a", "plugin"):
+            pass
+        profiler = StartupProfiler()
+        profiler.start()
+
+        profiler.stop(trace)
+
+        assert [name for name, _ in profiler.phases()] == ["config_load"]
+
+    def test_check_budget_reports_exceeded_entries(self, tmp_path, monkeypatch):
+        write_modules(tmp_path, monkeypatch)
+        profiler = StartupProfiler()
+        profiler.start()
+        import profiled_outer  # noqa: F401
+
+        profiler.stop()
+
+        violations = profiler.check_budget(
+            {
+                "total": 0.0,
+                "import:profiled_inner": 0.001,
+                "import:profiled_outer": 60.0,
+                "unknown_phase": 0.0,
+            }
+        )
+        assert len(violations) == 2
+        assert violations[0].startswith("import:profiled_inner took ")
+        assert violations[1].startswith("total took ")
+
+    def test_report_and_json(self, tmp_path, monkeypatch):
+        write_modules(tmp_path, monkeypatch)
+        trace = Trace()
+        profiler = StartupProfiler()
+        profiler.start()
+        with trace.span("module_load:plugins", "phase"):
+            import profiled_outer  # noqa: F401
+        profiler.stop(trace)
+
+        report = profiler.report(limit=1)
+        assert "module_load:plugins" in report
+        assert "profiled_inner" in report
+        assert "profiled_outer" not in report
+
+        target = tmp_path / "out" / "profile.json"
+        profiler.write_json(str(target))
+        data = json.loads(target.read_text())
+        assert data["total"] == profiler.total
+        assert data["phases"][0]["name"] == "module_load:plugins"
+        assert {i["module"] for i in data["imports"]} >= {"profiled_inner", "profiled_outer"}
+
+
+class TestConfigLoaderPhases:
+    def test_parse_and_validate_are_traced(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.safe_dump({"dry_run": True}))
+        trace = Trace()
+
+        ConfigLoader.load(str(path), trace=trace)
+
+        assert [s.name for s in trace.spans("phase")] == [
+            "config_load:parse",
+            "config_load:validate",
+        ]
+
+
+class TestWorkflowStartupProfile:
+    def test_disabled_by_default(self, config):
+        workflow = Workflow(config=config)
+
+        assert workflow._profiler is None
+
+    def test_profile_is_reported(self, tmp_path, config):
+        report_file = tmp_path / "startup.json"
+        config.profiling = ProfilingConfig(report_file=str(report_file))
+
+        workflow = Workflow(config=config, profile_startup=True)
+
+        data = json.loads(report_file.read_text())
+        phases = {p["name"] for p in data["phases"]}
+        assert {"config_load", "logger_setup", "build:notifiers", "build:plugins"} <= phases
+        assert workflow._profiler._timer not in sys.meta_path
+        assert workflow._result_collector.count() == 0
+
+    def test_enabled_by_command_line_flag(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.safe_dump({"dry_run": True}))
+        monkeypatch.setattr(sys, "argv", ["opsflow", "--profile-startup", str(path)])
+
+        workflow = Workflow()
+
+        assert workflow._profiler is not None
+        assert workflow.trace.find("config_load:parse") is not None
+
+    def test_exceeded_budget_is_a_warning(self, config):
+        config.profiling = ProfilingConfig(enabled=True, budgets={"total": 0.0})
+
+        workflow = Workflow(config=config)
+
+        (result,) = workflow._result_collector.all_results()
+        assert result.step == "startup_profile"
+        assert result.severity == Severity.WARNING
+        assert result.message.startswith("Startup budget exceeded: total took ")
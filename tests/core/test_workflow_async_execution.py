@@ -0,0 +1,83 @@
+import asyncio
+import threading
+
+from opsflow.core.plugin import PluginRegistry
+from opsflow.core.workflow import Workflow
+
+from ..dummies.plugins import AsyncPluginC, PluginA, PluginAConfig
+
+
+class TestWorkflowAsyncExecution:
+    """Test the asyncio execution path of the workflow."""
+
+    def _workflow(self, config):
+        PluginRegistry.register_class(PluginA, config=PluginAConfig)
+        PluginRegistry.register_class(AsyncPluginC, config=PluginAConfig)
+        config.plugins = {
+            PluginA.name: PluginAConfig(enabled=True),
+            AsyncPluginC.name: PluginAConfig(enabled=True),
+        }
+        return Workflow(config=config)
+
+    def test_run_all_async_runs_async_plugins_on_caller_loop(self, config):
+        """Async plugins should run on the loop driving the workflow."""
+        workflow = self._workflow(config)
+        async_plugin = next(p for p in workflow._plugins if isinstance(p, AsyncPluginC))
+
+        async def main():
+            await workflow.run_all_async()
+            return asyncio.get_running_loop()
+
+        loop = asyncio.run(main())
+
+        assert async_plugin.loop is loop
+        assert async_plugin.torn_down is True
+        messages = {r.message for r in workflow._result_collector.results}
+        assert {"Executed Plugin A", "Executed async plugin"} <= messages
+
+    def test_run_plugins_async_offloads_sync_plugins(self, config):
+        """Sync plugins should not block the event loop thread."""
+        workflow = self._workflow(config)
+        sync_plugin = next(p for p in workflow._plugins if isinstance(p, PluginA))
+        threads = []
+        original_run = sync_plugin.run
+
+        def run():
+            threads.append(threading.current_thread())
+            original_run()
+
+        sync_plugin.run = run
+
+        asyncio.run(workflow.run_plugins_async())
+
+        assert threads
+        assert threads[0] is not threading.main_thread()
+
+    def test_sync_run_plugins_supports_async_plugins(self, config):
+        """Async plugins should also run in the synchronous execution path."""
+        workflow = self._workflow(config)
+
+        workflow.run_plugins(parallel=True)
+
+        messages = {r.message for r in workflow._result_collector.results}
+        assert "Executed async plugin" in messages
+
+    def test_async_plugin_failure_is_recorded(self, config):
+        """Exceptions from async plugins should become error results."""
+        workflow = self._workflow(config)
+        async_plugin = next(p for p in workflow._plugins if isinstance(p, AsyncPluginC))
+
+        async def failing_run():
+            raise RuntimeError("async boom")
+
+        async_plugin.run = failing_run
+
+        asyncio.run(workflow.run_plugins_async())
+
+        errors = [r for r in workflow._result_collector.results if "run:plugin_async" in r.step]
+        assert errors
+        assert errors[0].message == "async boom"
+        assert async_plugin.torn_down is True
+        log = workflow._memory_handler.get_value()
+        assert "Traceback" in log
+        assert 'raise RuntimeError("async boom")' in log
@@ -38,3 +38,13 @@ class TestWorkflowConfiguration:
         from opsflow.core.notifier.composite import CompositeNotifier
 
         assert isinstance(workflow._notifier, CompositeNotifier)
+
+    def test_environment_overrides_are_opt_in(self, tmp_path, monkeypatch):
+        """Environment variables should only override the file with a prefix."""
+        path = tmp_path / "config.yaml"
+        path.write_text(f"dry_run: true\nlogging:\n  file: {tmp_path / 'opsflow.log'}\n")
+        monkeypatch.setenv("OPSFLOW_DRY_RUN", "false")
+
+        assert Workflow(config_path=str(path))._config.dry_run is True
+        workflow = Workflow(config_path=str(path), config_env_prefix="OPSFLOW_")
+        assert workflow._config.dry_run is False
@@ -1,6 +1,6 @@
 from unittest.mock import Mock, patch
 
-from opsflow.core.models import Severity
+from opsflow.core.models import Result, Severity
 from opsflow.core.workflow import Workflow
 
 
@@ -74,3 +74,30 @@ class TestWorkflowErrorHandling:
             if r.severity == Severity.WARNING and "teardown" in r.step
         ]
         assert len(warning_results) > 0
+
+    def test_plugin_errors_are_reported_with_the_plugin_results(self, config):
+        """A failed run should be reported within the results of its plugin."""
+        workflow = Workflow(config=config)
+
+        def make_plugin(name, fails):
+            def run():
+                workflow._plugin_ctx.add_result(
+                    Result(step=f"{name}:partial", severity=Severity.INFO, message="")
+                )
+                if fails:
+                    raise RuntimeError("Run failed")
+
+            plugin = Mock(depends_on=())
+            plugin.name = name
+            plugin.run.side_effect = run
+            return plugin
+
+        workflow._plugins = [make_plugin("first", True), make_plugin("second", False)]
+
+        workflow.run_plugins(parallel=True)
+
+        assert [r.step for r in workflow._result_collector.results] == [
+            "first:partial",
+            "plugin:run:first",
+            "second:partial",
+        ]
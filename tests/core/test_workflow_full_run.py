@@ -1,5 +1,8 @@
+import asyncio
 from unittest.mock import Mock, patch
 
+import pytest
+
 from opsflow.core.models import Result, Severity
 from opsflow.core.workflow import Workflow
 
@@ -49,3 +52,19 @@ class TestWorkflowFullRun:
             workflow.process_results()
 
             mock_plugins.assert_called_once()
+
+    def test_workflow_run_all_closes_notifiers(self, config_with_plugins):
+        """Notifiers should be closed at the end of a run, even if it fails."""
+        workflow = Workflow(config=config_with_plugins)
+        notifier = Mock()
+        workflow._notifier._notifiers = [notifier]
+
+        workflow.run_all()
+        asyncio.run(workflow.run_all_async())
+        with (
+            patch.object(workflow, "run_plugins", side_effect=RuntimeError("boom")),
+            pytest.raises(RuntimeError),
+        ):
+            workflow.run_all()
+
+        assert notifier.close.call_count == 3
@@ -1,6 +1,9 @@
 import logging
+from importlib.metadata import EntryPoint
 from unittest.mock import Mock, patch
 
+from opsflow.core.config import DiscoveryConfig, PluginConfig
+from opsflow.core.plugin import PluginRegistry
 from opsflow.core.workflow import Workflow
 
 
@@ -59,3 +62,58 @@ class TestWorkflowInitialization:
         with patch("opsflow.core.utils.module_loader.ModuleLoader.load_from_directory"):
             workflow = Workflow(config=config, notifier_dir=str(notifier_dir))
             assert workflow._config is not None
+
+    def test_lazy_discovery_imports_only_enabled_plugins(self, tmp_path, config):
+        """With lazy discovery, modules of disabled plugins are not imported."""
+        plugin_dir = tmp_path / "plugins"
+        plugin_dir.mkdir()
+        for name in ("backup", "prune"):
+            (plugin_dir / f"{name}.py").write_text(
+                "from opsflow.core.plugin import Plugin, PluginRegistry\n\n\n"
+                "@PluginRegistry.register()\n"
+                f"class {name.capitalize()}(Plugin):\n"
+                f"    name = '{name}'\n\n"
+                "    def run(self):\n"
+                "        pass\n"
+            )
+        config.discovery = DiscoveryConfig(lazy=True, manifest_dir=str(tmp_path / "cache"))
+        config.plugins = {
+            "backup": PluginConfig(enabled=True),
+            "prune": PluginConfig(enabled=False),
+        }
+
+        workflow = Workflow(config=config, plugin_dir=str(plugin_dir))
+
+        assert set(PluginRegistry.entries) == {"backup"}
+        assert [p.name for p in workflow._plugins] == ["backup"]
+        assert (tmp_path / "cache" / "plugins-manifest.json").exists()
+
+    def test_yaml_config_of_entry_point_plugin(self, tmp_path, monkeypatch):
+        """Entry point plugins named in YAML are validated with their own config."""
+        (tmp_path / "ep_archive.py").write_text(
+            "from opsflow.core.config import PluginConfig\n"
+            "from opsflow.core.plugin import Plugin\n\n\n"
+            "class ArchiveConfig(PluginConfig):\n"
+            "    target: str\n\n\n"
+            "class Archive(Plugin[ArchiveConfig]):\n"
+            "    name = 'archive'\n\n"
+            "    def run(self):\n"
+            "        pass\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        eps = [EntryPoint("archive", "ep_archive:Archive", "opsflow.plugins")]
+        monkeypatch.setattr(
+            "opsflow.core.utils.module_loader.entry_points",
+            lambda group: [ep for ep in eps if ep.group == group],
+        )
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            f"logging:\n  file: {tmp_path / 'opsflow.log'}\n"
+            "discovery:\n  lazy: true\n  entry_points: true\n"
+            "plugins:\n  archive:\n    target: /srv/archive\n"
+        )
+
+        workflow = Workflow(config_path=str(path))
+
+        assert [p.name for p in workflow._plugins] == ["archive"]
+        assert workflow._plugins[0].config.target == "/srv/archive"
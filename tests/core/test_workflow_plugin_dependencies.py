@@ -0,0 +1,139 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from opsflow.core.config import PluginConfig
+from opsflow.core.models import Severity
+from opsflow.core.workflow import Workflow
+from opsflow.core.workflow.scheduler import PluginScheduler
+
+
+def make_plugin(name, calls, depends_on=(), fail=False, delay=0.0):
+    plugin = Mock()
+    plugin.name = name
+    plugin.depends_on = tuple(depends_on)
+
+    def run():
+        time.sleep(delay)
+        calls.append(name)
+        if fail:
+            raise RuntimeError(f"{name} failed")
+
+    plugin.run.side_effect = run
+    return plugin
+
+
+def skipped(workflow):
+    return {
+        r.step.rsplit(":", 1)[1]
+        for r in workflow._result_collector.results
+        if r.step.startswith("plugin:skipped:")
+    }
+
+
+class TestPluginScheduler:
+    """Test dependency-aware plugin scheduling."""
+
+    def test_dependencies_merge_class_and_config(self):
+        plugin = Mock()
+        plugin.depends_on = ("backup",)
+        plugin.config = PluginConfig(depends_on=["backup", "snapshot"])
+
+        assert PluginScheduler.dependencies_of(plugin) == ["backup", "snapshot"]
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_dependencies_run_before_dependents(self, config, parallel):
+        calls = []
+        workflow = Workflow(config=config)
+        workflow._plugins = [
+            make_plugin("prune", calls, depends_on=["backup"]),
+            make_plugin("backup", calls, delay=0.05),
+            make_plugin("report", calls, depends_on=["prune", "backup"]),
+        ]
+
+        workflow.run_plugins(parallel=parallel)
+
+        assert calls == ["backup", "prune", "report"]
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_dependents_of_failed_plugins_are_skipped(self, config, parallel):
+        calls = []
+        workflow = Workflow(config=config)
+        workflow._plugins = [
+            make_plugin("backup", calls, fail=True),
+            make_plugin("prune", calls, depends_on=["backup"]),
+            make_plugin("cleanup", calls, depends_on=["prune"]),
+            make_plugin("independent", calls),
+        ]
+
+        workflow.run_plugins(parallel=parallel)
+
+        assert sorted(calls) == ["backup", "independent"]
+        assert skipped(workflow) == {"prune", "cleanup"}
+        assert all(
+            r.severity == Severity.WARNING
+            for r in workflow._result_collector.results
+            if r.step.startswith("plugin:skipped:")
+        )
+
+    def test_missing_dependency_and_cycles_are_skipped(self, config):
+        calls = []
+        workflow = Workflow(config=config)
+        workflow._plugins = [
+            make_plugin("orphan", calls, depends_on=["not_enabled"]),
+            make_plugin("a", calls, depends_on=["b"]),
+            make_plugin("b", calls, depends_on=["a"]),
+            make_plugin("free", calls),
+        ]
+
+        workflow.run_plugins()
+
+        assert calls == ["free"]
+        assert skipped(workflow) == {"orphan", "a", "b"}
+
+    def test_plugins_are_skipped_only_once(self, config):
+        calls = []
+        workflow = Workflow(config=config)
+        workflow._plugins = [
+            make_plugin("a", calls, depends_on=["x"]),
+            make_plugin("b", calls, depends_on=["a", "y"]),
+        ]
+
+        workflow.run_plugins()
+
+        steps = [
+            r.step
+            for r in workflow._result_collector.results
+            if r.step.startswith("plugin:skipped:")
+        ]
+        assert calls == []
+        assert sorted(steps) == ["plugin:skipped:a", "plugin:skipped:b"]
+
+    def test_independent_plugins_overlap_in_parallel(self, config):
+        calls = []
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def tracking(name):
+            plugin = make_plugin(name, calls)
+
+            def run():
+                with lock:
+                    active.append(name)
+                    peak.append(len(active))
+                time.sleep(0.05)
+                with lock:
+                    active.remove(name)
+
+            plugin.run.side_effect = run
+            return plugin
+
+        workflow = Workflow(config=config)
+        workflow._plugins = [tracking("a"), tracking("b"), tracking("c")]
+
+        workflow.run_plugins(parallel=True, max_workers=3)
+
+        assert max(peak) > 1
@@ -0,0 +1,192 @@
+import asyncio
+import threading
+import time
+from typing import ClassVar
+from unittest.mock import Mock
+
+import pytest
+
+from opsflow.core.config import PluginConfig, PluginSetupConfig
+from opsflow.core.models import Severity
+from opsflow.core.plugin import Plugin, PluginRegistry
+from opsflow.core.workflow import Workflow
+
+from ..dummies.plugins import AsyncPluginC, PluginAConfig
+
+
+def make_plugin(name, events, depends_on=(), setup_delay=0.0, fail_setup=False):
+    plugin = Mock()
+    plugin.name = name
+    plugin.depends_on = tuple(depends_on)
+
+    def setup():
+        time.sleep(setup_delay)
+        events.append(("setup", name))
+        if fail_setup:
+            raise RuntimeError(f"{name} setup failed")
+
+    def run():
+        events.append(("run", name))
+        if name.startswith("failing"):
+            raise RuntimeError(f"{name} failed")
+
+    plugin.setup.side_effect = setup
+    plugin.run.side_effect = run
+    plugin.teardown.side_effect = lambda: events.append(("teardown", name))
+    return plugin
+
+
+@pytest.fixture
+def concurrent_config(config):
+    config.plugin_setup = PluginSetupConfig(concurrent=True, max_workers=4)
+    return config
+
+
+class TestConcurrentPluginSetup:
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_all_setups_finish_before_any_run(self, concurrent_config, parallel):
+        events = []
+        workflow = Workflow(config=concurrent_config)
+        workflow._plugins = [
+            make_plugin("backup", events, setup_delay=0.05),
+            make_plugin("prune", events, depends_on=["backup"]),
+            make_plugin("report", events),
+        ]
+
+        workflow.run_plugins(parallel=parallel)
+
+        kinds = [kind for kind, _ in events]
+        assert kinds[:3] == ["setup"] * 3
+        assert sorted(kinds[3:]) == ["run"] * 3 + ["teardown"] * 3
+        for plugin in workflow._plugins:
+            plugin.setup.assert_called_once()
+        assert workflow.trace.find("plugin_setup") is not None
+
+    def test_setups_overlap(self, concurrent_config):
+        events = []
+        workflow = Workflow(config=concurrent_config)
+        workflow._plugins = [make_plugin(f"p{i}", events, setup_delay=0.2) for i in range(4)]
+
+        start = time.monotonic()
+        workflow.run_plugins()
+
+        assert time.monotonic() - start < 0.6
+
+    def test_setup_concurrency_is_bounded(self, concurrent_config):
+        concurrent_config.plugin_setup.max_workers = 2
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def setup():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+        workflow = Workflow(config=concurrent_config)
+        workflow._plugins = [make_plugin(f"p{i}", []) for i in range(5)]
+        for plugin in workflow._plugins:
+            plugin.setup.side_effect = setup
+
+        workflow.run_plugins()
+
+        assert peak[0] == 2
+
+    def test_failed_setup_is_isolated(self, concurrent_config):
+        events = []
+        workflow = Workflow(config=concurrent_config)
+        workflow._plugins = [
+            make_plugin("backup", events, fail_setup=True),
+            make_plugin("prune", events, depends_on=["backup"]),
+            make_plugin("report", events),
+        ]
+
+        workflow.run_plugins()
+
+        assert ("run", "backup") not in events
+        assert ("run", "report") in events
+        results = {r.step: r for r in workflow._result_collector.results}
+        assert results["plugin:setup:backup"].severity == Severity.ERROR
+        assert results["plugin:skipped:prune"].severity == Severity.WARNING
+        assert workflow.trace.find("plugin:backup").error == "setup failed"
+
+    def test_skipped_plugins_are_torn_down(self, concurrent_config):
+        events = []
+        workflow = Workflow(config=concurrent_config)
+        workflow._plugins = [
+            make_plugin("failing", events),
+            make_plugin("prune", events, depends_on=["failing"]),
+        ]
+
+        workflow.run_plugins()
+
+        assert ("run", "prune") not in events
+        assert ("teardown", "prune") in events
+        assert workflow._prepared == {}
+
+    def test_sequential_setup_by_default(self, config):
+        events = []
+        workflow = Workflow(config=config)
+        workflow._plugins = [make_plugin("a", events), make_plugin("b", events)]
+
+        workflow.run_plugins()
+
+        assert [kind for kind, _ in events] == ["setup", "run", "teardown"] * 2
+        assert workflow.trace.find("plugin_setup") is None
+
+    def test_async_run_sets_up_async_plugins_on_the_loop(self, concurrent_config):
+        PluginRegistry.register_class(AsyncPluginC, config=PluginAConfig)
+        concurrent_config.plugins = {AsyncPluginC.name: PluginAConfig(enabled=True)}
+        events = []
+        workflow = Workflow(config=concurrent_config)
+        sync_plugin = make_plugin("sync", events)
+        workflow._plugins.append(sync_plugin)
+
+        async def main():
+            await workflow.run_plugins_async()
+            return asyncio.get_running_loop()
+
+        loop = asyncio.run(main())
+
+        async_plugin = workflow._plugins[0]
+        assert async_plugin.loop is loop
+        assert async_plugin.torn_down
+        assert events == [("setup", "sync"), ("run", "sync"), ("teardown", "sync")]
+        assert workflow.trace.find("plugin:plugin_async:setup").parent_id == (
+            workflow.trace.find("plugin_setup").span_id
+        )
+
+
+class SlowInitPlugin(Plugin[PluginConfig]):
+    name = "slow_init"
+    threads: ClassVar[list[str]] = []
+
+    def __init__(self, config, logger, ctx):
+        super().__init__(config, logger, ctx)
+        time.sleep(0.1)
+        self.threads.append(threading.current_thread().name)
+
+    def run(self):
+        pass
+
+
+class OtherSlowInitPlugin(SlowInitPlugin):
+    name = "other_slow_init"
+
+
+def test_plugins_are_constructed_concurrently(concurrent_config):
+    for cls in (SlowInitPlugin, OtherSlowInitPlugin):
+        PluginRegistry.register_class(cls, config=PluginConfig)
+    concurrent_config.plugins = {
+        SlowInitPlugin.name: PluginConfig(),
+        OtherSlowInitPlugin.name: PluginConfig(),
+    }
+    SlowInitPlugin.threads.clear()
+
+    workflow = Workflow(config=concurrent_config)
+
+    assert [p.name for p in workflow._plugins] == ["slow_init", "other_slow_init"]
+    assert len(SlowInitPlugin.threads) == 2
+    assert all(t.startswith("factory") for t in SlowInitPlugin.threads)
+    assert workflow.trace.find("build:plugins").duration < 0.2
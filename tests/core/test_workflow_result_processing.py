@@ -1,7 +1,11 @@
 from unittest.mock import Mock, patch
 
+from opsflow.core.models import Severity
 from opsflow.core.workflow import Workflow
 
+from ..dummies.notifier.dummy_notifier import DummyNotifierConfig
+from ..dummies.notifier.raising_notifier import RaisingNotifier
+
 
 class TestWorkflowResultProcessing:
     """Test result collection and reporting."""
@@ -35,6 +39,26 @@ class TestWorkflowResultProcessing:
             # Report should be generated (actual content depends on implementation)
             assert isinstance(report, str)
 
+    def test_workflow_flushes_queued_logs_before_report(self, tmp_path, config_with_plugins):
+        """Queued log records should be part of the report."""
+        config_with_plugins.logging.file = str(tmp_path / "queued_report.log")
+        config_with_plugins.logging.queue = True
+        workflow = Workflow(config=config_with_plugins)
+
+        try:
+            workflow.run_plugins()
+            workflow._logger.info("Last message before the report")
+
+            with patch.object(workflow._notifier, "notify") as mock_notify:
+                workflow.process_results()
+
+            _, report = mock_notify.call_args[0]
+            assert "Last message before the report" in report
+        finally:
+            for handler in list(workflow._logger.handlers):
+                workflow._logger.removeHandler(handler)
+                handler.close()
+
     def test_workflow_handles_notification_errors(self, config_with_plugins):
         """Workflow should handle errors when sending notifications."""
         workflow = Workflow(config=config_with_plugins)
@@ -46,3 +70,16 @@ class TestWorkflowResultProcessing:
         workflow.process_results()
 
         # No exception should propagate
+
+    def test_workflow_records_failed_notifiers_as_results(self, config_with_plugins, logger):
+        """Notifiers that fail are reported as ERROR results of the run."""
+        workflow = Workflow(config=config_with_plugins)
+        workflow._notifier.add_notifier(RaisingNotifier(DummyNotifierConfig(), logger))
+
+        workflow.process_results()
+
+        failed = [
+            r for r in workflow._result_collector.all_results() if r.step.startswith("notifier:")
+        ]
+        assert len(failed) == 1
+        assert failed[0].severity is Severity.ERROR
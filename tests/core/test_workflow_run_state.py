@@ -0,0 +1,113 @@
+from opsflow.core.config import StateConfig
+from opsflow.core.models import Severity
+from opsflow.core.plugin import PluginRegistry
+from opsflow.core.state import RunStateStore, StepStatus
+from opsflow.core.workflow import Workflow
+
+from ..dummies.plugins import IncrementalPlugin, PluginAConfig
+
+
+def executed(workflow):
+    return {r.message for r in workflow._result_collector.results if r.step == "Test"}
+
+
+def skipped(workflow):
+    return {
+        r.step
+        for r in workflow._result_collector.results
+        if r.severity == Severity.INFO and r.message.startswith("Skipped:")
+    }
+
+
+class TestRunStateStore:
+    """Test the SQLite run-state store."""
+
+    def test_records_runs_and_steps(self, tmp_path):
+        store = RunStateStore(str(tmp_path / "state" / "state.db"))
+        run_id = store.begin_run()
+        store.start_step(run_id, "plugin:a", "fp")
+        store.finish_step(run_id, "plugin:a", StepStatus.SUCCESS, 1.0, 0.5, "fp")
+
+        assert store.interrupted_run(before=run_id + 1) == run_id
+        store.finish_run(run_id, StepStatus.SUCCESS)
+        assert store.interrupted_run(before=run_id + 1) is None
+
+        [record] = store.steps(run_id)
+        assert record.status == StepStatus.SUCCESS
+        assert record.duration == 0.5
+        assert store.last_success("plugin:a").fingerprint == "fp"
+        store.close()
+
+
+class TestWorkflowRunState:
+    """Test resumable and incremental workflow runs."""
+
+    def _enable_state(self, config, tmp_path, **kwargs):
+        config.state = StateConfig(enabled=True, path=str(tmp_path / "state.db"), **kwargs)
+        return config
+
+    def test_interrupted_run_is_resumed(self, config_with_plugins, tmp_path):
+        config = self._enable_state(config_with_plugins, tmp_path)
+
+        crashed = Workflow(config=config)
+        crashed._tracker.begin()
+        crashed._plugins = [p for p in crashed._plugins if p.name == "plugin_a"]
+        crashed.run_plugins()
+        # no end(): the run is left unfinished like after a crash
+
+        resumed = Workflow(config=config)
+        resumed.run_all()
+
+        assert executed(resumed) == {"Executed Plugin B"}
+        assert skipped(resumed) == {"plugin:plugin_a"}
+
+        rerun = Workflow(config=config)
+        rerun.run_all()
+
+        assert executed(rerun) == {"Executed Plugin A", "Executed Plugin B"}
+
+    def test_resume_reruns_steps_with_changed_config(self, config_with_plugins, tmp_path):
+        config = self._enable_state(config_with_plugins, tmp_path)
+
+        crashed = Workflow(config=config)
+        crashed._tracker.begin()
+        crashed.run_plugins()
+
+        config.plugins["plugin_a"] = PluginAConfig(value=99, enabled=True)
+        resumed = Workflow(config=config)
+        resumed.run_all()
+
+        assert executed(resumed) == {"Executed Plugin A"}
+
+    def test_unchanged_incremental_plugins_are_skipped(self, config, tmp_path):
+        config = self._enable_state(config, tmp_path, skip_unchanged=True)
+        PluginRegistry.register_class(IncrementalPlugin, config=PluginAConfig)
+        config.plugins = {IncrementalPlugin.name: PluginAConfig(enabled=True)}
+
+        first = Workflow(config=config)
+        first.run_all()
+        second = Workflow(config=config)
+        second.run_all()
+
+        assert executed(first) == {"Executed incremental plugin"}
+        assert skipped(second) == {"plugin:plugin_incremental"}
+
+        IncrementalPlugin.inputs = "v2"
+        try:
+            third = Workflow(config=config)
+            third.run_all()
+        finally:
+            IncrementalPlugin.inputs = "v1"
+
+        assert executed(third) == {"Executed incremental plugin"}
+
+    def test_invalid_state_path_is_reported(self, config, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        config.state = StateConfig(enabled=True, path=str(blocker / "state.db"))
+
+        workflow = Workflow(config=config)
+        workflow.run_all()
+
+        assert workflow._tracker is None
+        assert any(r.step == "state_store" for r in workflow._result_collector.results)
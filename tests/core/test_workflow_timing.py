@@ -0,0 +1,150 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from opsflow.core.models import Result, Severity, Trace
+from opsflow.core.plugin.registry import PluginRegistry
+from opsflow.core.system import PackageManager, SystemManager
+from opsflow.core.utils.report_formatter import ReportFormatter
+from opsflow.core.workflow import Workflow
+
+from ..dummies.plugins import AsyncPluginC, FailingPlugin, PluginAConfig
+
+
+class StaticPackageManager(PackageManager):
+    def update(self, dry_run: bool = False) -> Result | None:
+        return None
+
+    def upgrade(self, dry_run: bool = False) -> Result | None:
+        return None
+
+
+class StaticManager(SystemManager):
+    def _is_reboot_required(self) -> bool:
+        return False
+
+    def _is_new_stable_os_available(self) -> bool:
+        return False
+
+
+def names(trace: Trace, parent_name: str) -> list[str]:
+    return [s.name for s in trace.children(trace.find(parent_name))]
+
+
+class TestTrace:
+    def test_spans_are_nested_and_timed(self):
+        trace = Trace()
+
+        with trace.span("outer", "phase"), trace.span("inner", "step", item=1):
+            pass
+
+        outer, inner = trace.find("outer"), trace.find("inner")
+        assert inner.parent_id == outer.span_id
+        assert inner.attributes == {"item": 1}
+        assert outer.start <= inner.start <= inner.end <= outer.end
+        assert outer.duration >= inner.duration >= 0
+        assert [s.name for s in trace.spans(category="step")] == ["inner"]
+
+    def test_exception_is_recorded_and_reraised(self):
+        trace = Trace()
+
+        with pytest.raises(RuntimeError), trace.span("failing", "phase"):
+            raise RuntimeError("boom")
+
+        assert trace.find("failing").error == "boom"
+
+
+class TestWorkflowTiming:
+    def test_run_all_records_phases(self, config_with_plugins):
+        pre_hook = Mock(__name__="pre_hook")
+        manager = StaticManager(pkg_manager=StaticPackageManager(), pre_update=[pre_hook])
+        workflow = Workflow(system_manager=manager, config=config_with_plugins)
+
+        workflow.run_all()
+        trace = workflow.trace
+
+        assert trace.find("config_load") is not None
+        assert names(trace, "workflow") == ["system_update", "plugins", "process_results"]
+        assert names(trace, "system_update") == [
+            "hook:pre_update:pre_hook",
+            "pkg:update",
+            "pkg:upgrade",
+            "check:reboot_required",
+            "check:new_stable_release",
+        ]
+        assert names(trace, "plugins") == ["plugin:plugin_a", "plugin:plugin_b"]
+        assert names(trace, "plugin:plugin_a") == [
+            "plugin:plugin_a:setup",
+            "plugin:plugin_a:run",
+            "plugin:plugin_a:teardown",
+        ]
+        assert names(trace, "process_results") == ["notify"]
+
+    def test_parallel_plugins_are_nested_in_phase(self, config_with_plugins):
+        workflow = Workflow(config=config_with_plugins)
+
+        workflow.run_plugins(parallel=True)
+
+        assert sorted(names(workflow.trace, "plugins")) == ["plugin:plugin_a", "plugin:plugin_b"]
+
+    def test_async_plugins_are_nested_in_phase(self, config_with_plugins):
+        PluginRegistry.register_class(AsyncPluginC, config=PluginAConfig)
+        config_with_plugins.plugins[AsyncPluginC.name] = PluginAConfig(value=1)
+        workflow = Workflow(config=config_with_plugins)
+
+        asyncio.run(workflow.run_plugins_async())
+
+        assert sorted(names(workflow.trace, "plugins")) == [
+            "plugin:plugin_a",
+            "plugin:plugin_async",
+            "plugin:plugin_b",
+        ]
+        assert names(workflow.trace, "plugin:plugin_async")[1] == "plugin:plugin_async:run"
+
+    def test_failed_plugin_step_is_marked(self, config):
+        PluginRegistry.register_class(FailingPlugin, config=PluginAConfig)
+        config.plugins = {FailingPlugin.name: PluginAConfig(value=1)}
+        workflow = Workflow(config=config)
+
+        workflow.run_plugins()
+
+        assert workflow.trace.find("plugin:failing_plugin").error == "run failed"
+        assert workflow.trace.find("plugin:failing_plugin:run").error == "Intentional failure"
+
+
+class TestReportTimings:
+    def test_report_contains_timing_table(self):
+        trace = Trace()
+        with trace.span("system_update", "phase"), trace.span("pkg:update", "package"):
+            pass
+        with pytest.raises(RuntimeError), trace.span("plugin:x", "plugin"):
+            raise RuntimeError("boom")
+
+        report = ReportFormatter(
+            [Result(step="s", severity=Severity.INFO, message="m")], trace=trace
+        ).format_report()
+
+        timings = report.split("Timings:\n--------\n")[1].split("\n\nLogs:")[0].splitlines()
+        assert timings[0].split() == [
+            "system_update",
+            f"{trace.find('system_update').duration:.3f}s",
+        ]
+        assert timings[1].startswith("    pkg:update")
+        assert timings[2].split()[0] == "plugin:x"
+        assert timings[2].endswith("(failed)")
+
+    def test_open_parent_spans_are_omitted(self):
+        trace = Trace()
+        with trace.span("workflow", "workflow"):
+            with trace.span("plugins", "phase"):
+                pass
+            table = ReportFormatter([], trace=trace).timings()
+
+        assert table.splitlines()[0].split()[0] == "plugins"
+        assert "workflow" not in table
+
+    def test_report_without_trace_has_no_timings(self):
+        report = ReportFormatter([]).format_report()
+
+        assert "Timings:" not in report
@@ -0,0 +1,16 @@
+import threading
+
+from opsflow.core.config import NotifierConfig
+from opsflow.core.notifier import Notifier
+
+
+class SlowNotifier(Notifier):
+    name = "slow"
+
+    def __init__(self, config: NotifierConfig, logger, delay: float = 5.0):
+        super().__init__(config, logger)
+        self.delay = delay
+        self.released = threading.Event()
+
+    def notify(self, subject, message):
+        self.released.wait(self.delay)
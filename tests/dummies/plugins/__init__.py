@@ -1,5 +1,15 @@
 from .plugin_a import PluginA, PluginAConfig
+from .plugin_async import AsyncPluginC
 from .plugin_b import PluginB, PluginBConfig
 from .plugin_failing import FailingPlugin
+from .plugin_incremental import IncrementalPlugin
 
-__all__ = ["FailingPlugin", "PluginA", "PluginAConfig", "PluginB", "PluginBConfig"]
+__all__ = [
+    "AsyncPluginC",
+    "FailingPlugin",
+    "IncrementalPlugin",
+    "PluginA",
+    "PluginAConfig",
+    "PluginB",
+    "PluginBConfig",
+]
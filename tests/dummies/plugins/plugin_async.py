@@ -0,0 +1,27 @@
+import asyncio
+
+from opsflow.core.models import Result, Severity
+from opsflow.core.plugin import AsyncPlugin
+
+from .plugin_a import PluginAConfig
+
+
+class AsyncPluginC(AsyncPlugin[PluginAConfig]):
+    name = "plugin_async"
+
+    def __init__(self, config, logger, ctx):
+        super().__init__(config, logger, ctx)
+        self.loop = None
+        self.torn_down = False
+
+    async def setup(self):
+        self.loop = asyncio.get_running_loop()
+
+    async def run(self):
+        await asyncio.sleep(0)
+        self.ctx.add_result(
+            Result(step="Test", message="Executed async plugin", severity=Severity.INFO)
+        )
+
+    async def teardown(self):
+        self.torn_down = True
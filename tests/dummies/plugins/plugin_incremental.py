@@ -0,0 +1,17 @@
+from opsflow.core.models import Result, Severity
+from opsflow.core.plugin import Plugin
+
+from .plugin_a import PluginAConfig
+
+
+class IncrementalPlugin(Plugin[PluginAConfig]):
+    name = "plugin_incremental"
+    inputs = "v1"
+
+    def run(self):
+        self.ctx.add_result(
+            Result(step="Test", message="Executed incremental plugin", severity=Severity.INFO)
+        )
+
+    def fingerprint(self):
+        return self.inputs
@@ -1,6 +1,12 @@
-import pytest
+import asyncio
+import gzip
+import time
 from email.message import EmailMessage
+from smtplib import SMTPServerDisconnected
+
+import pytest
 
+from opsflow.core.utils.report_formatter import ReportFormatter
 from opsflow.notifiers.email import (
     EmailNotifier,
     EmailNotifierConfig,
@@ -18,6 +24,8 @@ class DummySMTP:
         self.logged_in = None
         self.sent: list[EmailMessage] = []
         self.closed = False
+        self.noop_code = 250
+        self.disconnected = False
 
     def __enter__(self):
         return self
@@ -32,11 +40,21 @@ class DummySMTP:
         self.logged_in = (user, password)
 
     def send_message(self, msg: EmailMessage):
+        if self.disconnected:
+            raise SMTPServerDisconnected("Connection unexpectedly closed")
         self.sent.append(msg)
 
+    def noop(self):
+        if self.disconnected:
+            raise SMTPServerDisconnected("Connection unexpectedly closed")
+        return self.noop_code, b"OK"
+
     def quit(self):
         self.closed = True
 
+    def close(self):
+        self.closed = True
+
 
 @pytest.fixture
 def smtp(monkeypatch):
@@ -52,6 +70,19 @@ def smtp(monkeypatch):
     return smtp
 
 
+@pytest.fixture
+def connections(monkeypatch):
+    """Every connect opens a new DummySMTP session."""
+    sessions: list[DummySMTP] = []
+
+    def connect(server, port):
+        sessions.append(DummySMTP(server, port))
+        return sessions[-1]
+
+    monkeypatch.setattr(f"{EMAIL_MODULE}.SMTP", connect)
+    return sessions
+
+
 @pytest.fixture
 def base_cfg():
     cfg = EmailNotifierConfig(
@@ -105,3 +136,192 @@ def test_ssl(notifier, smtp):
     notifier.notify("ssl", "msg")
 
     assert len(smtp.sent) == 1
+
+
+def test_session_is_closed_without_keep_alive(notifier, connections):
+    notifier.notify("a", "msg")
+    notifier.notify("b", "msg")
+
+    assert len(connections) == 2
+    assert all(c.closed for c in connections)
+
+
+def test_keep_alive_reuses_session(notifier, connections):
+    notifier.config.keep_alive = True
+    notifier.config.security = SmtpSecurity.STARTTLS
+    notifier.config.user = "user"
+    notifier.config.password = "pw"
+
+    notifier.notify("a", "msg")
+    notifier.notify("b", "msg")
+
+    (session,) = connections
+    assert [m["Subject"] for m in session.sent] == ["a", "b"]
+    assert session.closed is False
+
+    notifier.close()
+
+    assert session.closed is True
+
+
+def test_keep_alive_replaces_session_failing_noop(notifier, connections):
+    notifier.config.keep_alive = True
+    notifier.notify("a", "msg")
+    connections[0].noop_code = 421
+
+    notifier.notify("b", "msg")
+
+    assert len(connections) == 2
+    assert connections[0].closed is True
+    assert [m["Subject"] for m in connections[1].sent] == ["b"]
+
+
+def test_reconnects_once_if_session_was_dropped(notifier, connections, monkeypatch):
+    notifier.config.keep_alive = True
+    notifier.notify("a", "msg")
+    # the server drops the session after the health check succeeded
+    monkeypatch.setattr(connections[0], "noop", lambda: (250, b"OK"))
+    connections[0].disconnected = True
+
+    notifier.notify("b", "msg")
+
+    assert len(connections) == 2
+    assert [m["Subject"] for m in connections[1].sent] == ["b"]
+
+
+def test_new_session_that_is_dropped_is_not_retried(notifier, connections, monkeypatch):
+    def connect(server, port):
+        connections.append(DummySMTP(server, port))
+        connections[-1].disconnected = True
+        return connections[-1]
+
+    monkeypatch.setattr(f"{EMAIL_MODULE}.SMTP", connect)
+
+    with pytest.raises(SMTPServerDisconnected):
+        notifier.notify("a", "msg")
+
+    assert len(connections) == 1
+
+
+def test_idle_session_is_not_reused_after_idle_timeout(notifier, connections):
+    notifier.config.keep_alive = True
+    notifier.config.idle_timeout = 0.01
+    notifier.notify("a", "msg")
+
+    time.sleep(0.05)
+    notifier.notify("b", "msg")
+
+    assert len(connections) == 2
+    assert connections[0].closed is True
+
+
+class DummyAioSmtp:
+    """Stand-in for the aiosmtplib module."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.sent: list[tuple[EmailMessage, dict]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send(self, msg, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            self.sent.append((msg, kwargs))
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def aiosmtp(monkeypatch):
+    aiosmtp = DummyAioSmtp(delay=0.01)
+    monkeypatch.setattr(f"{EMAIL_MODULE}.aiosmtplib", aiosmtp)
+    return aiosmtp
+
+
+def test_notify_async_uses_asyncio_client(notifier, aiosmtp):
+    notifier.config.security = SmtpSecurity.STARTTLS
+    notifier.config.user = "user"
+    notifier.config.password = "pw"
+
+    asyncio.run(notifier.notify_async("Hello", "Body"))
+
+    ((msg, kwargs),) = aiosmtp.sent
+    assert msg["Subject"] == "Hello"
+    assert kwargs["start_tls"] is True
+    assert kwargs["use_tls"] is False
+    assert (kwargs["username"], kwargs["password"]) == ("user", "pw")
+
+
+def test_send_async_bounds_in_flight_messages(notifier, aiosmtp):
+    notifier.config.max_in_flight = 2
+    groups = [["a@test"], ["b@test"], ["c@test"], ["d@test"], ["e@test"]]
+
+    asyncio.run(notifier.send_async(notifier.build_message("s", "m", g) for g in groups))
+
+    assert sorted(msg["To"] for msg, _ in aiosmtp.sent) == [g[0] for g in groups]
+    assert aiosmtp.max_in_flight == 2
+
+
+def test_send_async_times_out_per_message(notifier, monkeypatch):
+    monkeypatch.setattr(f"{EMAIL_MODULE}.aiosmtplib", DummyAioSmtp(delay=5))
+    notifier.config.send_timeout = 0.05
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(notifier.notify_async("s", "m"))
+
+
+def test_notify_async_without_aiosmtplib_uses_blocking_client(notifier, smtp, monkeypatch):
+    monkeypatch.setattr(f"{EMAIL_MODULE}.aiosmtplib", None)
+
+    asyncio.run(notifier.notify_async("s", "m"))
+
+    assert len(smtp.sent) == 1
+
+
+def test_large_report_logs_are_attached_compressed(notifier, smtp):
+    notifier.config.attachment_threshold = 1000
+    logs = "\n".join(f"DEBUG line {i} ü" for i in range(5000))
+    report = "Maintenance Summary" + ReportFormatter.LOGS_SECTION + logs
+
+    notifier.notify("Report", report)
+
+    (msg,) = smtp.sent
+    body = msg.get_body(("plain",)).get_content()
+    assert body.startswith("Maintenance Summary")
+    assert "attached as opsflow-report.log.gz" in body
+    assert "DEBUG line" not in body
+    (attachment,) = msg.iter_attachments()
+    assert attachment.get_filename() == "opsflow-report.log.gz"
+    assert gzip.decompress(attachment.get_content()).decode() == logs
+
+
+def test_small_report_stays_inline(notifier, smtp):
+    notifier.config.attachment_threshold = 1000
+
+    notifier.notify("Report", "Summary" + ReportFormatter.LOGS_SECTION + "short")
+
+    (msg,) = smtp.sent
+    assert not msg.is_multipart()
+    assert msg.get_content().rstrip() == "Summary" + ReportFormatter.LOGS_SECTION + "short"
+
+
+def test_large_report_without_logs_section_is_attached_whole(notifier, smtp):
+    notifier.config.attachment_threshold = 10
+    report = "ü" * 100
+
+    notifier.notify("Report", report)
+
+    (msg,) = smtp.sent
+    (attachment,) = msg.iter_attachments()
+    assert gzip.decompress(attachment.get_content()).decode() == report
+
+
+def test_compress_streams_the_end_of_the_text():
+    text = "summary|" + "äöü" * 10
+
+    data = EmailNotifier._compress(text, start=8, chunk_size=4)
+
+    assert gzip.decompress(data).decode() == "äöü" * 10
@@ -1,3 +1,5 @@
+import asyncio
+import sys
 from unittest.mock import MagicMock, patch
 
 from opsflow.core.models import Severity
@@ -38,7 +40,7 @@ def test_no_tasks(context, logger):
         logger=logger,
         ctx=context,
     )
-    plugin.run()
+    asyncio.run(plugin.run())
     # Expect no results since there were no tasks
     assert len(context.all_results()) == 0
 
@@ -53,7 +55,7 @@ def test_task_failure(context, logger):
     )
 
     with patch.object(RClonePlugin, "_sync", side_effect=Exception("Test failure")):
-        plugin.run()
+        asyncio.run(plugin.run())
 
     results = context.all_results()
 
@@ -74,7 +76,7 @@ def test_dry_run_flag(context, logger):
 
     with patch.object(RClonePlugin, "_sync") as mock_sync:
         mock_sync.return_value = fake_command_result()
-        plugin.run()
+        asyncio.run(plugin.run())
         # Optionally: check call arguments if _sync forwards dry-run flag
         # e.g., called_with = mock_sync.call_args[0][0]  # first argument is RClone instance
 
@@ -97,7 +99,7 @@ def test_all_actions(context, logger):
         patch.object(RClonePlugin, "_copy", return_value=fake_command_result()),
         patch.object(RClonePlugin, "_move", return_value=fake_command_result()),
     ):
-        plugin.run()
+        asyncio.run(plugin.run())
 
     results = context.all_results()
 
@@ -106,3 +108,82 @@ def test_all_actions(context, logger):
     assert any("sync" in n.lower() for n in names)
     assert any("copy" in n.lower() for n in names)
     assert any("move" in n.lower() for n in names)
+
+
+def test_transfer_metrics(context, logger):
+    """Test that the plugin records transferred bytes and files per task."""
+    tasks = [
+        RCloneTask(name="sync", src="s1", dest="d1", action=RCloneAction.SYNC),
+        RCloneTask(name="copy", src="s2", dest="d2", action=RCloneAction.COPY),
+    ]
+    plugin = RClonePlugin(
+        config=RClonePluginConfig(tasks=tasks, config_file=None, max_workers=2),
+        logger=logger,
+        ctx=context,
+    )
+
+    with (
+        patch.object(RClonePlugin, "_sync", return_value=fake_command_result()),
+        patch.object(RClonePlugin, "_copy", return_value=fake_command_result()),
+    ):
+        asyncio.run(plugin.run())
+
+    samples = {(s.name, s.labels): s.value for s in context.metrics.samples()}
+    assert samples[("opsflow_rclone_transferred_bytes", (("task", "sync"),))] == 100
+    assert samples[("opsflow_rclone_transferred_files", (("task", "copy"),))] == 1
+
+
+def test_result_details_and_lazy_message(context, logger):
+    """Test that task output is kept as details and only formatted on access."""
+    tasks = [RCloneTask(name="sync", src="s1", dest="d1", action=RCloneAction.SYNC)]
+    plugin = RClonePlugin(
+        config=RClonePluginConfig(tasks=tasks, config_file=None, max_workers=1),
+        logger=logger,
+        ctx=context,
+    )
+
+    with patch.object(RClonePlugin, "_sync", return_value=fake_command_result(success=False)):
+        asyncio.run(plugin.run())
+
+    (result,) = context.all_results()
+    assert result.details["stderr"] == "fail"
+    assert result.details["errors"] == ["Error"]
+    assert callable(result._message)
+    assert "Stderr: fail" in result.message
+    assert result._message == result.message
+
+
+def test_missing_adapter_is_recorded_as_error(context, logger, monkeypatch):
+    """A task whose adapter cannot be imported must fail with an ERROR result."""
+    task = RCloneTask(name="sync_task", src="s", dest="d", action=RCloneAction.SYNC)
+    plugin = RClonePlugin(
+        config=RClonePluginConfig(tasks=[task], config_file=None, max_workers=1),
+        logger=logger,
+        ctx=context,
+    )
+    monkeypatch.setitem(sys.modules, "rclone", None)
+
+    asyncio.run(plugin.run())
+
+    (result,) = context.all_results()
+    assert result.severity == Severity.ERROR
+    assert result.step == "RClone Sync - sync_task"
+
+
+def test_unhandled_task_error_is_recorded(context, logger, caplog):
+    """An exception escaping a task must still produce an ERROR result."""
+    task = RCloneTask(name="sync_task", src="s", dest="d", action=RCloneAction.SYNC)
+    plugin = RClonePlugin(
+        config=RClonePluginConfig(tasks=[task], config_file=None, max_workers=1),
+        logger=logger,
+        ctx=context,
+    )
+
+    with patch.object(RClonePlugin, "_run_task", side_effect=RuntimeError("escaped")):
+        asyncio.run(plugin.run())
+
+    (result,) = context.all_results()
+    assert result.severity == Severity.ERROR
+    assert "escaped" in result.message
+    (record,) = [r for r in caplog.records if r.exc_info]
+    assert "Unhandled exception in task 'sync_task'" in record.getMessage()